@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Benchmark every API endpoint in-process at several data sizes.
+
+Each scale gets a fresh in-memory DataStore filled by synthetic.generate();
+requests go through the full ASGI app (middleware, validation, encoding)
+via httpx's ASGI transport, so no server or network is involved. For each
+endpoint the report has p50/p95/p99/mean latency, throughput, response size
+and the peak memory allocated while serving one request.
+
+    cd backend
+    python bench_api.py --scales 1000,10000,100000 --out bench_api.json
+    python bench_api.py --compare bench_api.json   # exit 1 on a p95 regression
+"""
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from itertools import cycle
+
+import httpx
+
+import server
+import synthetic
+from repository import MemoryRepository
+
+TERM = "syn-spring-2026"
+# Exports and other full-table reads are run fewer times
+HEAVY_ITERATION_SHARE = 0.2
+
+
+def endpoints(store: server.DataStore) -> list:
+    """(name, method, path or path factory, params, body factory, heavy) in run order.
+
+    Reads run first and the exports last, since actions and exports write.
+    """
+    student_id = next(iter(store.students_by_program[f"{TERM}-p00"]))
+    program_id = f"{TERM}-p00"
+    # Small scales run out of pending requests; acting on a decided one again
+    # takes the same path, so just cycle
+    pending = cycle(list(store.requests_by_status[server.VerificationStatus.awaiting_confirmation]))
+
+    def next_pending():
+        return next(pending)
+
+    return [
+        ("terms", "GET", "/api/terms", {}, None, False),
+        ("programs", "GET", "/api/programs", {"term_id": TERM}, None, False),
+        ("program detail", "GET", f"/api/programs/{program_id}", {}, None, False),
+        ("students", "GET", "/api/students", {"term_id": TERM}, None, True),
+        ("students page", "GET", "/api/students",
+         {"term_id": TERM, "sort": "risk_score", "order": "desc", "limit": 50}, None, False),
+        ("students at risk", "GET", "/api/students/at-risk", {"term_id": TERM, "limit": 50}, None, False),
+        ("student detail", "GET", f"/api/students/{student_id}", {"term_id": TERM}, None, False),
+        ("service logs", "GET", "/api/service-logs", {"term_id": TERM}, None, True),
+        ("service logs page", "GET", "/api/service-logs",
+         {"term_id": TERM, "sort": "date", "order": "desc", "limit": 100}, None, False),
+        ("verification requests", "GET", "/api/verification-requests", {"term_id": TERM}, None, True),
+        ("kpis", "GET", "/api/kpis", {"term_id": TERM}, None, False),
+        ("search", "GET", "/api/search", {"q": "comm", "term_id": TERM}, None, False),
+        ("timeseries by program", "GET", "/api/timeseries",
+         {"term_id": TERM, "granularity": "day", "group_by": "program"}, None, False),
+        ("audit events", "GET", "/api/audit-events", {"term_id": TERM, "limit": 100}, None, False),
+        ("confirm", "POST", "/api/verification-requests/confirm", {},
+         lambda: {"request_id": next_pending()}, False),
+        ("reject", "POST", "/api/verification-requests/reject", {},
+         lambda: {"request_id": next_pending(), "reason": "insufficient_evidence"}, False),
+        ("flag", "POST", "/api/verification-requests/flag", {},
+         lambda: {"request_id": next_pending(), "reason": "Needs review"}, False),
+        ("bulk confirm x20", "POST", "/api/verification-requests/bulk", {},
+         lambda: {"items": [{"request_id": next_pending(), "action": "confirm"} for _ in range(20)]}, False),
+        ("export verified logs", "GET", "/api/export/verified-logs", {"term_id": TERM}, None, True),
+        ("export audit trail", "GET", "/api/export/audit-trail", {"term_id": TERM}, None, True),
+    ]
+
+
+async def run_endpoint(client: httpx.AsyncClient, method: str, path: str, params: dict, body, iterations: int):
+    async def once():
+        response = await client.request(method, path, params=params, json=body() if body else None)
+        if response.status_code != 200:
+            raise RuntimeError(f"{method} {path} -> {response.status_code}: {response.text[:200]}")
+        return len(response.content)
+
+    size = await once()  # warm-up, also primes the caches a steady state would have
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await once()
+        latencies.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    await once()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "iterations": iterations,
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "requests_per_s": round(iterations / elapsed, 1),
+        "response_bytes": size,
+        "peak_alloc_kb": round(peak / 1024, 1),
+    }
+
+
+async def run_scale(logs: int, iterations: int, seed: int) -> dict:
+    store = server.DataStore(MemoryRepository())
+    students = max(100, logs // 10)
+    started = time.perf_counter()
+    synthetic.generate(store, seed=seed, students=students, logs=logs)
+    # Served as the default tenant, through the same `db` proxy as live requests
+    server.tenants.stores[server.DEFAULT_TENANT] = store
+    print(f"scale {logs:,} logs / {students:,} students (generated in {time.perf_counter() - started:.1f}s)")
+
+    results = {}
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, method, path, params, body, heavy in endpoints(store):
+            count = max(5, int(iterations * HEAVY_ITERATION_SHARE)) if heavy else iterations
+            results[name] = await run_endpoint(client, method, path, params, body, count)
+            row = results[name]
+            print(f"  {name:>22}  p50 {row['p50_ms']:>9.2f}ms  p95 {row['p95_ms']:>9.2f}ms"
+                  f"  p99 {row['p99_ms']:>9.2f}ms  {row['requests_per_s']:>9.1f}/s"
+                  f"  {row['response_bytes']:>10,}B  peak {row['peak_alloc_kb']:>9,.0f}KB")
+    return {"logs": logs, "students": students, "endpoints": results}
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """Endpoints whose p95 grew by more than `threshold` (0.2 = 20%) at a shared scale."""
+    regressions = []
+    old_scales = {scale["logs"]: scale["endpoints"] for scale in baseline["scales"]}
+    for scale in current["scales"]:
+        old = old_scales.get(scale["logs"])
+        if old is None:
+            continue
+        for name, row in scale["endpoints"].items():
+            before = old.get(name)
+            if before and row["p95_ms"] > before["p95_ms"] * (1 + threshold):
+                regressions.append(
+                    f"{scale['logs']:,} logs, {name}: p95 {before['p95_ms']}ms -> {row['p95_ms']}ms"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="1000,10000,100000", help="comma-separated log counts")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=20260203)
+    parser.add_argument("--out", default="bench_api.json", help="where to write the JSON report")
+    parser.add_argument("--compare", help="earlier report to check for p95 regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed p95 growth (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    scales = [int(s) for s in args.scales.split(",") if s]
+    report = {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "iterations": args.iterations,
+        "seed": args.seed,
+        "scales": [asyncio.run(run_scale(logs, args.iterations, args.seed)) for logs in scales],
+    }
+    # ru_maxrss is in KB on Linux
+    report["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"peak RSS {report['peak_rss_mb']}MB, report written to {args.out}")
+
+    if baseline:
+        regressions = compare(baseline, report, args.threshold)
+        print(f"compared with {baseline.get('commit')}: {len(regressions)} p95 regression(s)")
+        for line in regressions:
+            print(f"  {line}")
+        raise SystemExit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
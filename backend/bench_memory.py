@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Bytes per stored log / request / audit event: Pydantic models vs the
+slotted records the DataStore keeps.
+
+Rows are decoded from JSON, as on a restart, so strings aren't shared
+between rows unless the record interns them.
+
+    cd backend && python bench_memory.py --rows 100000
+"""
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+
+import server
+
+
+def rows(count: int) -> dict:
+    rng = random.Random(7)
+    logs, requests, events = [], [], []
+    for i in range(count):
+        student_id, program_id = f"std-{rng.randrange(count // 20 + 1)}", f"prog-{rng.randrange(50)}"
+        stamp = f"2026-02-{rng.randrange(1, 29):02d}T{rng.randrange(24):02d}:00:00+00:00"
+        logs.append({
+            "log_id": f"log-{i}", "student_id": student_id, "program_id": program_id,
+            "date": stamp[:10], "hours": rng.choice([1.0, 2.0, 2.5]), "description": f"Shift {i}",
+            "evidence_tier": "self_reported", "status": "pending", "created_at": stamp, "updated_at": stamp,
+        })
+        requests.append({
+            "request_id": f"vr-{i}", "log_id": f"log-{i}", "student_id": student_id, "program_id": program_id,
+            "status": "awaiting_confirmation", "assignee_admin_id": None, "ngo_name": "Food Bank",
+            "action_description": f"Shift {i}",
+        })
+        events.append({
+            "event_id": f"evt-{i}", "actor_id": "admin-001", "actor_role": "university_admin",
+            "entity_type": "verification_request", "entity_id": f"vr-{i}", "action": "confirm",
+            "timestamp": stamp, "notes": f"Confirmed shift {i}", "seq": i + 1, "term_id": "spring-2026",
+        })
+    # Round-trip through JSON so every row owns its strings
+    return json.loads(json.dumps({"logs": logs, "requests": requests, "events": events}))
+
+
+def measure(build, key: str, count: int) -> float:
+    """Memory still held once the decoded rows are dropped, per record."""
+    gc.collect()
+    tracemalloc.start()
+    source = rows(count)[key]
+    built = [build(row) for row in source]
+    del source
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return retained / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+
+    kinds = [
+        ("service log", "logs", server.ServiceLog, server.LogRecord),
+        ("verification request", "requests", server.VerificationRequest, server.RequestRecord),
+        ("audit event", "events", server.AuditEvent, server.AuditRecord),
+    ]
+    print(f"{args.rows} rows each, bytes per record (including its strings)")
+    print(f"{'entity':>22}  {'pydantic':>9}  {'record':>7}  {'saved':>6}")
+    for label, key, model, record in kinds:
+        pydantic_bytes = measure(lambda row: model(**row), key, args.rows)
+        record_bytes = measure(lambda row: record(**row), key, args.rows)
+        print(f"{label:>22}  {pydantic_bytes:>9,.0f}  {record_bytes:>7,.0f}"
+              f"  {1 - record_bytes / pydantic_bytes:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
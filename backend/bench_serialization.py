@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Rows/second for the list endpoints, legacy vs fast serialization.
+
+"legacy" builds rows with a model_dump() per entity and encodes them the way
+FastAPI does by default (jsonable_encoder + JSONResponse); "fast" uses the
+cached per-entity dumps and orjson (FastJSONResponse). Both produce the
+same JSON.
+
+    cd backend && python bench_serialization.py --students 5000 --logs 100000
+"""
+import argparse
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+import server
+from bench_store import populate
+from repository import MemoryRepository
+
+
+def legacy_json(content):
+    return JSONResponse(jsonable_encoder(content))
+
+
+def legacy_dump(dumps, key, entity):
+    # A Pydantic model per row, as before the stored records and dump cache
+    model = entity.to_model() if isinstance(entity, server.Record) else entity
+    return model.model_dump()
+
+
+def endpoints(store: server.DataStore, detail_count: int):
+    student_ids = list(store.students)[:detail_count]
+    return {
+        "service-logs": (
+            lambda: server.get_service_logs("spring-2026", None, None, None, server.SortOrder.asc, None, None, None),
+            len(store.find_logs(term_id="spring-2026")),
+        ),
+        "verification-requests": (
+            lambda: server.get_verification_requests("spring-2026", None),
+            len(store.find_requests(term_id="spring-2026")),
+        ),
+        "students": (
+            lambda: server.get_students("spring-2026", None, server.SortOrder.asc, None, None, None),
+            len(store.students),
+        ),
+        "student detail": (
+            lambda: [server.get_student(student_id, "spring-2026") for student_id in student_ids],
+            len(student_ids),
+        ),
+    }
+
+
+def measure(fn, rounds: int) -> tuple:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    responses = result if isinstance(result, list) else [result]
+    return best, [json.loads(r.body) for r in responses]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--logs", type=int, default=20000)
+    parser.add_argument("--detail", type=int, default=200, help="students fetched one by one")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    store = server.DataStore(MemoryRepository())
+    populate(store, args.students, args.logs)
+    store.response_cache.maxsize = 0  # time the serialization, not cache hits
+    server.db = store
+
+    fast_json, dump_row = server.fast_json, store.dump_row
+    results = {}
+    for mode in ("legacy", "fast"):
+        if mode == "legacy":
+            server.fast_json = legacy_json
+            store.dump_row = legacy_dump
+        else:
+            server.fast_json, store.dump_row = fast_json, dump_row
+        for name, (fn, rows) in endpoints(store, args.detail).items():
+            seconds, body = measure(fn, args.rounds)
+            results.setdefault(name, {"rows": rows})[mode] = (rows / seconds, body)
+
+    print(f"{args.students} students, {args.logs} logs (best of {args.rounds})")
+    print(f"{'endpoint':>22}  {'rows':>8}  {'legacy rows/s':>14}  {'fast rows/s':>12}  {'speedup':>8}")
+    for name, row in results.items():
+        (legacy_rate, legacy_body), (fast_rate, fast_body) = row["legacy"], row["fast"]
+        same = "" if legacy_body == fast_body else "  (OUTPUT DIFFERS)"
+        print(f"{name:>22}  {row['rows']:>8}  {legacy_rate:>14,.0f}  {fast_rate:>12,.0f}"
+              f"  {fast_rate / legacy_rate:>7.1f}x{same}")
+
+
+if __name__ == "__main__":
+    main()
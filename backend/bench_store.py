@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Compare DataStore persistence backends (in-memory, SQLite, journal).
+
+Loads the same synthetic term into each backend, then times bulk ingest,
+single confirm/reject round trips, a cold restart and a term read.
+
+    cd backend && python bench_store.py --students 5000 --logs 100000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import uuid
+
+import server
+from repository import JournalRepository, MemoryRepository, SQLiteRepository
+
+
+def populate(store: server.DataStore, students: int, logs: int):
+    program_ids = store.term_program_ids("spring-2026")
+    rng = random.Random(7)
+    with store.transaction():
+        for i in range(students):
+            store.add_student(server.Student(
+                student_id=f"bench-std-{i}", name=f"Student {i}", email=f"student{i}@example.edu",
+                program_ids=[rng.choice(program_ids)],
+            ))
+        for i in range(logs):
+            student_id = f"bench-std-{rng.randrange(students)}"
+            program_id = store.students[student_id].program_ids[0]
+            log = server.ServiceLog(
+                log_id=f"bench-log-{i}", student_id=student_id, program_id=program_id,
+                date="2026-02-01", hours=rng.choice([1.0, 1.5, 2.0, 3.0]), description="Benchmark shift",
+                evidence_tier=server.EvidenceTier.self_reported, status=server.LogStatus.pending,
+                created_at="2026-02-01T12:00:00+00:00", updated_at="2026-02-01T12:00:00+00:00",
+            )
+            store.add_log(log)
+            store.add_verification_request(server.VerificationRequest(
+                request_id=f"bench-vr-{i}", log_id=log.log_id, student_id=student_id, program_id=program_id,
+                status=server.VerificationStatus.awaiting_confirmation,
+            ))
+
+
+def act(store: server.DataStore, count: int):
+    """Confirm/reject `count` requests the way the handlers do."""
+    now = "2026-03-01T12:00:00+00:00"
+    for i in range(count):
+        vr = store.verification_requests[f"bench-vr-{i}"]
+        log = store.service_logs[vr.log_id]
+        confirm = i % 2 == 0
+        with store.transaction():
+            store.set_log_status(log, server.LogStatus.confirmed if confirm else server.LogStatus.rejected, now)
+            store.set_request_status(
+                vr, server.VerificationStatus.confirmed if confirm else server.VerificationStatus.rejected
+            )
+            store.add_audit_event(server.AuditEvent(
+                event_id=str(uuid.uuid4()), actor_id="admin-001", actor_role=server.ActorRole.university_admin,
+                entity_type=server.EntityType.verification_request, entity_id=vr.request_id,
+                action=server.AuditAction.confirm if confirm else server.AuditAction.reject,
+                timestamp=now, notes="benchmark",
+            ))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def bench(name: str, make_repository, args) -> dict:
+    _, store = timed(server.DataStore, make_repository())
+    ingest, _ = timed(populate, store, args.students, args.logs)
+    actions, _ = timed(act, store, args.actions)
+    server.db = store
+    read, _ = timed(server.get_students, "spring-2026", None, server.SortOrder.asc, None, None, None)
+    store.repository.close()
+    restart, restarted = timed(server.DataStore, make_repository())
+    return {
+        "backend": name,
+        "ingest_rows_per_s": round(2 * args.logs / ingest),
+        "actions_per_s": round(args.actions / actions),
+        "get_students_ms": round(read * 1000, 1),
+        "restart_s": round(restart, 3),
+        # Memory restarts from the seed, so this shows what survived
+        "logs_after_restart": len(restarted.service_logs),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--logs", type=int, default=20000)
+    parser.add_argument("--actions", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        results = [
+            bench("memory", MemoryRepository, args),
+            bench("sqlite", lambda: SQLiteRepository(path), args),
+            bench("journal", lambda: JournalRepository(os.path.join(tmp, "journal")), args),
+        ]
+
+    print(f"{args.students} students, {args.logs} logs, {args.actions} actions")
+    columns = list(results[0])
+    print("  ".join(f"{c:>18}" for c in columns))
+    for row in results:
+        print("  ".join(f"{row[c]!s:>18}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Import service logs from a CSV or NDJSON file into the configured backend.
+
+Each valid row becomes a pending service log with a verification request;
+invalid rows are reported by number and skipped. See LogImport in server.py
+for the columns and checks. The same import is served over HTTP at
+POST /api/import/service-logs.
+
+    cd backend
+    DATASTORE_BACKEND=journal python import_logs.py weekly_hours.csv
+    DATASTORE_BACKEND=journal python import_logs.py partner.ndjson --errors 20
+    DATASTORE_BACKEND=journal python import_logs.py acme.csv --tenant acme
+"""
+import argparse
+import json
+
+from server import IMPORT_BATCH_ROWS, ImportFormat, import_service_logs_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=[f.value for f in ImportFormat],
+                        help="default: from the extension (.csv, else NDJSON)")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_ROWS)
+    parser.add_argument("--errors", type=int, default=10, help="row errors to print")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    parser.add_argument("--tenant", default="default", help="tenant whose store to write (see TENANT_DIR)")
+    args = parser.parse_args()
+
+    fmt = ImportFormat(args.format or ("csv" if args.path.lower().endswith(".csv") else "ndjson"))
+    # The tenant's store, on the backend from the environment
+    from server import TENANT_ID, tenants
+    if not TENANT_ID.fullmatch(args.tenant):
+        parser.error(f"invalid tenant id: {args.tenant}")
+    try:
+        with tenants.holding(args.tenant) as db, open(args.path, "rb") as f:
+            try:
+                report = import_service_logs_file(f, fmt, args.path, batch_size=args.batch_size, store=db)
+            except ValueError as e:
+                parser.error(str(e))
+    finally:
+        # Flushes the journal, also when a bad file ends the import early
+        tenants.close()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{report['imported']:,} of {report['rows']:,} rows imported, {report['failed']:,} failed"
+          f" ({report['seconds']}s, {report['rows_per_second']:,} rows/s)")
+    for error in report["errors"][:args.errors]:
+        print(f"  row {error['row']}: {error['error']}")
+    if report["failed"] > args.errors:
+        print(f"  ... and {report['failed'] - args.errors:,} more")
+    if report["possible_duplicates"]:
+        print(f"{report['possible_duplicates']:,} imported rows look like duplicates of existing logs")
+        for duplicate in report["duplicates"][:args.errors]:
+            print(f"  row {duplicate['row']}: {duplicate['log_id']} repeats {duplicate['possible_duplicate_of']}"
+                  f" ({duplicate['match']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,863 @@
+"""Persistence backends for the DataStore.
+
+DataStore keeps serving reads from memory (indexes, aggregates, columns);
+a repository only makes writes durable and hands rows back on boot:
+MemoryRepository (nothing), SQLiteRepository (tables + indexes) or
+JournalRepository (append-only journal + snapshots).
+Rows are plain dicts shaped like the Pydantic models' JSON dumps (journal
+snapshots hand back the values the store rendered into them), so this
+module doesn't depend on server.py.
+
+A shared SQLiteRepository also lets several processes (uvicorn workers)
+serve one database: each transaction's ops are appended to a change log
+that the other processes replay into their own memory (see changes()).
+"""
+from contextlib import contextmanager
+from itertools import repeat
+from operator import itemgetter
+from typing import Callable, Iterable, Optional
+import marshal
+import os
+import sqlite3
+import struct
+import threading
+import time
+import uuid
+import zlib
+
+
+class StaleReplica(Exception):
+    """This process missed changes the shared change log no longer holds;
+    its store has to be loaded again from the tables."""
+
+
+class MemoryRepository:
+    """No persistence: everything lives and dies with the process."""
+
+    def load(self) -> Optional[dict]:
+        return None
+
+    def attach(self, snapshot_source: Callable[[], Callable[[], dict]]):
+        pass
+
+    @contextmanager
+    def transaction(self):
+        yield
+
+    def save_term(self, row: dict):
+        pass
+
+    def save_program(self, row: dict):
+        pass
+
+    def save_student(self, row: dict):
+        pass
+
+    def save_log(self, row: dict):
+        pass
+
+    def save_request(self, row: dict):
+        pass
+
+    def save_logs(self, rows: list):
+        pass
+
+    def save_requests(self, rows: list):
+        pass
+
+    def save_audit_event(self, row: dict):
+        pass
+
+    def save_audit_events(self, rows: list):
+        pass
+
+    def save_settings(self, row: dict):
+        pass
+
+    def update_log_status(self, log_id: str, status: str, evidence_tier: str, updated_at: str):
+        pass
+
+    def update_request_status(self, request_id: str, status: str):
+        pass
+
+    def publish(self, events: list):
+        pass
+
+    def changes(self) -> list:
+        return []
+
+    def change_version(self) -> Optional[str]:
+        return None
+
+    def stale(self) -> bool:
+        return False
+
+    def follow(self, on_change: Callable[[], None]):
+        pass
+
+    def close(self):
+        pass
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS terms (
+    term_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    required_hours REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS programs (
+    program_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    term_id TEXT NOT NULL REFERENCES terms(term_id),
+    icon TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_programs_term ON programs(term_id);
+CREATE TABLE IF NOT EXISTS students (
+    rowid INTEGER PRIMARY KEY,
+    student_id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    avatar TEXT
+);
+CREATE TABLE IF NOT EXISTS enrollments (
+    student_id TEXT NOT NULL REFERENCES students(student_id),
+    program_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (student_id, program_id)
+);
+CREATE INDEX IF NOT EXISTS idx_enrollments_program ON enrollments(program_id);
+CREATE TABLE IF NOT EXISTS service_logs (
+    rowid INTEGER PRIMARY KEY,
+    log_id TEXT NOT NULL UNIQUE,
+    student_id TEXT NOT NULL,
+    program_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    hours REAL NOT NULL,
+    description TEXT NOT NULL,
+    evidence_tier TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_logs_student ON service_logs(student_id);
+CREATE INDEX IF NOT EXISTS idx_logs_program_status ON service_logs(program_id, status);
+CREATE TABLE IF NOT EXISTS verification_requests (
+    rowid INTEGER PRIMARY KEY,
+    request_id TEXT NOT NULL UNIQUE,
+    log_id TEXT NOT NULL,
+    student_id TEXT NOT NULL,
+    program_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    assignee_admin_id TEXT,
+    ngo_name TEXT,
+    action_description TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_requests_log ON verification_requests(log_id);
+CREATE INDEX IF NOT EXISTS idx_requests_student ON verification_requests(student_id);
+CREATE INDEX IF NOT EXISTS idx_requests_program_status ON verification_requests(program_id, status);
+CREATE TABLE IF NOT EXISTS audit_events (
+    seq INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL UNIQUE,
+    actor_id TEXT NOT NULL,
+    actor_role TEXT NOT NULL,
+    entity_type TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    action TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    notes TEXT NOT NULL,
+    term_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_audit_entity ON audit_events(entity_id);
+CREATE INDEX IF NOT EXISTS idx_audit_actor ON audit_events(actor_id);
+CREATE INDEX IF NOT EXISTS idx_audit_term ON audit_events(term_id);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+-- Shared mode: one row of marshalled ops per committed transaction, how
+-- far each live process has replayed them, and an id telling this change
+-- log apart from one in a recreated database
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    ops BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS followers (
+    follower_id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    seen_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS change_log (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    epoch TEXT NOT NULL
+);
+"""
+
+# Statement text is constant so sqlite3's per-connection statement cache
+# reuses the compiled (prepared) statement on every call.
+INSERT_TERM = "INSERT OR REPLACE INTO terms VALUES (:term_id, :name, :start_date, :end_date, :required_hours)"
+INSERT_PROGRAM = "INSERT OR REPLACE INTO programs VALUES (:program_id, :name, :type, :term_id, :icon)"
+INSERT_STUDENT = (
+    "INSERT INTO students (student_id, name, email, avatar) VALUES (:student_id, :name, :email, :avatar) "
+    "ON CONFLICT(student_id) DO UPDATE SET name = excluded.name, email = excluded.email, avatar = excluded.avatar"
+)
+INSERT_ENROLLMENT = "INSERT OR REPLACE INTO enrollments VALUES (?, ?, ?)"
+INSERT_LOG = (
+    "INSERT INTO service_logs (log_id, student_id, program_id, date, hours, description, evidence_tier, "
+    "status, created_at, updated_at) VALUES (:log_id, :student_id, :program_id, :date, :hours, :description, "
+    ":evidence_tier, :status, :created_at, :updated_at)"
+)
+INSERT_REQUEST = (
+    "INSERT INTO verification_requests (request_id, log_id, student_id, program_id, status, assignee_admin_id, "
+    "ngo_name, action_description) VALUES (:request_id, :log_id, :student_id, :program_id, :status, "
+    ":assignee_admin_id, :ngo_name, :action_description)"
+)
+INSERT_AUDIT_EVENT = (
+    "INSERT INTO audit_events VALUES (:seq, :event_id, :actor_id, :actor_role, :entity_type, :entity_id, "
+    ":action, :timestamp, :notes, :term_id)"
+)
+INSERT_SETTING = "INSERT OR REPLACE INTO settings VALUES (?, ?)"
+UPDATE_LOG_STATUS = "UPDATE service_logs SET status = ?, evidence_tier = ?, updated_at = ? WHERE log_id = ?"
+UPDATE_REQUEST_STATUS = "UPDATE verification_requests SET status = ? WHERE request_id = ?"
+INSERT_CHANGE = "INSERT INTO changes (ops) VALUES (?)"
+SELECT_CHANGES = "SELECT seq, ops FROM changes WHERE seq > ? ORDER BY seq"
+UPSERT_FOLLOWER = "INSERT OR REPLACE INTO followers VALUES (?, ?, ?)"
+# Shared mode: the change log is trimmed every TRIM_EVERY commits, up to
+# what every process seen within FOLLOWER_TIMEOUT seconds has replayed
+TRIM_EVERY = 256
+FOLLOWER_TIMEOUT = 300.0
+
+
+class SQLiteRepository:
+    """SQLite (WAL mode) persistence.
+
+    One connection shared across the handler thread pool, serialized by a
+    re-entrant lock. Statements issued outside `transaction()` autocommit;
+    inside it they commit or roll back together.
+
+    With `shared`, several processes can serve the same database. Every
+    transaction also appends its ops (in JournalRepository's format) to the
+    `changes` table, and changes() hands a process the ops others committed
+    since it last looked. Transactions start with BEGIN IMMEDIATE, so the
+    caller applies those before writing and processes never write from a
+    stale view. Writes must then run inside transaction().
+    """
+
+    def __init__(self, path: str, shared: bool = False, poll_interval: float = 0.5):
+        self.path = path
+        self.shared = shared
+        self.poll_interval = poll_interval
+        self._lock = threading.RLock()
+        self._depth = 0
+        self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=OFF")
+        self.conn.executescript(SCHEMA)
+        # Shared mode: the last change applied here, ops of the open
+        # transaction, and a second connection so stale() never waits on
+        # this process's writer
+        self.seen = 0
+        self._pending: list = []
+        self._reading = False  # load()'s snapshot is still open
+        self._commits = 0
+        self._closed = threading.Event()
+        self.follower_id = uuid.uuid4().hex
+        if shared:
+            self.conn.execute("INSERT OR IGNORE INTO change_log VALUES (1, ?)", (uuid.uuid4().hex[:8],))
+            self.epoch = self.conn.execute("SELECT epoch FROM change_log").fetchone()[0]
+            self._poll = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            self._poll_lock = threading.Lock()
+            self._data_version = None
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+            self._end_read()
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            try:
+                yield
+                seq = self._log_changes() if self._pending else None
+            except BaseException:
+                self._pending = []
+                self.conn.execute("ROLLBACK")
+                raise
+            else:
+                self.conn.execute("COMMIT")
+                if seq is not None:
+                    self.seen = seq
+            finally:
+                self._depth = 0
+
+    def _end_read(self):
+        if self._reading:
+            self.conn.execute("COMMIT")
+            self._reading = False
+
+    def _record(self, *op):
+        if self.shared:
+            if not self._depth:
+                raise RuntimeError("writes to a shared database must run inside transaction()")
+            self._pending.append(op)
+
+    def _log_changes(self) -> int:
+        ops, self._pending = self._pending, []
+        seq = self.conn.execute(INSERT_CHANGE, (marshal.dumps(ops),)).lastrowid
+        if seq != self.seen + 1:
+            # changes() wasn't applied first; committing would hide those
+            raise RuntimeError(f"write from a stale view (at change {self.seen}, log at {seq - 1})")
+        self.conn.execute(UPSERT_FOLLOWER, (self.follower_id, seq, time.time()))
+        self._commits += 1
+        if self._commits % TRIM_EVERY == 0:
+            self.conn.execute("DELETE FROM followers WHERE seen_at < ?", (time.time() - FOLLOWER_TIMEOUT,))
+            # Always keep the newest change so a gap stays detectable
+            self.conn.execute(
+                "DELETE FROM changes WHERE seq <= (SELECT min(seq) FROM followers) AND seq < ?", (seq,)
+            )
+        return seq
+
+    def changes(self) -> list:
+        """Op lists other processes committed since this one last looked, oldest first.
+
+        Call at the start of a transaction and apply them before writing.
+        Raises StaleReplica if some were already trimmed from the log.
+        """
+        if not self.shared:
+            return []
+        with self._lock:
+            rows = self.conn.execute(SELECT_CHANGES, (self.seen,)).fetchall()
+            if not rows:
+                return []
+            if rows[0][0] != self.seen + 1:
+                raise StaleReplica(f"changes {self.seen + 1}-{rows[0][0] - 1} were trimmed from {self.path}")
+            self.seen = rows[-1][0]
+            if self._depth:
+                self.conn.execute(UPSERT_FOLLOWER, (self.follower_id, self.seen, time.time()))
+            return [marshal.loads(row[1]) for row in rows]
+
+    def change_version(self) -> Optional[str]:
+        """Position in the change log applied here ("<epoch>-<seq>"), the
+        same in every process that has applied the same changes; None
+        unless shared."""
+        return f"{self.epoch}-{self.seen}" if self.shared else None
+
+    def stale(self) -> bool:
+        """Whether another process committed changes not yet applied here.
+
+        Cheap enough to ask per request: PRAGMA data_version only moves when
+        another connection commits, and the poll connection takes no lock
+        this process's writer holds.
+        """
+        if not self.shared:
+            return False
+        with self._poll_lock:
+            version = self._poll.execute("PRAGMA data_version").fetchone()[0]
+            if version == self._data_version:
+                return False
+            latest = self._poll.execute("SELECT max(seq) FROM changes").fetchone()[0] or 0
+            if latest > self.seen:
+                return True
+            self._data_version = version
+            return False
+
+    def follow(self, on_change: Callable[[], None]):
+        """Once load()'s rows are consumed: call on_change from a background
+        thread whenever another process commits, so idle processes (and their
+        /api/changes subscribers) keep up."""
+        if not self.shared:
+            return
+        with self._lock:
+            self._end_read()
+
+        def poll():
+            while not self._closed.wait(self.poll_interval):
+                try:
+                    if self.stale():
+                        on_change()
+                except StaleReplica:
+                    return  # the next request reloads the store
+                except sqlite3.OperationalError:
+                    pass  # busy; retry on the next tick
+
+        threading.Thread(target=poll, name="sqlite-follow", daemon=True).start()
+
+    def _execute(self, sql: str, params):
+        with self._lock:
+            self.conn.execute(sql, params)
+
+    def _executemany(self, sql: str, rows: Iterable):
+        with self._lock:
+            self.conn.executemany(sql, rows)
+
+    def attach(self, snapshot_source: Callable[[], Callable[[], dict]]):
+        pass
+
+    # ---------- writes ----------
+    def save_term(self, row: dict):
+        self._record("save", "terms", row)
+        self._execute(INSERT_TERM, row)
+
+    def save_program(self, row: dict):
+        self._record("save", "programs", row)
+        self._execute(INSERT_PROGRAM, row)
+
+    def save_student(self, row: dict):
+        with self.transaction():
+            self._record("save", "students", row)
+            self._execute(INSERT_STUDENT, row)
+            self._executemany(
+                INSERT_ENROLLMENT,
+                [(row["student_id"], pid, i) for i, pid in enumerate(row["program_ids"])],
+            )
+
+    def save_log(self, row: dict):
+        self._record("save", "service_logs", row)
+        self._execute(INSERT_LOG, row)
+
+    def save_request(self, row: dict):
+        self._record("save", "verification_requests", row)
+        self._execute(INSERT_REQUEST, row)
+
+    def save_logs(self, rows: list):
+        self._record("saves", "service_logs", rows)
+        self._executemany(INSERT_LOG, rows)
+
+    def save_requests(self, rows: list):
+        self._record("saves", "verification_requests", rows)
+        self._executemany(INSERT_REQUEST, rows)
+
+    def save_audit_event(self, row: dict):
+        self._record("audit", row)
+        self._execute(INSERT_AUDIT_EVENT, row)
+
+    def save_audit_events(self, rows: list):
+        self._record("audits", rows)
+        self._executemany(INSERT_AUDIT_EVENT, rows)
+
+    def save_settings(self, row: dict):
+        self._record("settings", row)
+        self._executemany(INSERT_SETTING, list(row.items()))
+
+    def update_log_status(self, log_id: str, status: str, evidence_tier: str, updated_at: str):
+        self._record("log_status", log_id, status, evidence_tier, updated_at)
+        self._execute(UPDATE_LOG_STATUS, (status, evidence_tier, updated_at, log_id))
+
+    def update_request_status(self, request_id: str, status: str):
+        self._record("request_status", request_id, status)
+        self._execute(UPDATE_REQUEST_STATUS, (status, request_id))
+
+    def publish(self, events: list):
+        """Pass change-stream events to the other processes with this transaction."""
+        self._record("events", events)
+
+    # ---------- reads ----------
+    def load(self) -> Optional[dict]:
+        """All rows in creation order, or None for a fresh database.
+
+        Shared, the rows come from one read snapshot that stays open until
+        the next transaction() or follow(), and changes() continues from it.
+        """
+        with self._lock:
+            conn = self.conn
+            if self.shared:
+                self._end_read()
+                conn.execute("BEGIN")
+                self._reading = True
+                self.seen = conn.execute("SELECT coalesce(max(seq), 0) FROM changes").fetchone()[0]
+            if conn.execute("SELECT 1 FROM terms LIMIT 1").fetchone() is None:
+                return None
+            enrollments: dict[str, list] = {}
+            for r in conn.execute("SELECT student_id, program_id FROM enrollments ORDER BY student_id, position"):
+                enrollments.setdefault(r["student_id"], []).append(r["program_id"])
+            students = []
+            for r in conn.execute("SELECT student_id, name, email, avatar FROM students ORDER BY rowid"):
+                row = dict(r)
+                row["program_ids"] = enrollments.get(row["student_id"], [])
+                students.append(row)
+            return {
+                "terms": [dict(r) for r in conn.execute("SELECT * FROM terms ORDER BY rowid")],
+                "programs": [dict(r) for r in conn.execute("SELECT * FROM programs ORDER BY rowid")],
+                "students": students,
+                "service_logs": (
+                    dict(r) for r in conn.execute(
+                        "SELECT log_id, student_id, program_id, date, hours, description, evidence_tier, "
+                        "status, created_at, updated_at FROM service_logs ORDER BY rowid"
+                    )
+                ),
+                "verification_requests": (
+                    dict(r) for r in conn.execute(
+                        "SELECT request_id, log_id, student_id, program_id, status, assignee_admin_id, "
+                        "ngo_name, action_description FROM verification_requests ORDER BY rowid"
+                    )
+                ),
+                "audit_events": (dict(r) for r in conn.execute("SELECT * FROM audit_events ORDER BY seq")),
+                "settings": dict(conn.execute("SELECT key, value FROM settings").fetchall()),
+            }
+
+    def close(self):
+        self._closed.set()
+        with self._lock:
+            if self.shared:
+                self._end_read()
+                self._poll.close()
+            self.conn.close()
+
+
+# ============== JOURNAL + SNAPSHOT ==============
+# Table name -> primary key of its rows, in load() order
+TABLE_KEYS = {
+    "terms": "term_id",
+    "programs": "program_id",
+    "students": "student_id",
+    "service_logs": "log_id",
+    "verification_requests": "request_id",
+}
+SNAPSHOT_MAGIC = b"MYIMPACT-SNAP-2\n"
+SNAPSHOT_MAGIC_V1 = b"MYIMPACT-SNAP-1\n"  # one marshalled dict of every table
+SNAPSHOT_CHUNK_ROWS = 50_000  # rows per snapshot frame
+FRAME_HEADER = struct.Struct("<II")  # payload length, crc32
+
+
+class JournalRepository:
+    """Durability for the in-memory store without a database.
+
+    Every committed transaction is appended to `journal-<gen>.log` as one
+    frame (length + crc32 + marshalled list of ops), so a torn write at
+    the tail is detected and dropped on replay. fsync is batched: a
+    background thread syncs at most every `fsync_interval` seconds, which
+    bounds what a power loss can take to that window.
+
+    Once `snapshot_every` rows have been journaled since the last snapshot,
+    the journal rotates and the attached store is written to
+    `snapshot-<gen+1>.bin` in the background (frames of marshalled column
+    tuples, like the journal's). Boot loads the newest snapshot and replays
+    only the journals from its generation on.
+    """
+
+    def __init__(self, directory: str, fsync_interval: float = 0.05, snapshot_every: int = 100_000):
+        self.directory = directory
+        self.fsync_interval = fsync_interval
+        self.snapshot_every = snapshot_every
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._pending: list = []
+        self._pending_rows = 0  # rows in _pending; batch ops count each row
+        self._ops_since_snapshot = 0
+        self._dirty = False
+        self._snapshot_source: Optional[Callable[[], Callable[[], dict]]] = None
+        self._snapshotter: Optional[threading.Thread] = None
+        os.makedirs(directory, exist_ok=True)
+        self.generation = max(self._generations("snapshot") + self._generations("journal"), default=1)
+        self._file = None
+        self._closed = threading.Event()
+        self._syncer = threading.Thread(target=self._sync_loop, name="journal-fsync", daemon=True)
+
+    def _path(self, kind: str, generation: int) -> str:
+        ext = "bin" if kind == "snapshot" else "log"
+        return os.path.join(self.directory, f"{kind}-{generation:06d}.{ext}")
+
+    def _generations(self, kind: str) -> list:
+        prefix = f"{kind}-"
+        return sorted(
+            int(name[len(prefix):len(prefix) + 6])
+            for name in os.listdir(self.directory)
+            if name.startswith(prefix) and not name.endswith(".tmp")
+        )
+
+    def _open_journal(self):
+        self._file = open(self._path("journal", self.generation), "ab")
+        if not self._syncer.is_alive():
+            self._syncer.start()
+
+    def attach(self, snapshot_source: Callable[[], Callable[[], dict]]):
+        """Give the repository a way to dump the full store for snapshots.
+
+        snapshot_source() runs inside the store's write transaction and only
+        copies out what it needs; the function it returns renders that copy
+        as {table: (columns, value tuples), "settings": dict} on the
+        snapshot thread.
+        """
+        self._snapshot_source = snapshot_source
+
+    # ---------- writes ----------
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            self._depth += 1
+            try:
+                yield
+            except BaseException:
+                if self._depth == 1:
+                    self._pending.clear()
+                    self._pending_rows = 0
+                raise
+            finally:
+                self._depth -= 1
+            if self._depth == 0:
+                self._commit()
+
+    def _record(self, *op, rows: int = 1):
+        with self._lock:
+            self._pending.append(op)
+            self._pending_rows += rows
+            if self._depth == 0:
+                self._commit()
+
+    def _commit(self):
+        if not self._pending:
+            return
+        if self._file is None:
+            self._open_journal()
+        payload = marshal.dumps(self._pending)
+        self._file.write(FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        self._file.flush()
+        self._dirty = True
+        self._ops_since_snapshot += self._pending_rows
+        self._pending = []
+        self._pending_rows = 0
+        if (self._ops_since_snapshot >= self.snapshot_every and self._snapshot_source is not None
+                and not self._snapshotting()):
+            self.snapshot(wait=False)
+
+    def _sync_loop(self):
+        while not self._closed.wait(self.fsync_interval):
+            self.sync()
+
+    def sync(self):
+        with self._lock:
+            if self._dirty and self._file is not None:
+                os.fsync(self._file.fileno())
+                self._dirty = False
+
+    def save_term(self, row: dict):
+        self._record("save", "terms", row)
+
+    def save_program(self, row: dict):
+        self._record("save", "programs", row)
+
+    def save_student(self, row: dict):
+        self._record("save", "students", row)
+
+    def save_log(self, row: dict):
+        self._record("save", "service_logs", row)
+
+    def save_request(self, row: dict):
+        self._record("save", "verification_requests", row)
+
+    def save_logs(self, rows: list):
+        self._record("saves", "service_logs", rows, rows=len(rows))
+
+    def save_requests(self, rows: list):
+        self._record("saves", "verification_requests", rows, rows=len(rows))
+
+    def save_audit_event(self, row: dict):
+        self._record("audit", row)
+
+    def save_audit_events(self, rows: list):
+        self._record("audits", rows, rows=len(rows))
+
+    def save_settings(self, row: dict):
+        self._record("settings", row)
+
+    def update_log_status(self, log_id: str, status: str, evidence_tier: str, updated_at: str):
+        self._record("log_status", log_id, status, evidence_tier, updated_at)
+
+    def update_request_status(self, request_id: str, status: str):
+        self._record("request_status", request_id, status)
+
+    # A journal has a single writer process; nothing to share
+    def publish(self, events: list):
+        pass
+
+    def changes(self) -> list:
+        return []
+
+    def change_version(self) -> Optional[str]:
+        return None
+
+    def stale(self) -> bool:
+        return False
+
+    def follow(self, on_change: Callable[[], None]):
+        pass
+
+    # ---------- snapshots ----------
+    def snapshot(self, wait: bool = True):
+        """Snapshot the attached store and start a new journal.
+
+        Only the store's capture and the journal rotation happen under the
+        lock, so commits never wait for the file: it is rendered, written
+        and fsynced on a background thread, and the generations it replaces
+        are deleted only once it is durable. A crash before then boots from
+        the previous snapshot and replays both journals.
+        """
+        with self._lock:
+            self._wait_snapshot()
+            render = self._snapshot_source()
+            self._ops_since_snapshot = 0
+            self._commit()
+            self.sync()
+            if self._file is not None:
+                self._file.close()
+            self.generation += 1
+            self._open_journal()
+            self._snapshotter = threading.Thread(
+                target=self._write_snapshot, args=(render, self.generation),
+                name="journal-snapshot", daemon=True,
+            )
+            self._snapshotter.start()
+        if wait:
+            self._wait_snapshot()
+
+    def _snapshotting(self) -> bool:
+        return self._snapshotter is not None and self._snapshotter.is_alive()
+
+    def _wait_snapshot(self):
+        if self._snapshotter is not None:
+            self._snapshotter.join()
+
+    def _write_snapshot(self, render: Callable[[], dict], generation: int):
+        tables = render()
+        path = self._path("snapshot", generation)
+        with open(path + ".tmp", "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            for table in [*TABLE_KEYS, "audit_events"]:
+                columns, values = tables[table]
+                # Several frames per table, so no single marshal call holds
+                # the GIL for the whole table
+                for start in range(0, max(len(values), 1), SNAPSHOT_CHUNK_ROWS):
+                    self._write_frame(f, (table, columns, values[start:start + SNAPSHOT_CHUNK_ROWS]))
+            self._write_frame(f, ("settings", (), tables["settings"]))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+        for kind in ("snapshot", "journal"):
+            for older in self._generations(kind):
+                if older < generation:
+                    os.remove(self._path(kind, older))
+
+    @staticmethod
+    def _write_frame(f, record):
+        payload = marshal.dumps(record)
+        f.write(FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+
+    def _read_snapshot(self, generation: int) -> dict:
+        """{table: (columns, value tuples)} plus "settings", as written."""
+        path = self._path("snapshot", generation)
+        with open(path, "rb") as f:
+            data = f.read()
+        if data.startswith(SNAPSHOT_MAGIC_V1):
+            return marshal.loads(memoryview(data)[len(SNAPSHOT_MAGIC_V1):])
+        if not data.startswith(SNAPSHOT_MAGIC):
+            raise ValueError(f"Not a snapshot file: {path}")
+        tables = {table: ((), []) for table in [*TABLE_KEYS, "audit_events"]}
+        offset = len(SNAPSHOT_MAGIC)
+        while offset < len(data):
+            length, crc = FRAME_HEADER.unpack_from(data, offset)
+            payload = memoryview(data)[offset + FRAME_HEADER.size:offset + FRAME_HEADER.size + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                raise ValueError(f"Corrupt snapshot frame at byte {offset}: {path}")
+            table, columns, values = marshal.loads(payload)
+            if table == "settings":
+                tables["settings"] = values
+            else:
+                rows = tables[table][1]
+                rows.extend(values)
+                tables[table] = (columns, rows)
+            offset += FRAME_HEADER.size + length
+        return tables
+
+    def _replay(self, generation: int):
+        """Yield the ops of every intact frame, truncating a torn tail."""
+        path = self._path("journal", generation)
+        with open(path, "rb") as f:
+            data = f.read()
+        offset = 0
+        while offset + FRAME_HEADER.size <= len(data):
+            length, crc = FRAME_HEADER.unpack_from(data, offset)
+            payload = data[offset + FRAME_HEADER.size:offset + FRAME_HEADER.size + length]
+            if len(payload) < length or zlib.crc32(payload) != crc:
+                break
+            yield from marshal.loads(payload)
+            offset += FRAME_HEADER.size + length
+        if offset < len(data):
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+
+    # ---------- reads ----------
+    def load(self) -> Optional[dict]:
+        snapshots = self._generations("snapshot")
+        journals = self._generations("journal")
+        if not snapshots and not journals:
+            return None
+
+        state = {table: {} for table in TABLE_KEYS}
+        audit_events: list = []
+        settings: dict = {}
+        start = snapshots[-1] if snapshots else 0
+        if snapshots:
+            tables = self._read_snapshot(start)
+            for table, key in TABLE_KEYS.items():
+                columns, values = tables.pop(table)
+                if values:
+                    keys = map(itemgetter(columns.index(key)), values)
+                    state[table] = dict(zip(keys, map(dict, map(zip, repeat(columns), values))))
+            columns, values = tables.pop("audit_events")
+            audit_events = list(map(dict, map(zip, repeat(columns), values)))
+            settings = tables["settings"]
+
+        for generation in journals:
+            if generation < start:
+                continue
+            for op in self._replay(generation):
+                kind = op[0]
+                if kind == "save":
+                    _, table, row = op
+                    state[table][row[TABLE_KEYS[table]]] = row
+                elif kind == "saves":
+                    _, table, rows = op
+                    key = TABLE_KEYS[table]
+                    state[table].update((row[key], row) for row in rows)
+                    self._ops_since_snapshot += len(rows) - 1
+                elif kind == "audit":
+                    audit_events.append(op[1])
+                elif kind == "audits":
+                    audit_events.extend(op[1])
+                    self._ops_since_snapshot += len(op[1]) - 1
+                elif kind == "settings":
+                    settings = op[1]
+                elif kind == "log_status":
+                    _, log_id, status, evidence_tier, updated_at = op
+                    row = state["service_logs"][log_id]
+                    row.update(status=status, evidence_tier=evidence_tier, updated_at=updated_at)
+                elif kind == "request_status":
+                    _, request_id, status = op
+                    state["verification_requests"][request_id]["status"] = status
+                self._ops_since_snapshot += 1
+
+        return {
+            **{table: list(rows.values()) for table, rows in state.items()},
+            "audit_events": audit_events,
+            "settings": settings,
+        }
+
+    def close(self):
+        with self._lock:
+            self._commit()
+            self.sync()
+            self._wait_snapshot()
+            self._closed.set()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -1,25 +1,62 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-from typing import Optional, List
-from datetime import datetime, timezone
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, field_validator
+from typing import Callable, Iterable, Iterator, Optional, List
+from datetime import datetime, timedelta, timezone
 from enum import Enum
+from collections import Counter, OrderedDict, defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from operator import attrgetter
+from itertools import islice
+from array import array
+from bisect import bisect_left, bisect_right, insort
 import uuid
+from sys import intern
+import asyncio
+import tempfile
+import base64
 import csv
+import gc
+import heapq
 import io
-import random
+import json
+import zlib
 import os
+import re
+import threading
+import time
 
-app = FastAPI(title="MyImpact API", version="1.0.0")
+import numpy as np
+import orjson
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+from repository import JournalRepository, MemoryRepository, SQLiteRepository, StaleReplica
+
+def json_default(value):
+    if isinstance(value, (BaseModel, Record)):
+        return value.model_dump()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(ORJSONResponse):
+    """orjson-rendered JSON that also encodes Pydantic models (enums and
+    numpy values are native to orjson)."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content, default=json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+def fast_json(content) -> FastJSONResponse:
+    """Return list endpoints through this to skip FastAPI's jsonable_encoder pass."""
+    return FastJSONResponse(content)
+
+
+app = FastAPI(title="MyImpact API", version="1.0.0", default_response_class=FastJSONResponse)
 
 # ============== ENUMS ==============
 class ProgramType(str, Enum):
@@ -56,6 +93,7 @@ class AuditAction(str, Enum):
     confirm = "confirm"
     reject = "reject"
     flag = "flag"
+    create = "create"
     edit = "edit"
     export = "export"
 
@@ -143,6 +181,8 @@ class AuditEvent(BaseModel):
     action: AuditAction
     timestamp: str
     notes: str
+    seq: int = 0  # assigned by AuditLog.append
+    term_id: Optional[str] = None
 
 class Settings(BaseModel):
     university_name: str = os.getenv("UNIVERSITY_NAME", "Columbia University")
@@ -160,23 +200,1870 @@ class FlagRequest(BaseModel):
     request_id: str
     reason: str
 
+class VerificationAction(str, Enum):
+    confirm = "confirm"
+    reject = "reject"
+    flag = "flag"
+
+class BulkVerificationItem(BaseModel):
+    request_id: str
+    action: VerificationAction
+    # RejectionReason value for reject, free text for flag, unused for confirm
+    reason: Optional[str] = None
+
+# One bulk request runs in a single writer transaction, which blocks every
+# other write while it is applied
+MAX_BULK_ITEMS = 500
+
+class BulkVerificationRequest(BaseModel):
+    items: List[BulkVerificationItem] = Field(..., max_length=MAX_BULK_ITEMS)
+
+    @field_validator("items")
+    @classmethod
+    def unique_request_ids(cls, items: List[BulkVerificationItem]) -> List[BulkVerificationItem]:
+        seen, duplicates = set(), []
+        for item in items:
+            if item.request_id in seen:
+                duplicates.append(item.request_id)
+            seen.add(item.request_id)
+        if duplicates:
+            raise ValueError(f"Duplicate request_id: {', '.join(dict.fromkeys(duplicates))}")
+        return items
+
 class UpdateSettingsRequest(BaseModel):
     university_name: str
     dashboard_title: Optional[str] = None
 
+# ============== STORE RECORDS ==============
+# The DataStore keeps logs, requests and audit events as slotted records
+# rather than Pydantic models: ids and dates are interned, enums are shared
+# members and timestamps are epoch microseconds. Attribute names match the
+# models, and records convert back (to_model / model_dump) only when a
+# response or a persisted row is rendered.
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+EPOCH_ORDINAL = EPOCH.toordinal()
+MICROSECOND = timedelta(microseconds=1)
+
+
+# (string, packed) of the last call: a bulk import stamps every row with the
+# same string object
+_last_packed = (None, None)
+
+
+def pack_timestamp(value):
+    """ISO-8601 UTC string -> int microseconds since the epoch.
+
+    Only the exact shape isoformat() gives an aware UTC datetime is packed,
+    so unpacking always renders the original string; anything else (other
+    offsets, "Z", naive times) is kept as-is.
+    """
+    global _last_packed
+    last = _last_packed
+    if value is last[0]:
+        return last[1]
+    if not (type(value) is str and value.endswith("+00:00") and value[10:11] == "T" and (
+        len(value) == 25 or (len(value) == 32 and value[19] == "." and value[20:26] != "000000")
+    )):
+        return value
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    # Field arithmetic is about twice as fast as (parsed - EPOCH) // MICROSECOND
+    seconds = parsed.hour * 3600 + parsed.minute * 60 + parsed.second
+    packed = ((parsed.toordinal() - EPOCH_ORDINAL) * 86400 + seconds) * 1000000 + parsed.microsecond
+    _last_packed = (value, packed)
+    return packed
+
+
+def unpack_timestamp(value) -> str:
+    if type(value) is int:
+        return (EPOCH + value * MICROSECOND).isoformat()
+    return value
+
+
+def packed_timestamp(slot: str) -> property:
+    return property(
+        lambda self: unpack_timestamp(getattr(self, slot)),
+        lambda self, value: setattr(self, slot, pack_timestamp(value)),
+    )
+
+
+def interned(value: Optional[str]) -> Optional[str]:
+    return intern(value) if value is not None else None
+
+
+def enum_member(enum: type, value):
+    """enum(value), skipping EnumMeta.__call__ for known values (members
+    included, as str enums hash like their values)."""
+    return enum._value2member_map_.get(value) or enum(value)
+
+
+class Record:
+    __slots__ = ()
+    model: type = BaseModel
+    fields: tuple = ()
+    enum_fields: tuple = ()
+
+    @classmethod
+    def from_model(cls, model: BaseModel):
+        return cls(**model.__dict__)
+
+    def to_model(self) -> BaseModel:
+        return self.model.model_construct(**{f: getattr(self, f) for f in self.fields})
+
+    def model_dump(self, mode: str = "python") -> dict:
+        """What to_model().model_dump(mode=mode) returns, without building the model."""
+        row = {field: getattr(self, field) for field in self.fields}
+        if mode == "json":
+            for field in self.enum_fields:
+                row[field] = row[field].value
+        return row
+
+    @classmethod
+    def capture(cls, records: List["Record"], preserved: Optional[dict] = None) -> list:
+        """Slot values of each record (in `fields` order), as tuples.
+
+        `preserved` maps id(record) to values saved before the record was
+        updated in place; it is checked after reading the record, so an
+        update that starts mid-read is still caught.
+        """
+        values = map(attrgetter(*cls.__slots__), records)
+        if not preserved:
+            return list(values)
+        return [preserved.get(id(record), row) for record, row in zip(records, values)]
+
+    @classmethod
+    def render(cls, values: list) -> list:
+        """capture() tuples with enum members replaced by their values.
+
+        Timestamps stay packed (the constructors accept either form), so
+        loading them back skips parsing.
+        """
+        if not values:
+            return values
+        columns = list(zip(*values))
+        for field in cls.enum_fields:
+            index = cls.fields.index(field)
+            columns[index] = [member.value for member in columns[index]]
+        return list(zip(*columns))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{f}={getattr(self, f)!r}' for f in self.fields)})"
+
+
+class LogRecord(Record):
+    __slots__ = ("log_id", "student_id", "program_id", "date", "hours", "description",
+                 "evidence_tier", "status", "_created_at", "_updated_at")
+    model = ServiceLog
+    fields = tuple(ServiceLog.model_fields)
+    enum_fields = ("evidence_tier", "status")
+    created_at = packed_timestamp("_created_at")
+    updated_at = packed_timestamp("_updated_at")
+
+    def __init__(self, log_id, student_id, program_id, date, hours, description,
+                 evidence_tier, status, created_at, updated_at):
+        self.log_id = log_id
+        self.student_id = intern(student_id)
+        self.program_id = intern(program_id)
+        self.date = intern(date)
+        self.hours = float(hours)
+        self.description = description
+        self.evidence_tier = enum_member(EvidenceTier, evidence_tier)
+        self.status = enum_member(LogStatus, status)
+        self._created_at = pack_timestamp(created_at)
+        # New logs share one timestamp string for both
+        self._updated_at = self._created_at if updated_at is created_at else pack_timestamp(updated_at)
+
+
+class RequestRecord(Record):
+    __slots__ = ("request_id", "log_id", "student_id", "program_id", "status",
+                 "assignee_admin_id", "ngo_name", "action_description")
+    model = VerificationRequest
+    fields = tuple(VerificationRequest.model_fields)
+    enum_fields = ("status",)
+
+    def __init__(self, request_id, log_id, student_id, program_id, status,
+                 assignee_admin_id=None, ngo_name=None, action_description=None):
+        self.request_id = request_id
+        self.log_id = log_id
+        self.student_id = intern(student_id)
+        self.program_id = intern(program_id)
+        self.status = enum_member(VerificationStatus, status)
+        self.assignee_admin_id = interned(assignee_admin_id)
+        self.ngo_name = interned(ngo_name)
+        self.action_description = action_description
+
+
+class AuditRecord(Record):
+    __slots__ = ("event_id", "actor_id", "actor_role", "entity_type", "entity_id",
+                 "action", "_timestamp", "notes", "seq", "term_id")
+    model = AuditEvent
+    fields = tuple(AuditEvent.model_fields)
+    enum_fields = ("actor_role", "entity_type", "action")
+    timestamp = packed_timestamp("_timestamp")
+
+    def __init__(self, event_id, actor_id, actor_role, entity_type, entity_id,
+                 action, timestamp, notes, seq=0, term_id=None):
+        self.event_id = event_id
+        self.actor_id = intern(actor_id)
+        self.actor_role = enum_member(ActorRole, actor_role)
+        self.entity_type = enum_member(EntityType, entity_type)
+        self.entity_id = entity_id
+        self.action = enum_member(AuditAction, action)
+        self._timestamp = pack_timestamp(timestamp)
+        self.notes = notes
+        self.seq = seq
+        self.term_id = interned(term_id)
+
 # ============== IN-MEMORY DATA STORE ==============
-class DataStore:
+class LogColumns:
+    """Columnar copy of the service logs for vectorized per-student aggregation.
+
+    Ids are int-coded (student, program, status) and hours kept as float64;
+    arrays grow by doubling, and rows are appended in log creation order so
+    grouped sums match a sequential sum over the same logs.
+    """
+
+    STATUS_CODES = {status: code for code, status in enumerate(LogStatus)}
+    RISK_STATUSES = np.array(["on_track", "on_track", "needs_attention", "at_risk"])
+
+    def __init__(self, capacity: int = 1024):
+        self.size = 0
+        self.student_codes: dict[str, int] = {}
+        self.student_ids: List[str] = []  # code -> student_id
+        self.program_codes: dict[str, int] = {}
+        self.row_of: dict[str, int] = {}
+        self.student = np.zeros(capacity, dtype=np.int32)
+        self.program = np.zeros(capacity, dtype=np.int32)
+        self.status = np.zeros(capacity, dtype=np.int8)
+        self.hours = np.zeros(capacity, dtype=np.float64)
+
+    def student_code(self, student_id: str) -> int:
+        code = self.student_codes.get(student_id)
+        if code is None:
+            code = self.student_codes[student_id] = len(self.student_ids)
+            self.student_ids.append(student_id)
+        return code
+
+    def program_code(self, program_id: str) -> int:
+        return self.program_codes.setdefault(program_id, len(self.program_codes))
+
+    def append(self, log: LogRecord):
+        self.extend((log,))
+
+    def extend(self, logs):
+        """Append a batch of logs: codes are collected in lists and written
+        with one slice assignment per column."""
+        start, end = self.size, self.size + len(logs)
+        if end > len(self.hours):
+            capacity = max(2 * len(self.hours), end)
+            for name in ("student", "program", "status", "hours"):
+                column = getattr(self, name)
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[:self.size] = column[:self.size]
+                setattr(self, name, grown)
+        row_of, student_codes, program_codes = self.row_of, self.student_codes, self.program_codes
+        status_codes = self.STATUS_CODES
+        students, programs = [], []
+        for row, log in enumerate(logs, start):
+            row_of[log.log_id] = row
+            code = student_codes.get(log.student_id)
+            students.append(code if code is not None else self.student_code(log.student_id))
+            code = program_codes.get(log.program_id)
+            programs.append(code if code is not None else self.program_code(log.program_id))
+        self.student[start:end] = students
+        self.program[start:end] = programs
+        self.status[start:end] = [status_codes[log.status] for log in logs]
+        self.hours[start:end] = [log.hours for log in logs]
+        self.size = end
+
+    def set_status(self, log_id: str, status: LogStatus):
+        self.status[self.row_of[log_id]] = self.STATUS_CODES[status]
+
+    def student_stats(self, program_ids: Optional[List[str]], required_hours: float) -> dict:
+        """Hours, progress and risk for every student code in one pass.
+
+        `program_ids` restricts the rows to those programs (None = all logs).
+        Returns a dict of arrays indexed by student code; the *_count arrays
+        tell callers which sums were taken over no rows at all.
+        """
+        n = len(self.student_codes)
+        student = self.student[:self.size]
+        status = self.status[:self.size]
+        hours = self.hours[:self.size]
+        if program_ids is not None:
+            in_scope = np.zeros(len(self.program_codes), dtype=bool)
+            codes = [self.program_codes[pid] for pid in program_ids if pid in self.program_codes]
+            in_scope[codes] = True
+            mask = in_scope[self.program[:self.size]]
+            student, status, hours = student[mask], status[mask], hours[mask]
+
+        confirmed = status == self.STATUS_CODES[LogStatus.confirmed]
+        pending = status == self.STATUS_CODES[LogStatus.pending]
+        total_hours = np.bincount(student, weights=hours, minlength=n)
+        verified_hours = np.bincount(student[confirmed], weights=hours[confirmed], minlength=n)
+        pending_hours = np.bincount(student[pending], weights=hours[pending], minlength=n)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percent_verified = np.where(total_hours > 0, verified_hours / total_hours * 100, 0.0)
+        if required_hours > 0:
+            progress = verified_hours / required_hours * 100
+        else:
+            progress = np.zeros(n)
+        # Same tiers as calculate_progress_risk
+        risk_score = np.select(
+            [
+                progress >= 75,
+                progress >= RISK_THRESHOLDS["on_track"],
+                progress >= RISK_THRESHOLDS["needs_attention"],
+            ],
+            [0, 1, 2],
+            default=3,
+        )
+        return {
+            "total_hours": total_hours,
+            "verified_hours": verified_hours,
+            "pending_hours": pending_hours,
+            "log_count": np.bincount(student, minlength=n),
+            "verified_count": np.bincount(student[confirmed], minlength=n),
+            "pending_count": np.bincount(student[pending], minlength=n),
+            "percent_verified": percent_verified,
+            "progress": progress,
+            "risk_score": risk_score,
+            "risk_status": self.RISK_STATUSES[risk_score],
+        }
+
+
+class AuditLog:
+    """Append-only audit event store.
+
+    Each event gets a sequence number (1-based position in the log).
+    Per-entity/actor/action/term indexes hold ascending seq lists, so
+    filtered and cursor-paginated queries bisect straight to the page.
+    """
+
+    def __init__(self):
+        self.events: List[AuditRecord] = []
+        self.by_entity: dict[str, List[int]] = defaultdict(list)
+        self.by_actor: dict[str, List[int]] = defaultdict(list)
+        self.by_action: dict[AuditAction, List[int]] = defaultdict(list)
+        self.by_term: dict[str, List[int]] = defaultdict(list)
+        # entity_id -> first confirm event, so exports can resolve the verifier directly
+        self.confirm_events: dict[str, AuditRecord] = {}
+
+    def __len__(self):
+        return len(self.events)
+
+    def __iter__(self):
+        return iter(self.events)
+
+    def append(self, event: AuditRecord) -> AuditRecord:
+        event.seq = len(self.events) + 1
+        self.events.append(event)
+        self.by_entity[event.entity_id].append(event.seq)
+        self.by_actor[event.actor_id].append(event.seq)
+        self.by_action[event.action].append(event.seq)
+        if event.term_id:
+            self.by_term[event.term_id].append(event.seq)
+        if event.action == AuditAction.confirm:
+            self.confirm_events.setdefault(event.entity_id, event)
+        return event
+
+    def get(self, seq: int) -> AuditRecord:
+        return self.events[seq - 1]
+
+    def query(self, entity_id: Optional[str] = None, actor_id: Optional[str] = None,
+              action: Optional[AuditAction] = None, term_id: Optional[str] = None,
+              after_seq: Optional[int] = None, before_seq: Optional[int] = None,
+              limit: int = 100) -> List[AuditRecord]:
+        """One page of events matching every given filter.
+
+        With `after_seq` the page is the oldest events after that cursor, in
+        ascending order; otherwise it is the newest events before
+        `before_seq` (default: end of log), newest first.
+        """
+        candidates = []
+        if entity_id is not None:
+            candidates.append(self.by_entity.get(entity_id, []))
+        if actor_id is not None:
+            candidates.append(self.by_actor.get(actor_id, []))
+        if action is not None:
+            candidates.append(self.by_action.get(action, []))
+        if term_id is not None:
+            candidates.append(self.by_term.get(term_id, []))
+        seqs = min(candidates, key=len) if candidates else range(1, len(self.events) + 1)
+
+        def matches(event: AuditRecord) -> bool:
+            return (
+                (entity_id is None or event.entity_id == entity_id)
+                and (actor_id is None or event.actor_id == actor_id)
+                and (action is None or event.action == action)
+                and (term_id is None or event.term_id == term_id)
+            )
+
+        page = []
+        if limit <= 0:
+            return page
+        if after_seq is not None:
+            for i in range(bisect_right(seqs, after_seq), len(seqs)):
+                event = self.get(seqs[i])
+                if matches(event):
+                    page.append(event)
+                    if len(page) == limit:
+                        break
+        else:
+            end = bisect_left(seqs, before_seq) if before_seq is not None else len(seqs)
+            for i in range(end - 1, -1, -1):
+                event = self.get(seqs[i])
+                if matches(event):
+                    page.append(event)
+                    if len(page) == limit:
+                        break
+        return page
+
+    def latest_for_entities(self, entity_ids, limit: int = 10) -> List[AuditRecord]:
+        """The last `limit` events across several entities, oldest first."""
+        seqs = []
+        for entity_id in entity_ids:
+            seqs.extend(self.by_entity.get(entity_id, [])[-limit:])
+        return [self.get(seq) for seq in sorted(seqs)[-limit:]]
+
+
+class ResponseCache:
+    """Bounded LRU of computed responses with dependency tags.
+
+    Entries are stored with tags such as ("program", id) or ("term", id);
+    invalidating a tag drops only the entries that depend on it. SHARED is
+    carried by every entry and invalidated by writes to terms, programs,
+    students and settings, which any response may show. ANY is invalidated
+    by every write, for entries no narrower tag covers.
+    """
+
+    SHARED = ("shared",)
+    ANY = ("any",)
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.entries: OrderedDict = OrderedDict()  # key -> (value, tags)
+        self.keys_by_tag: dict[tuple, set] = defaultdict(set)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Readers touch the LRU order too, so every access is locked
+        self.lock = threading.RLock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, tags):
+        tags = (*tags, self.SHARED)
+        with self.lock:
+            self._discard(key)
+            self.entries[key] = (value, tags)
+            for tag in tags:
+                self.keys_by_tag[tag].add(key)
+            while len(self.entries) > self.maxsize:
+                self._discard(next(iter(self.entries)))
+                self.evictions += 1
+
+    def _discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        for tag in entry[1]:
+            keys = self.keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.keys_by_tag[tag]
+        return True
+
+    def invalidate(self, *tags):
+        with self.lock:
+            for tag in tags:
+                for key in list(self.keys_by_tag.get(tag, ())):
+                    if self._discard(key):
+                        self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+SEARCH_TOKEN = re.compile(r"\w+")
+
+def tokenize(text: str) -> List[str]:
+    return SEARCH_TOKEN.findall(text.lower())
+
+def posting_contains(posting, doc: int) -> bool:
+    i = bisect_left(posting, doc)
+    return i < len(posting) and posting[i] == doc
+
+def descending(posting, before: Optional[int]):
+    """Doc numbers of one ascending posting below `before`, newest first."""
+    end = len(posting) if before is None else bisect_left(posting, before)
+    for i in range(end - 1, -1, -1):
+        yield posting[i]
+
+def descending_union(postings, before: Optional[int]):
+    """Distinct doc numbers in any of the ascending `postings`, newest
+    first, starting below `before` (None: from the newest)."""
+    streams = [descending(posting, before) for posting in postings]
+    if len(streams) == 1:
+        yield from streams[0]
+        return
+    last = None
+    for doc in heapq.merge(*streams, reverse=True):
+        if doc != last:
+            yield doc
+            last = doc
+
+
+class TextIndex:
+    """Inverted index over the text of one kind of record.
+
+    Documents are numbered in insertion order and each token's posting list
+    is an ascending array of document numbers, so the newest matches are
+    read off the end and resuming after a cursor is one bisect. The sorted
+    `vocabulary` answers prefix lookups; tokens first seen in a write are
+    merged into it by refresh() when the write commits, one sort rather
+    than an insert per token. Re-adding an id retires the document it had
+    before.
+    """
+
+    # A prefix expands to at most this many tokens, nearest completions first
+    MAX_EXPANSIONS = 50
+    # Texts repeat a lot (program names, stock descriptions), so recent
+    # tokenizations are kept; the cache is simply emptied when full
+    TOKEN_CACHE_SIZE = 4096
+
+    def __init__(self):
+        self.ids: List[str] = []  # doc number -> entity id
+        self.doc_of: dict[str, int] = {}
+        self.postings: dict[str, array] = {}
+        self.vocabulary: List[str] = []
+        self.new_tokens: List[str] = []
+        self.retired: set = set()
+        self.token_cache: dict[str, tuple] = {}
+
+    def __len__(self):
+        return len(self.doc_of)
+
+    def add(self, entity_id: str, text: str):
+        old = self.doc_of.get(entity_id)
+        if old is not None:
+            self.retired.add(old)
+        doc = self.doc_of[entity_id] = len(self.ids)
+        self.ids.append(entity_id)
+        tokens = self.token_cache.get(text)
+        if tokens is None:
+            if len(self.token_cache) >= self.TOKEN_CACHE_SIZE:
+                self.token_cache.clear()
+            tokens = self.token_cache[text] = tuple(set(tokenize(text)))
+        postings = self.postings
+        for token in tokens:
+            posting = postings.get(token)
+            if posting is None:
+                posting = postings[token] = array("i")
+                self.new_tokens.append(token)
+            posting.append(doc)
+
+    def refresh(self):
+        if self.new_tokens:
+            # Two sorted runs, which the sort merges in linear time
+            self.new_tokens.sort()
+            self.vocabulary.extend(self.new_tokens)
+            self.vocabulary.sort()
+            self.new_tokens.clear()
+
+    def completions(self, prefix: str) -> List[str]:
+        """Vocabulary tokens that extend `prefix` (excluding itself)."""
+        vocabulary = self.vocabulary
+        tokens = []
+        for i in range(bisect_right(vocabulary, prefix), len(vocabulary)):
+            if not vocabulary[i].startswith(prefix) or len(tokens) == self.MAX_EXPANSIONS:
+                break
+            tokens.append(vocabulary[i])
+        return tokens
+
+    def plans(self, tokens: List[str]) -> list:
+        """(match, groups, exclude) for a query, best match first.
+
+        Every token but the last must appear as is; the last may also be a
+        prefix. A document matches a plan if it is in at least one posting
+        of every group and not in `exclude`.
+        """
+        *whole, last = tokens
+        groups = []
+        for token in whole:
+            posting = self.postings.get(token)
+            if posting is None:
+                return []
+            groups.append([posting])
+        plans = []
+        exact = self.postings.get(last)
+        if exact is not None:
+            plans.append(("exact", [*groups, [exact]], None))
+        completions = [self.postings[token] for token in self.completions(last)]
+        if completions:
+            plans.append(("prefix", [*groups, completions], exact))
+        return plans
+
+    def matches(self, groups, exclude, before: Optional[int] = None):
+        """Matching doc numbers below `before`, newest first.
+
+        Walks the union of the smallest group and bisects into the others,
+        so a page of a common term costs a page's worth of steps.
+        """
+        driver = min(groups, key=lambda group: sum(map(len, group)))
+        others = [group for group in groups if group is not driver]
+        retired = self.retired
+        for doc in descending_union(driver, before):
+            if doc in retired or (exclude is not None and posting_contains(exclude, doc)):
+                continue
+            if all(any(posting_contains(posting, doc) for posting in group) for group in others):
+                yield doc
+
+
+class SearchIndex:
+    """A TextIndex per searchable record type, in ranking order."""
+
+    TYPES = ("student", "program", "request", "log")
+    MATCHES = ("exact", "prefix")
+
+    def __init__(self):
+        self.indexes = {kind: TextIndex() for kind in self.TYPES}
+
+    def add(self, kind: str, entity_id: str, text: Optional[str]):
+        if text:
+            self.indexes[kind].add(entity_id, text)
+
+    def refresh(self):
+        for index in self.indexes.values():
+            index.refresh()
+
+    def query(self, text: str, kinds, accept, limit: int, after: Optional[tuple] = None):
+        """One page of (kind, entity id, match) hits and the next cursor key.
+
+        Hits are ordered by type, then exact before prefix matches, then
+        newest first; `accept(kind, entity_id)` applies any other filter.
+        `after` is a cursor key (type, match, doc) from a previous page.
+        """
+        tokens = tokenize(text)
+        page = []
+        if not tokens:
+            return page, None
+        start = (self.TYPES.index(after[0]), self.MATCHES.index(after[1])) if after else (-1, -1)
+        for kind in kinds:
+            kind_rank = self.TYPES.index(kind)
+            if kind_rank < start[0]:
+                continue
+            index = self.indexes[kind]
+            for match, groups, exclude in index.plans(tokens):
+                position = (kind_rank, self.MATCHES.index(match))
+                if position < start:
+                    continue
+                before = after[2] if position == start else None
+                for doc in index.matches(groups, exclude, before):
+                    entity_id = index.ids[doc]
+                    if accept(kind, entity_id):
+                        page.append((kind, entity_id, match))
+                        if len(page) == limit:
+                            return page, (kind, match, doc)
+        return page, None
+
+
+NEAR_DUPLICATE_SIMILARITY = 0.7
+MINHASH_PERMUTATIONS = 32
+SHINGLE_SIZE = 3
+# Odd multipliers and offsets of the (a * x + b) mod 2**64 hash family
+_MINHASH_RNG = np.random.default_rng(20260115)
+MINHASH_A = _MINHASH_RNG.integers(1, 2**63, MINHASH_PERMUTATIONS, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+MINHASH_B = _MINHASH_RNG.integers(0, 2**63, MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+# Texts per minhash_many() step, bounding its permutations x shingles matrix
+MINHASH_CHUNK = 2048
+
+def minhash_many(texts: List[str]) -> np.ndarray:
+    """MinHash signatures of normalized texts' character shingles, one
+    uint32 row (top bits of each minimum) per text.
+
+    Texts are hashed in chunks with one matrix product and one
+    minimum.reduceat per chunk rather than numpy calls per text.
+    """
+    signatures = np.empty((len(texts), MINHASH_PERMUTATIONS), dtype=np.uint32)
+    for start in range(0, len(texts), MINHASH_CHUNK):
+        hashes, offsets = [], []
+        for text in texts[start:start + MINHASH_CHUNK]:
+            offsets.append(len(hashes))
+            # str hashes are salted per process, which is fine for an in-memory index
+            hashes.extend({hash(text[i:i + SHINGLE_SIZE]) for i in range(max(len(text) - SHINGLE_SIZE + 1, 1))})
+        hashes = np.array(hashes, dtype=np.int64).view(np.uint64)
+        minima = np.minimum.reduceat(MINHASH_A[:, None] * hashes[None, :] + MINHASH_B[:, None], offsets, axis=1)
+        signatures[start:start + len(offsets)] = (minima.T >> np.uint64(32)).astype(np.uint32)
+    return signatures
+
+
+class DuplicateBlock:
+    """The logs of one (student, date) with a MinHash signature row and an
+    exact-repeat fingerprint each, so a log is checked against the whole
+    block with two vectorized comparisons."""
+
+    __slots__ = ("logs", "signatures", "fingerprints")
+
+    def __init__(self):
+        self.logs: List[LogRecord] = []
+        self.signatures = np.empty((2, MINHASH_PERMUTATIONS), dtype=np.uint32)
+        self.fingerprints = np.empty(2, dtype=np.int64)
+
+    def add(self, log: LogRecord, normalized: str, signature: np.ndarray):
+        n = len(self.logs)
+        if n == len(self.fingerprints):
+            self.signatures = np.concatenate([self.signatures, np.empty_like(self.signatures)])
+            self.fingerprints = np.concatenate([self.fingerprints, np.empty_like(self.fingerprints)])
+        self.signatures[n] = signature
+        self.fingerprints[n] = hash((log.program_id, log.hours, normalized))
+        self.logs.append(log)
+
+    def matches(self, position: int):
+        """Positions before `position` that repeat it exactly, and those
+        whose signatures agree on NEAR_DUPLICATE_SIMILARITY of positions."""
+        exact = (self.fingerprints[:position] == self.fingerprints[position]).nonzero()[0]
+        agreement = (self.signatures[:position] == self.signatures[position]).sum(axis=1)
+        near = (agreement >= NEAR_DUPLICATE_SIMILARITY * MINHASH_PERMUTATIONS).nonzero()[0]
+        return exact, near
+
+
+class DuplicateIndex:
+    """Candidate duplicates among service logs.
+
+    A duplicate is the same student reporting the same day twice, so logs
+    are blocked by a hash of (student, date) and a log is only compared
+    with its own block, found with one dict lookup however many logs are
+    stored. A block with a single log is just that record; a second log
+    turns it into a DuplicateBlock, where a log repeats an earlier one
+    exactly (same program, hours and normalized description) or nearly
+    (MinHash signatures of the descriptions agree on at least
+    NEAR_DUPLICATE_SIMILARITY of positions, an estimate of their shingles'
+    Jaccard similarity).
+    """
+
+    # Descriptions repeat, so normalized texts and signatures are cached
+    # by description; the cache is emptied when full
+    CACHE_SIZE = 4096
+
+    def __init__(self):
+        # block key -> the block's only LogRecord, or a DuplicateBlock
+        self.blocks: dict[int, object] = {}
+        self.texts: dict[str, tuple] = {}  # description -> (normalized, signature)
+
+    def add(self, log: LogRecord):
+        self.add_many((log,))
+
+    def add_many(self, logs):
+        blocks = self.blocks
+        joined = []  # (DuplicateBlock, log) in arrival order
+        for log in logs:
+            key = hash((log.student_id, log.date))
+            block = blocks.get(key)
+            if block is None:
+                blocks[key] = log
+                continue
+            if type(block) is not DuplicateBlock:
+                first, block = block, DuplicateBlock()
+                joined.append((block, first))
+                blocks[key] = block
+            joined.append((block, log))
+        if not joined:
+            return
+        # Signatures only for logs that share a block, computed in one go
+        texts, batch = self.texts, {}
+        for _, log in joined:
+            if log.description not in texts and log.description not in batch:
+                batch[log.description] = " ".join(tokenize(log.description))
+        if batch:
+            signatures = minhash_many(list(batch.values()))
+            batch = {d: (normalized, signatures[i]) for i, (d, normalized) in enumerate(batch.items())}
+        for block, log in joined:
+            block.add(log, *(batch.get(log.description) or texts[log.description]))
+        if len(texts) + len(batch) > self.CACHE_SIZE:
+            texts.clear()
+        if len(batch) <= self.CACHE_SIZE:
+            texts.update(batch)
+
+    def candidates(self, log: LogRecord) -> tuple:
+        """(exact, near) earlier logs of `log`'s block, oldest first."""
+        block = self.blocks.get(hash((log.student_id, log.date)))
+        if type(block) is not DuplicateBlock:
+            return (), ()
+        position = block.logs.index(log)
+        exact, near = block.matches(position)
+        logs = block.logs
+        # Same-hash blocks of other students/dates are told apart here
+        same = lambda other: other.student_id == log.student_id and other.date == log.date
+        return (
+            [logs[i] for i in exact if same(logs[i])],
+            [logs[i] for i in near if same(logs[i])],
+        )
+
+
+class RiskIndex:
+    """Students of one term ordered by verified hours, i.e. from highest to
+    lowest risk, both overall and within each of the term's programs.
+
+    Members are the students enrolled in a term program or with a log in
+    one. Writes only record the new hours and memberships and mark the
+    student dirty; refresh(), run as each write transaction commits, moves
+    the dirty students within the ranked lists by bisection, or re-sorts
+    them outright when a bulk load changed a large share of the students.
+    """
+
+    # Re-sort instead of patching once more than 1/REBUILD_RATIO of the
+    # students changed, as every patch is a list insert and delete
+    REBUILD_RATIO = 32
+
+    def __init__(self):
+        self.hours: dict[str, float] = {}  # student_id -> verified hours in the term
+        self.programs: dict[str, List[str]] = {}  # student_id -> term programs they belong to
+        # program_id (None = whole term) -> ascending [(verified hours, student_id)]
+        self.ranked: dict[Optional[str], list] = {None: []}
+        # student_id -> (key, program ids) as currently placed in `ranked`
+        self.placed: dict[str, tuple] = {}
+        self.dirty: set = set()
+
+    def add_member(self, student_id: str, program_id: str):
+        programs = self.programs.get(student_id)
+        if programs is None:
+            programs = self.programs[student_id] = []
+            self.hours[student_id] = 0
+            self.dirty.add(student_id)
+        if program_id not in programs:
+            programs.append(program_id)
+            self.dirty.add(student_id)
+
+    def add_hours(self, student_id: str, hours: float):
+        self.hours[student_id] += hours
+        self.dirty.add(student_id)
+
+    def refresh(self):
+        if not self.dirty:
+            return
+        if len(self.dirty) * self.REBUILD_RATIO > len(self.hours):
+            self.rebuild()
+            return
+        ranked = self.ranked
+        for student_id in self.dirty:
+            placed = self.placed.get(student_id)
+            if placed is not None:
+                key, programs = placed
+                for program_id in (None, *programs):
+                    entries = ranked[program_id]
+                    del entries[bisect_left(entries, (key, student_id))]
+            key, programs = round(self.hours[student_id], 6), tuple(self.programs[student_id])
+            for program_id in (None, *programs):
+                entries = ranked.get(program_id)
+                if entries is None:
+                    entries = ranked[program_id] = []
+                insort(entries, (key, student_id))
+            self.placed[student_id] = (key, programs)
+        self.dirty.clear()
+
+    def rebuild(self):
+        entries = sorted((round(hours, 6), student_id) for student_id, hours in self.hours.items())
+        ranked = {None: entries}
+        placed = {}
+        for entry in entries:
+            programs = tuple(self.programs[entry[1]])
+            for program_id in programs:
+                by_program = ranked.get(program_id)
+                if by_program is None:
+                    by_program = ranked[program_id] = []
+                by_program.append(entry)
+            placed[entry[1]] = (entry[0], programs)
+        self.ranked, self.placed = ranked, placed
+        self.dirty.clear()
+
+    def top(self, limit: int, program_id: Optional[str] = None) -> list:
+        """The `limit` members with the fewest verified hours, as
+        (hours, student_id) pairs, ties broken by student id."""
+        return self.ranked.get(program_id, [])[:limit]
+
+    def count(self, program_id: Optional[str] = None) -> int:
+        return len(self.ranked.get(program_id, ()))
+
+
+class Granularity(str, Enum):
+    day = "day"
+    week = "week"
+
+
+# Date string -> proleptic ordinal; logs share a few hundred distinct dates
+_day_ordinals: dict = {}
+
+
+def day_ordinal(value) -> Optional[int]:
+    """Ordinal of a YYYY-MM-DD date, or of the UTC day of a (packed or ISO)
+    timestamp; None if it doesn't parse."""
+    if type(value) is int:
+        return value // 86_400_000_000 + EPOCH_ORDINAL
+    ordinal = _day_ordinals.get(value)
+    if ordinal is None:
+        try:
+            ordinal = datetime.strptime(value[:10], "%Y-%m-%d").toordinal()
+        except (TypeError, ValueError):
+            return None
+        _day_ordinals[value] = ordinal
+    return ordinal
+
+
+def period_start(ordinal: int, granularity: Granularity) -> int:
+    """First day of the day/week (Monday-based) containing `ordinal`."""
+    if granularity == Granularity.week:
+        return ordinal - (ordinal - 1) % 7  # ordinal 1 (0001-01-01) is a Monday
+    return ordinal
+
+
+class TimeSeries:
+    """Per-day and per-week totals of one term's logs by program and
+    evidence tier, kept up to date by TermAggregate.
+
+    Hours and log counts go to the period of the log's date; confirmations
+    to the period the log was confirmed in (its updated_at), so they count
+    the logs currently confirmed, by when they were.
+    """
+
+    FIELDS = ("logged_hours", "verified_hours", "pending_hours", "logs", "confirmations")
+
+    def __init__(self):
+        # granularity -> (program_id, evidence_tier) -> period start -> FIELDS values
+        self.buckets: dict[Granularity, dict[tuple, dict[int, list]]] = {g: {} for g in Granularity}
+
+    def add(self, log: LogRecord, sign: int = 1):
+        day = day_ordinal(log.date)
+        confirmed = log.status == LogStatus.confirmed
+        confirmed_day = day_ordinal(log._updated_at) if confirmed else None
+        pending = log.status == LogStatus.pending
+        key = (log.program_id, log.evidence_tier)
+        hours = sign * log.hours
+        for granularity, buckets in self.buckets.items():
+            periods = buckets.get(key)
+            if periods is None:
+                periods = buckets[key] = {}
+            if day is not None:
+                start = period_start(day, granularity)
+                row = periods.get(start)
+                if row is None:
+                    row = periods[start] = [0, 0, 0, 0, 0]
+                row[0] += hours
+                row[3] += sign
+                if confirmed:
+                    row[1] += hours
+                elif pending:
+                    row[2] += hours
+            if confirmed_day is not None:
+                start = period_start(confirmed_day, granularity)
+                row = periods.get(start)
+                if row is None:
+                    row = periods[start] = [0, 0, 0, 0, 0]
+                row[4] += sign
+
+    def query(self, granularity: Granularity, start: int, end: int, program_id: Optional[str] = None,
+              evidence_tier: Optional[EvidenceTier] = None, group_by: Optional[str] = None) -> dict:
+        """{group: {period start: FIELDS totals}} for periods starting in
+        [start, end]; the group is the program id, tier value or None."""
+        groups: dict = {}
+        for (pid, tier), periods in self.buckets[granularity].items():
+            if (program_id is not None and pid != program_id) or (evidence_tier is not None and tier != evidence_tier):
+                continue
+            group = pid if group_by == "program" else tier.value if group_by == "evidence_tier" else None
+            series = groups.setdefault(group, {})
+            for period, values in periods.items():
+                if start <= period <= end:
+                    totals = series.get(period)
+                    if totals is None:
+                        totals = series[period] = [0, 0, 0, 0, 0]
+                    for i, value in enumerate(values):
+                        totals[i] += value
+        return groups
+
+    def summary(self) -> dict:
+        # Non-empty buckets only, so ones emptied by updates compare equal
+        # to never having existed
+        return {
+            f"{granularity.value}/{pid}/{tier.value}/{datetime.fromordinal(period).date().isoformat()}":
+                [round(v, 6) for v in values]
+            for granularity, buckets in self.buckets.items()
+            for (pid, tier), periods in sorted(buckets.items())
+            for period, values in sorted(periods.items())
+            if values[3] or values[4]
+        }
+
+
+class TermAggregate:
+    """Materialized KPI inputs for one term, updated per log change."""
+
     def __init__(self):
-        random.seed(20260203)
+        # Start from int 0 like sum() so empty terms render as 0, not 0.0
+        self.total_hours = 0
+        self.verified_hours = 0
+        # student_id -> number of logs / confirmed logs in the term
+        self.student_log_counts: Counter = Counter()
+        self.student_verified_counts: Counter = Counter()
+        # program_id -> {"total_hours", "verified_hours", "log_count"}
+        self.program_totals: dict[str, dict] = {}
+        self.risk = RiskIndex()
+        self.timeseries = TimeSeries()
+
+    def add_log(self, log: LogRecord, sign: int = 1):
+        # Called for every log loaded or imported, so no setdefault (which
+        # builds the default dict each time) and one count lookup per student
+        totals = self.program_totals.get(log.program_id)
+        if totals is None:
+            totals = self.program_totals[log.program_id] = {"total_hours": 0, "verified_hours": 0, "log_count": 0}
+        totals["total_hours"] += sign * log.hours
+        totals["log_count"] += sign
+        self.total_hours += sign * log.hours
+        count = self.student_log_counts.get(log.student_id, 0) + sign
+        if count > 0:
+            self.student_log_counts[log.student_id] = count
+        else:
+            self.student_log_counts.pop(log.student_id, None)
+        self.risk.add_member(log.student_id, log.program_id)
+        self.timeseries.add(log, sign)
+        if log.status == LogStatus.confirmed:
+            self.add_verified(log, sign)
+
+    def add_verified(self, log: LogRecord, sign: int = 1):
+        self.verified_hours += sign * log.hours
+        self.program_totals[log.program_id]["verified_hours"] += sign * log.hours
+        self.student_verified_counts[log.student_id] += sign
+        if self.student_verified_counts[log.student_id] <= 0:
+            del self.student_verified_counts[log.student_id]
+        self.risk.add_hours(log.student_id, sign * log.hours)
+
+    @property
+    def active_students(self) -> int:
+        return len(self.student_log_counts)
+
+    @property
+    def students_with_verified(self) -> int:
+        return len(self.student_verified_counts)
+
+    def summary(self) -> dict:
+        return {
+            "total_hours": round(self.total_hours, 6),
+            "verified_hours": round(self.verified_hours, 6),
+            "active_students": self.active_students,
+            "students_with_verified": self.students_with_verified,
+            "program_totals": {
+                pid: {k: round(v, 6) for k, v in totals.items()}
+                for pid, totals in sorted(self.program_totals.items())
+                if totals["log_count"]
+            },
+            "timeseries": self.timeseries.summary(),
+        }
+
+
+READ_ATTEMPTS = 4
+# Rough bytes a loaded store holds per record, indexes included (measured
+# with tracemalloc on synthetic.py data), for the tenant memory budget
+STORE_BASE_BYTES = 128 * 1024
+STORE_BYTES_PER_LOG = 1500  # the log, its verification request and their index entries
+STORE_BYTES_PER_AUDIT_EVENT = 400
+STORE_BYTES_PER_STUDENT = 1000
+LOAD_BATCH_ROWS = 10000
+
+
+@contextmanager
+def gc_paused():
+    """Suspend the cyclic GC around bulk writes.
+
+    Records hold no reference cycles, but allocating millions of them keeps
+    triggering collections that rescan everything already loaded, which
+    roughly doubles bulk load/import time.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def batched(iterable: Iterable, size: int) -> Iterator[list]:
+    """Lists of up to `size` consecutive items (itertools.batched, 3.12+)."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class DataStore:
+    def __init__(self, repository=None):
+        # Where writes are persisted; reads are always served from memory
+        self.repository = repository or MemoryRepository()
         self.terms: dict[str, Term] = {}
         self.programs: dict[str, Program] = {}
         self.students: dict[str, Student] = {}
-        self.service_logs: dict[str, ServiceLog] = {}
-        self.verification_requests: dict[str, VerificationRequest] = {}
-        self.audit_events: List[AuditEvent] = []
+        self.service_logs: dict[str, LogRecord] = {}
+        self.verification_requests: dict[str, RequestRecord] = {}
+        self.audit_events: AuditLog = AuditLog()
         self.settings: Settings = Settings()
-        self._seed_data()
-    
+
+        # Secondary indexes, kept in sync by the add_* / set_*_status helpers below.
+        # Per-key buckets are insertion-ordered dicts keyed by the entity id.
+        self.programs_by_term: dict[str, dict[str, Program]] = defaultdict(dict)
+        self.students_by_program: dict[str, dict[str, Student]] = defaultdict(dict)
+        self.logs_by_student: dict[str, dict[str, LogRecord]] = defaultdict(dict)
+        self.logs_by_program: dict[str, dict[str, LogRecord]] = defaultdict(dict)
+        self.logs_by_term: dict[str, dict[str, LogRecord]] = defaultdict(dict)
+        self.logs_by_status: dict[LogStatus, dict[str, LogRecord]] = defaultdict(dict)
+        self.request_by_log: dict[str, RequestRecord] = {}
+        self.requests_by_student: dict[str, dict[str, RequestRecord]] = defaultdict(dict)
+        self.requests_by_program: dict[str, dict[str, RequestRecord]] = defaultdict(dict)
+        self.requests_by_term: dict[str, dict[str, RequestRecord]] = defaultdict(dict)
+        self.requests_by_status: dict[VerificationStatus, dict[str, RequestRecord]] = defaultdict(dict)
+        # Creation order, used to keep status-driven results in the same order as a full scan
+        self._log_order: dict[str, int] = {}
+        self._request_order: dict[str, int] = {}
+        # Per-term KPI aggregates, see TermAggregate
+        self.term_aggregates: dict[str, TermAggregate] = defaultdict(TermAggregate)
+        self.log_columns = LogColumns()
+        self.search = SearchIndex()
+        self.duplicates = DuplicateIndex()
+        # Data versions for conditional GETs: `version` moves on every write,
+        # `term_versions` on writes to that term's logs/requests/audit events
+        # and `shared_version` on writes every term's responses can show
+        # (terms, programs, students, settings). `epoch` keeps tags from a
+        # previous process from matching after a restart. With a shared
+        # repository these counters differ between processes, so tags use
+        # `change_version`, the change-log position applied here, instead.
+        self.epoch = uuid.uuid4().hex[:8]
+        self.version = 0
+        self.shared_version = 0
+        self.term_versions: dict[str, int] = defaultdict(int)
+        self.change_version: Optional[str] = None
+        self.response_cache = ResponseCache(int(os.getenv("RESPONSE_CACHE_SIZE", "4096")))
+        # model_dump() of each entity, built on first read and dropped
+        # whenever the entity is written (see dump_row)
+        self.log_dumps: dict[str, dict] = {}
+        self.request_dumps: dict[str, dict] = {}
+        self.student_dumps: dict[str, dict] = {}
+
+        # Concurrency: one writer at a time; readers run lock-free and retry
+        # if a write overlapped them (see transaction() and read())
+        self._write_lock = threading.RLock()
+        self._writer: Optional[int] = None
+        self._write_depth = 0
+        self.write_seq = 0  # odd while a write transaction is open
+        self._reader = threading.local()
+        self.read_retries = 0
+        self.read_fallbacks = 0
+        # How find/count/iter queries were answered, by (entity, "index" |
+        # "filtered" | "scan"): a single index bucket, a bucket plus a
+        # per-row filter, or every row; exported by /api/metrics
+        self.lookups: Counter = Counter()
+        # Delta events for this store's /api/changes subscribers
+        self.changes = ChangeFeed(int(os.getenv("CHANGE_FEED_SIZE", "10000")))
+        # While a snapshot renders (see capture): id(record) -> its values
+        # from before its first in-place update since the capture
+        self._preserved: Optional[dict] = None
+
+        stored = self.repository.load()
+        self.repository.attach(self.capture)
+        if stored is None:
+            with self.transaction():
+                # Another process sharing the repository may have seeded it
+                # first; transaction() has just applied that
+                if not self.terms:
+                    self._seed_data()
+                    self.repository.save_settings(self.settings.model_dump())
+        else:
+            self._load(stored)
+        self.change_version = self.repository.change_version()
+        self.repository.follow(self.sync)
+
+    @contextmanager
+    def transaction(self):
+        """Group several writes so the repository commits them atomically.
+
+        Holds the writer lock for the duration; write_seq is bumped on entry
+        and exit of the outermost transaction so readers can detect overlap.
+        """
+        with self._write_lock:
+            outermost = self._write_depth == 0
+            if outermost:
+                self._writer = threading.get_ident()
+                self.write_seq += 1
+            self._write_depth += 1
+            try:
+                with self.repository.transaction():
+                    if outermost:
+                        self._catch_up()
+                    yield
+                    if outermost:
+                        self._refresh_indexes()
+                if outermost:
+                    # Only once memory reflects it, so no tag runs ahead of its body
+                    self.change_version = self.repository.change_version()
+            finally:
+                self._write_depth -= 1
+                if outermost:
+                    self.write_seq += 1
+                    self._writer = None
+
+    def stale(self) -> bool:
+        """Whether another process sharing the repository wrote since the last sync()."""
+        return self.repository.stale()
+
+    def sync(self):
+        """Apply what other processes sharing the repository have written."""
+        with self.transaction():
+            pass
+
+    def _catch_up(self):
+        # Replayed through the public writes so indexes, aggregates and
+        # cached responses follow; the repository already holds the rows
+        batches = self.repository.changes()
+        if not batches:
+            return
+        repository, self.repository = self.repository, MemoryRepository()
+        try:
+            for ops in batches:
+                for op in ops:
+                    self._apply(op)
+        finally:
+            self.repository = repository
+
+    def _apply(self, op: tuple):
+        """One repository op (JournalRepository's format) written by another process."""
+        kind = op[0]
+        if kind in ("save", "saves"):
+            _, table, rows = op
+            rows = [rows] if kind == "save" else rows
+            if table == "terms":
+                for row in rows:
+                    self.add_term(Term(**row))
+            elif table == "programs":
+                for row in rows:
+                    self.add_program(Program(**row, active_students_count=0))
+            elif table == "students":
+                for row in rows:
+                    self.add_student(Student(**row))
+            elif table == "service_logs":
+                self.add_log_rows(rows)
+            else:
+                self.add_request_rows(rows)
+        elif kind == "audit":
+            self.add_audit_rows([op[1]])
+        elif kind == "audits":
+            self.add_audit_rows(op[1])
+        elif kind == "settings":
+            self.settings = Settings(**op[1])
+            self.touch()
+        elif kind == "log_status":
+            _, log_id, status, evidence_tier, updated_at = op
+            self.set_log_status(self.service_logs[log_id], LogStatus(status), updated_at, EvidenceTier(evidence_tier))
+        elif kind == "request_status":
+            _, request_id, status = op
+            self.set_request_status(self.verification_requests[request_id], VerificationStatus(status))
+        elif kind == "events":
+            self.publish(op[1])
+
+    def publish(self, deltas: list):
+        """Send (kind, term_id, data) deltas to /api/changes subscribers, in
+        this process and (on a shared repository) the others."""
+        self.changes.publish(deltas)
+        self.repository.publish(deltas)
+
+    def _refresh_indexes(self):
+        # Indexes that batch their upkeep until a write commits
+        for aggregate in self.term_aggregates.values():
+            aggregate.risk.refresh()
+        self.search.refresh()
+
+    def read(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) against a state no write is half-way through.
+
+        Readers never take the writer lock on the fast path: fn runs
+        optimistically and is re-run if write_seq moved meanwhile (which also
+        covers "dictionary changed size" errors from a concurrent insert).
+        After READ_ATTEMPTS torn runs it falls back to running under the
+        writer lock, so a steady stream of writes can't starve a reader.
+        """
+        reader = self._reader
+        if getattr(reader, "seq", None) is not None or self._writer == threading.get_ident():
+            return fn(*args, **kwargs)  # nested read, or a writer reading its own state
+        try:
+            for _ in range(READ_ATTEMPTS):
+                seq = self.write_seq
+                if seq % 2 == 0:
+                    reader.seq = seq
+                    try:
+                        result = fn(*args, **kwargs)
+                    except Exception:
+                        if self.write_seq == seq:
+                            raise
+                    else:
+                        if self.write_seq == seq:
+                            return result
+                self.read_retries += 1
+                time.sleep(0)  # let the writer finish
+            self.read_fallbacks += 1
+            with self._write_lock:
+                reader.seq = self.write_seq
+                return fn(*args, **kwargs)
+        finally:
+            reader.seq = None
+
+    def dump_row(self, dumps: dict, key: str, model: BaseModel) -> dict:
+        """The cached model_dump() of an entity; callers must not mutate it.
+
+        A dump built by a read that a write overlapped is dropped again right
+        away, so a stale row is never left behind.
+        """
+        row = dumps.get(key)
+        if row is None:
+            row = dumps[key] = model.model_dump()
+            seq = getattr(self._reader, "seq", None)
+            if seq is not None and seq != self.write_seq:
+                dumps.pop(key, None)
+        return row
+
+    def cache_response(self, key, value, tags):
+        """Cache a computed response unless a write overlapped the read that built it.
+
+        The check and the insert share the cache lock with invalidation, so a
+        result either lands before the write's invalidation (and is dropped
+        by it) or is refused here.
+        """
+        seq = getattr(self._reader, "seq", None)
+        with self.response_cache.lock:
+            if seq is None or seq == self.write_seq:
+                self.response_cache.put(key, value, tags)
+
+    def _load(self, stored: dict):
+        with gc_paused():
+            self._load_rows(stored)
+
+    def _load_rows(self, stored: dict):
+        for row in stored["terms"]:
+            self._index_term(Term(**row))
+        for row in stored["programs"]:
+            self._index_program(Program(**row, active_students_count=0))
+        for row in stored["students"]:
+            self._index_student(Student(**row))
+        # Bulk rows were validated when first written, so they go straight
+        # into records without a Pydantic pass (the bulk of boot time), and
+        # are indexed a batch at a time like bulk imports
+        for rows in batched(stored["service_logs"], LOAD_BATCH_ROWS):
+            self._index_logs([LogRecord(**row) for row in rows])
+        for rows in batched(stored["verification_requests"], LOAD_BATCH_ROWS):
+            self._index_requests([RequestRecord(**row) for row in rows])
+        for row in stored["audit_events"]:
+            self.audit_events.append(AuditRecord(**row))
+        if stored["settings"]:
+            self.settings = Settings(**stored["settings"])
+        self._refresh_indexes()
+
+    def capture(self) -> Callable[[], dict]:
+        """Take every record for a repository snapshot.
+
+        Runs inside the write transaction, so it only copies references:
+        Pydantic models are replaced on update, audit events never change
+        once appended, and logs and requests updated in place while the
+        snapshot renders have their captured values preserved first (see
+        _preserve). The returned function renders the snapshot as
+        {table: (columns, value tuples)}, off the lock.
+        """
+        terms, programs, students = list(self.terms.values()), list(self.programs.values()), list(self.students.values())
+        logs, requests = list(self.service_logs.values()), list(self.verification_requests.values())
+        audit_events = list(self.audit_events)
+        settings = self.settings.model_dump()
+        preserved = self._preserved = {}
+
+        def models(items, exclude=None):
+            rows = [item.model_dump(mode="json", exclude=exclude) for item in items]
+            return (tuple(rows[0]) if rows else ()), [tuple(row.values()) for row in rows]
+
+        def render() -> dict:
+            try:
+                with gc_paused():
+                    return {
+                        "terms": models(terms),
+                        "programs": models(programs, exclude={"active_students_count"}),
+                        "students": models(students),
+                        "service_logs": (LogRecord.fields, LogRecord.render(LogRecord.capture(logs, preserved))),
+                        "verification_requests": (
+                            RequestRecord.fields, RequestRecord.render(RequestRecord.capture(requests, preserved))
+                        ),
+                        "audit_events": (AuditRecord.fields, AuditRecord.render(AuditRecord.capture(audit_events))),
+                        "settings": settings,
+                    }
+            finally:
+                if self._preserved is preserved:
+                    self._preserved = None
+
+        return render
+
+    def _preserve(self, record: Record):
+        """Save `record`'s values before updating it in place, if a snapshot
+        captured it and is still rendering."""
+        preserved = self._preserved
+        if preserved is not None and id(record) not in preserved:
+            preserved[id(record)] = type(record).capture([record])[0]
+
+    def estimated_bytes(self) -> int:
+        """Approximate memory held, from record counts (see STORE_BYTES_PER_LOG)."""
+        return (STORE_BASE_BYTES + STORE_BYTES_PER_LOG * len(self.service_logs)
+                + STORE_BYTES_PER_AUDIT_EVENT * len(self.audit_events)
+                + STORE_BYTES_PER_STUDENT * len(self.students))
+
+    # ---------- writes ----------
+    def touch(self, term_id: Optional[str] = None, program_id: Optional[str] = None,
+              student_id: Optional[str] = None):
+        """Bump the data versions and drop dependent cached responses after a write.
+
+        With no arguments the write is to shared data (terms, programs,
+        students, settings).
+        """
+        self.version += 1
+        if term_id is None and program_id is None and student_id is None:
+            self.shared_version += 1
+            self.response_cache.invalidate(ResponseCache.SHARED)
+            return
+        self.response_cache.invalidate(ResponseCache.ANY)
+        if term_id:
+            self.term_versions[term_id] += 1
+            self.response_cache.invalidate(("term", term_id))
+        if program_id:
+            self.response_cache.invalidate(("program", program_id))
+        if student_id:
+            self.response_cache.invalidate(("student", student_id))
+
+    # Each public write persists through the repository and updates memory
+    # inside one transaction, so the repository commits only after memory
+    # reflects the change. The _index_* halves are reused when loading.
+    def add_term(self, term: Term):
+        with self.transaction():
+            self.repository.save_term(term.model_dump(mode="json"))
+            self._index_term(term)
+            self.touch()
+
+    def add_program(self, program: Program):
+        with self.transaction():
+            self.repository.save_program(program.model_dump(mode="json", exclude={"active_students_count"}))
+            self._index_program(program)
+            self.touch()
+
+    def add_student(self, student: Student):
+        with self.transaction():
+            self.repository.save_student(student.model_dump(mode="json"))
+            self._index_student(student)
+            self.student_dumps.pop(student.student_id, None)
+            self.touch()
+
+    def add_log(self, log: ServiceLog) -> LogRecord:
+        with self.transaction():
+            self.repository.save_log(log.model_dump(mode="json"))
+            log = self._index_log(LogRecord.from_model(log))
+            self.log_dumps.pop(log.log_id, None)
+            self.touch(self.program_term(log.program_id), log.program_id, log.student_id)
+        return log
+
+    def add_verification_request(self, vr: VerificationRequest) -> RequestRecord:
+        with self.transaction():
+            self.repository.save_request(vr.model_dump(mode="json"))
+            vr = self._index_request(RequestRecord.from_model(vr))
+            self.request_dumps.pop(vr.request_id, None)
+            self.touch(self.program_term(vr.program_id), vr.program_id, vr.student_id)
+        return vr
+
+    def add_log_rows(self, rows: List[dict]) -> List[LogRecord]:
+        """Bulk add_log for JSON-ready rows (the shape repository.load() returns).
+
+        Rows are trusted; validate untrusted input with ServiceLog first.
+        The batch is persisted with one repository call.
+        """
+        with self.transaction(), gc_paused():
+            self.repository.save_logs(rows)
+            logs = [LogRecord(**row) for row in rows]
+            self._index_logs(logs)
+            for log in logs:
+                self.log_dumps.pop(log.log_id, None)
+            self._touch_rows(logs)
+        return logs
+
+    def add_request_rows(self, rows: List[dict]) -> List[RequestRecord]:
+        """Bulk add_verification_request for trusted JSON-ready rows."""
+        with self.transaction(), gc_paused():
+            self.repository.save_requests(rows)
+            requests = [RequestRecord(**row) for row in rows]
+            self._index_requests(requests)
+            for vr in requests:
+                self.request_dumps.pop(vr.request_id, None)
+            self._touch_rows(requests)
+        return requests
+
+    def _touch_rows(self, records):
+        # touch() for every distinct term/program/student in a batch, with
+        # one version bump and one cache invalidation call
+        program_ids = {r.program_id for r in records}
+        term_ids = {self.program_term(pid) for pid in program_ids} - {None}
+        self.version += 1
+        for term_id in term_ids:
+            self.term_versions[term_id] += 1
+        self.response_cache.invalidate(
+            ResponseCache.ANY,
+            *[("term", term_id) for term_id in term_ids],
+            *[("program", program_id) for program_id in program_ids],
+            *[("student", student_id) for student_id in {r.student_id for r in records}],
+        )
+
+    def _resolve_event_term(self, event: AuditRecord):
+        if event.term_id is None and event.entity_type == EntityType.verification_request:
+            vr = self.verification_requests.get(event.entity_id)
+            event.term_id = self.program_term(vr.program_id) if vr else None
+
+    def _touch_event(self, event: AuditRecord):
+        # Request events show up in the student's audit history
+        vr = self.verification_requests.get(event.entity_id)
+        if event.entity_type == EntityType.verification_request and vr:
+            self.touch(event.term_id, student_id=vr.student_id)
+        elif event.term_id:
+            self.touch(event.term_id)
+        else:
+            # Term-less events (settings edits) only move the global version
+            self.version += 1
+
+    def add_audit_event(self, event: AuditEvent) -> AuditRecord:
+        event = AuditRecord.from_model(event)
+        self._resolve_event_term(event)
+        with self.transaction():
+            self.audit_events.append(event)
+            self.repository.save_audit_event(event.model_dump(mode="json"))
+            self._touch_event(event)
+        return event
+
+    def add_audit_events(self, events: List[AuditEvent]) -> List[AuditRecord]:
+        """Save a batch of audit events with one repository call."""
+        return self.add_audit_rows([event.model_dump(mode="json") for event in events])
+
+    def add_audit_rows(self, rows: List[dict]) -> List[AuditRecord]:
+        """add_audit_events for trusted JSON-ready rows."""
+        with self.transaction(), gc_paused():
+            events = [AuditRecord(**row) for row in rows]
+            for event in events:
+                self._resolve_event_term(event)
+                self.audit_events.append(event)
+                self._touch_event(event)
+            self.repository.save_audit_events([
+                {**row, "seq": event.seq, "term_id": event.term_id} for row, event in zip(rows, events)
+            ])
+        return events
+
+    def update_settings(self, university_name: str, dashboard_title: Optional[str] = None):
+        with self.transaction():
+            self.settings.university_name = university_name
+            if dashboard_title is not None:
+                self.settings.dashboard_title = dashboard_title
+            self.repository.save_settings(self.settings.model_dump())
+            self.touch()
+
+    def set_log_status(self, log: LogRecord, status: LogStatus, updated_at: str,
+                       evidence_tier: Optional[EvidenceTier] = None):
+        with self.transaction():
+            self.repository.update_log_status(
+                log.log_id, status.value, (evidence_tier or log.evidence_tier).value, updated_at
+            )
+            self.logs_by_status[log.status].pop(log.log_id, None)
+            was_confirmed = log.status == LogStatus.confirmed
+            is_confirmed = status == LogStatus.confirmed
+            term_id = self.program_term(log.program_id)
+            timeseries = self.term_aggregates[term_id].timeseries if term_id else None
+            if timeseries is not None:
+                timeseries.add(log, -1)
+            if term_id and was_confirmed != is_confirmed:
+                self.term_aggregates[term_id].add_verified(log, 1 if is_confirmed else -1)
+            self._preserve(log)
+            log.status = status
+            self.log_columns.set_status(log.log_id, status)
+            if evidence_tier is not None:
+                log.evidence_tier = evidence_tier
+            log.updated_at = updated_at
+            if timeseries is not None:
+                timeseries.add(log)
+            self.logs_by_status[status][log.log_id] = log
+            self.log_dumps.pop(log.log_id, None)
+            self.touch(term_id, log.program_id, log.student_id)
+
+    def set_request_status(self, vr: RequestRecord, status: VerificationStatus):
+        with self.transaction():
+            self.repository.update_request_status(vr.request_id, status.value)
+            self.requests_by_status[vr.status].pop(vr.request_id, None)
+            self._preserve(vr)
+            vr.status = status
+            self.requests_by_status[status][vr.request_id] = vr
+            self.request_dumps.pop(vr.request_id, None)
+            self.touch(self.program_term(vr.program_id), vr.program_id, vr.student_id)
+
+    def _index_term(self, term: Term):
+        self.terms[term.term_id] = term
+
+    def _index_program(self, program: Program):
+        self.programs[program.program_id] = program
+        self.search.add("program", program.program_id, program.name)
+        self.programs_by_term[program.term_id][program.program_id] = program
+        for student_id in self.students_by_program.get(program.program_id, {}):
+            self.term_aggregates[program.term_id].risk.add_member(student_id, program.program_id)
+
+    def _index_student(self, student: Student):
+        self.students[student.student_id] = student
+        self.log_columns.student_code(student.student_id)
+        self.search.add("student", student.student_id, f"{student.name} {student.email}")
+        for pid in student.program_ids:
+            self.students_by_program[pid][student.student_id] = student
+            # Update program active student counts
+            if pid in self.programs:
+                self.programs[pid].active_students_count += 1
+                self.term_aggregates[self.programs[pid].term_id].risk.add_member(student.student_id, pid)
+
+    def _index_log(self, log: LogRecord):
+        self._index_logs((log,))
+        return log
+
+    def _index_logs(self, logs):
+        """Add a batch of logs to every index; dict and method lookups are
+        hoisted out of the loop since bulk imports and loads spend most of
+        their time here."""
+        service_logs, log_order = self.service_logs, self._log_order
+        by_student, by_program, by_term = self.logs_by_student, self.logs_by_program, self.logs_by_term
+        by_status, aggregates = self.logs_by_status, self.term_aggregates
+        search = self.search.indexes["log"]
+        duplicates = self.duplicates
+        program_term = {}
+        self.log_columns.extend(logs)
+        for order, log in enumerate(logs, len(log_order)):
+            log_id, program_id = log.log_id, log.program_id
+            service_logs[log_id] = log
+            log_order[log_id] = order
+            by_student[log.student_id][log_id] = log
+            by_program[program_id][log_id] = log
+            term_id = program_term.get(program_id, program_id)
+            if term_id is program_id:
+                term_id = program_term[program_id] = self.program_term(program_id)
+            if term_id:
+                by_term[term_id][log_id] = log
+                aggregates[term_id].add_log(log)
+            by_status[log.status][log_id] = log
+            search.add(log_id, log.description)
+        duplicates.add_many(logs)
+
+    def _index_request(self, vr: RequestRecord):
+        self._index_requests((vr,))
+        return vr
+
+    def _index_requests(self, requests):
+        """_index_logs for verification requests."""
+        verification_requests, request_order, by_log = self.verification_requests, self._request_order, self.request_by_log
+        by_student, by_program, by_term = self.requests_by_student, self.requests_by_program, self.requests_by_term
+        by_status = self.requests_by_status
+        search = self.search
+        program_term = {}
+        for order, vr in enumerate(requests, len(request_order)):
+            request_id, program_id = vr.request_id, vr.program_id
+            verification_requests[request_id] = vr
+            request_order[request_id] = order
+            by_log[vr.log_id] = vr
+            by_student[vr.student_id][request_id] = vr
+            by_program[program_id][request_id] = vr
+            term_id = program_term.get(program_id, program_id)
+            if term_id is program_id:
+                term_id = program_term[program_id] = self.program_term(program_id)
+            if term_id:
+                by_term[term_id][request_id] = vr
+            by_status[vr.status][request_id] = vr
+            search.add("request", request_id, vr.ngo_name)
+
+    def etag(self, term_ids=None) -> str:
+        """Strong ETag for data scoped to `term_ids` (None: everything)."""
+        if self.change_version is not None:
+            # Shared repository: every process that has applied the same
+            # changes holds the same data, whatever the scope
+            return f'"{self.change_version}"'
+        if term_ids is None:
+            return f'"{self.epoch}-{self.version}"'
+        term_part = ".".join(f"{t}:{self.term_versions.get(t, 0)}" for t in sorted(term_ids))
+        return f'"{self.epoch}-{self.shared_version}-{term_part}"'
+
+    # ---------- indexed reads ----------
+    def program_term(self, program_id: str) -> Optional[str]:
+        program = self.programs.get(program_id)
+        return program.term_id if program else None
+
+    def term_program_ids(self, term_id: str) -> List[str]:
+        return list(self.programs_by_term.get(term_id, {}))
+
+    def _log_scan(self, term_id, status, student_id, program_id):
+        """Smallest index bucket for the filters, whether it keeps creation
+        order, and a predicate for the remaining filters."""
+        # (bucket, keeps creation order)
+        candidates = []
+        if term_id is not None:
+            candidates.append((self.logs_by_term.get(term_id, {}), True))
+        if status is not None:
+            # Status buckets are reordered on every transition
+            candidates.append((self.logs_by_status.get(status, {}), False))
+        if student_id is not None:
+            candidates.append((self.logs_by_student.get(student_id, {}), True))
+        if program_id is not None:
+            candidates.append((self.logs_by_program.get(program_id, {}), True))
+        if not candidates:
+            self.lookups["log", "scan"] += 1
+            return self.service_logs, True, None
+        bucket, ordered = min(candidates, key=lambda c: len(c[0]))
+        if len(candidates) == 1:
+            self.lookups["log", "index"] += 1
+            return bucket, ordered, None
+        self.lookups["log", "filtered"] += 1
+
+        def matches(l: LogRecord) -> bool:
+            return (
+                (term_id is None or self.program_term(l.program_id) == term_id)
+                and (status is None or l.status == status)
+                and (student_id is None or l.student_id == student_id)
+                and (program_id is None or l.program_id == program_id)
+            )
+        return bucket, ordered, matches
+
+    def iter_logs(self, term_id: Optional[str] = None, status: Optional[LogStatus] = None,
+                  student_id: Optional[str] = None, program_id: Optional[str] = None):
+        """Matching logs in no particular order, without building a list."""
+        bucket, _, matches = self._log_scan(term_id, status, student_id, program_id)
+        return iter(bucket.values()) if matches is None else filter(matches, bucket.values())
+
+    def sorted_logs(self, sort: str, key, term_id: Optional[str] = None, status: Optional[LogStatus] = None,
+                    student_id: Optional[str] = None) -> List[LogRecord]:
+        """Matching logs sorted ascending by `key` (named `sort`), for keyset
+        pages to bisect; cached until a write could change the list."""
+        cache_key = ("sorted_logs", sort, term_id, status, student_id)
+        logs = self.response_cache.get(cache_key)
+        if logs is None:
+            logs = sorted(self.iter_logs(term_id, status, student_id), key=key)
+            tags = [("term", term_id)] if term_id else []
+            if student_id:
+                tags.append(("student", student_id))
+            self.cache_response(cache_key, logs, tags or [ResponseCache.ANY])
+        return logs
+
+    def count_logs(self, term_id: Optional[str] = None, status: Optional[LogStatus] = None,
+                   student_id: Optional[str] = None, program_id: Optional[str] = None) -> int:
+        """Number of matching logs; O(1) when a single index answers the query."""
+        bucket, _, matches = self._log_scan(term_id, status, student_id, program_id)
+        if matches is None:
+            return len(bucket)
+        return sum(1 for l in bucket.values() if matches(l))
+
+    def find_logs(self, term_id: Optional[str] = None, status: Optional[LogStatus] = None,
+                  student_id: Optional[str] = None, program_id: Optional[str] = None) -> List[LogRecord]:
+        """Logs matching every given filter, in creation order.
+
+        Iterates the smallest matching index bucket and checks the remaining
+        filters on each row, so the cost is bounded by that bucket's size.
+        """
+        bucket, ordered, matches = self._log_scan(term_id, status, student_id, program_id)
+        logs = list(bucket.values()) if matches is None else [l for l in bucket.values() if matches(l)]
+        if not ordered:
+            logs.sort(key=self.log_order)
+        return logs
+
+    def log_order(self, log: LogRecord) -> int:
+        return self._log_order[log.log_id]
+
+    def possible_duplicate(self, log: LogRecord) -> Optional[tuple]:
+        """(log_id, "exact" | "near") of the earliest log `log` repeats.
+
+        Only earlier logs of its DuplicateIndex block that weren't rejected
+        count, exact repeats before near ones.
+        """
+        exact, near = self.duplicates.candidates(log)
+        for match, others in (("exact", exact), ("near", near)):
+            for other in others:
+                if other.status != LogStatus.rejected:
+                    return other.log_id, match
+        return None
+
+    def term_aggregate(self, term_id: str) -> TermAggregate:
+        return self.term_aggregates.get(term_id) or TermAggregate()
+
+    def recompute_term_aggregate(self, term_id: str) -> TermAggregate:
+        """Rebuild a term's aggregate from its logs, ignoring the maintained one."""
+        aggregate = TermAggregate()
+        for log in self.logs_by_term.get(term_id, {}).values():
+            aggregate.add_log(log)
+        return aggregate
+
+    def check_term_aggregates(self, term_id: Optional[str] = None) -> dict:
+        """Diff maintained aggregates against a from-scratch recompute.
+
+        Returns {term_id: {field: {"maintained": ..., "recomputed": ...}}}
+        for every term that disagrees; an empty dict means consistent.
+        """
+        term_ids = [term_id] if term_id else list(self.terms)
+        mismatches = {}
+        for tid in term_ids:
+            maintained = self.term_aggregate(tid).summary()
+            recomputed = self.recompute_term_aggregate(tid).summary()
+            diff = {
+                field: {"maintained": maintained[field], "recomputed": recomputed[field]}
+                for field in maintained
+                if maintained[field] != recomputed[field]
+            }
+            if diff:
+                mismatches[tid] = diff
+        return mismatches
+
+    def find_requests(self, term_id: Optional[str] = None,
+                      status: Optional[VerificationStatus] = None) -> List[RequestRecord]:
+        """Verification requests matching the given filters, in creation order."""
+        if term_id is None and status is None:
+            self.lookups["request", "scan"] += 1
+            return list(self.verification_requests.values())
+        if status is None:
+            self.lookups["request", "index"] += 1
+            return list(self.requests_by_term.get(term_id, {}).values())
+
+        by_status = self.requests_by_status.get(status, {})
+        self.lookups["request", "index" if term_id is None else "filtered"] += 1
+        if term_id is not None:
+            by_term = self.requests_by_term.get(term_id, {})
+            if len(by_term) <= len(by_status):
+                return [r for r in by_term.values() if r.status == status]
+            requests = [r for r in by_status.values() if self.program_term(r.program_id) == term_id]
+        else:
+            requests = list(by_status.values())
+        requests.sort(key=lambda r: self._request_order[r.request_id])
+        return requests
+
+
     def _seed_data(self):
         # Seed Terms
         terms_data = [
@@ -185,7 +2072,7 @@ class DataStore:
             Term(term_id="summer-2026", name="Summer 2026", start_date="2026-06-01", end_date="2026-08-15", required_hours=10),
         ]
         for t in terms_data:
-            self.terms[t.term_id] = t
+            self.add_term(t)
         
         # Seed Programs (for Spring 2026)
         programs_data = [
@@ -199,7 +2086,7 @@ class DataStore:
             Program(program_id="summer-prog", name="Summer Volunteer Program", type=ProgramType.campus, term_id="summer-2026", active_students_count=0, icon="sun"),
         ]
         for p in programs_data:
-            self.programs[p.program_id] = p
+            self.add_program(p)
         
         # Seed deterministic fixture students
         students_data = [
@@ -218,11 +2105,7 @@ class DataStore:
         ]
         
         for s in students_data:
-            self.students[s.student_id] = s
-            # Update program active student counts
-            for pid in s.program_ids:
-                if pid in self.programs:
-                    self.programs[pid].active_students_count += 1
+            self.add_student(s)
         
         # Seed deterministic fixture service logs and verification requests
         logs_data = [
@@ -255,13 +2138,611 @@ class DataStore:
         ]
         
         for l in logs_data:
-            self.service_logs[l.log_id] = l
+            self.add_log(l)
         
         for vr in vr_data:
-            self.verification_requests[vr.request_id] = vr
+            self.add_verification_request(vr)
+
+DEFAULT_TENANT = "default"
+TENANT_ID = re.compile(r"[a-z0-9][a-z0-9-]{0,62}")
+
+
+def create_repository(tenant: str = DEFAULT_TENANT):
+    """Persistence backend from DATASTORE_BACKEND ("memory", "sqlite" or "journal").
+
+    The default tenant uses SQLITE_PATH / JOURNAL_DIR; every other tenant
+    gets its own database file or journal directory under TENANT_DIR.
+    """
+    backend = os.getenv("DATASTORE_BACKEND", "memory")
+    tenant_dir = os.getenv("TENANT_DIR", "tenants")
+    if backend == "memory":
+        return MemoryRepository()
+    if backend == "sqlite":
+        if tenant == DEFAULT_TENANT:
+            path = os.getenv("SQLITE_PATH", "myimpact.db")
+        else:
+            os.makedirs(tenant_dir, exist_ok=True)
+            path = os.path.join(tenant_dir, f"{tenant}.db")
+        # SQLITE_SHARED=1 when several worker processes serve the same files
+        return SQLiteRepository(
+            path, shared=os.getenv("SQLITE_SHARED", "0") == "1",
+            poll_interval=float(os.getenv("SQLITE_POLL_INTERVAL", "0.5")),
+        )
+    if backend == "journal":
+        return JournalRepository(
+            os.getenv("JOURNAL_DIR", "data") if tenant == DEFAULT_TENANT else os.path.join(tenant_dir, tenant),
+            fsync_interval=float(os.getenv("JOURNAL_FSYNC_INTERVAL", "0.05")),
+            snapshot_every=int(os.getenv("JOURNAL_SNAPSHOT_EVERY", "100000")),
+        )
+    raise ValueError(f"Unknown DATASTORE_BACKEND: {backend}")
+
+
+class TenantRegistry:
+    """One DataStore per tenant, loaded on first use and evicted when idle.
+
+    Stores are kept least recently used first. A store is evicted once it
+    has been idle for `idle_seconds`, or, oldest first, while the estimated
+    memory of all loaded stores is over `memory_budget`. Tenants with a
+    request in flight (an open /api/changes stream counts) are never
+    evicted, nor is the default tenant, nor a store on the memory backend,
+    whose data would be lost.
+
+    A store replaced by a fresh load (see sync) is retired and closed once
+    the last request holding it releases it.
+    """
+
+    def __init__(self, factory, allowed: Optional[set] = None,
+                 memory_budget: int = 1 << 30, idle_seconds: float = 900.0):
+        self.factory = factory  # tenant id -> DataStore
+        self.allowed = allowed  # tenant ids besides the default one; None allows any
+        self.memory_budget = memory_budget
+        self.idle_seconds = idle_seconds
+        self.sweep_interval = min(idle_seconds, 60.0)
+        self.stores: OrderedDict[str, DataStore] = OrderedDict()
+        self.last_used: dict[str, float] = {}
+        self.active: Counter = Counter()  # tenant -> requests in flight
+        self.holders: Counter = Counter()  # store -> requests in flight using it
+        self.retired: set = set()  # replaced stores still held by a request
+        self.loading: dict[str, threading.Lock] = {}
+        self.lock = threading.Lock()
+        self.swept = time.monotonic()
+        self.loads = 0
+        self.evictions = 0
+
+    def allows(self, tenant: str) -> bool:
+        return tenant == DEFAULT_TENANT or bool(
+            TENANT_ID.fullmatch(tenant) and (self.allowed is None or tenant in self.allowed)
+        )
+
+    def get(self, tenant: str) -> DataStore:
+        """The tenant's store, loaded (and others evicted to make room) if needed."""
+        store = self.stores.get(tenant)
+        if store is not None:
+            return store
+        with self.lock:
+            loading = self.loading.setdefault(tenant, threading.Lock())
+        with loading:
+            store = self.stores.get(tenant)
+            if store is None:
+                store = self.factory(tenant)
+                with self.lock:
+                    self.stores[tenant] = store
+                    self.last_used[tenant] = time.monotonic()
+                    self.loads += 1
+                self.evict()
+        return store
+
+    def acquire(self, tenant: str) -> DataStore:
+        """get(), pinning the store until the matching release()."""
+        with self.lock:
+            self.active[tenant] += 1
+        try:
+            while True:
+                store = self.get(tenant)
+                with self.lock:
+                    # Unless sync() replaced it in between
+                    if self.stores.get(tenant) is store:
+                        self.holders[store] += 1
+                        return store
+        except BaseException:
+            with self.lock:
+                self._unpin(tenant)
+            raise
+
+    @contextmanager
+    def holding(self, tenant: str):
+        """acquire() for the length of a with block, for callers outside a request."""
+        store = self.acquire(tenant)
+        try:
+            yield store
+        finally:
+            self.release(tenant, store)
+
+    def sync(self, tenant: str, store: DataStore) -> DataStore:
+        """store.sync(), or a fresh load of the tenant if the store fell
+        further behind other processes than their change log reaches.
+
+        The caller's hold on `store` (from acquire) moves to the store
+        returned, so release() that one.
+        """
+        try:
+            store.sync()
+            return store
+        except StaleReplica:
+            pass
+        with self.lock:
+            loading = self.loading.setdefault(tenant, threading.Lock())
+        with loading:
+            fresh = self.stores.get(tenant)
+            if fresh is store:  # else another request reloaded it already
+                fresh = self.factory(tenant)
+                with self.lock:
+                    self.stores[tenant] = fresh
+                    self.retired.add(store)
+                    self.loads += 1
+            # The caller's hold moves to the store it is given
+            with self.lock:
+                self.holders[fresh] += 1
+                unused = self._unhold(store)
+        if unused:
+            store.repository.close()
+        return fresh
+
+    def release(self, tenant: str, store: DataStore):
+        with self.lock:
+            self._unpin(tenant)
+            unused = self._unhold(store)
+            if tenant in self.stores:
+                self.stores.move_to_end(tenant)
+                self.last_used[tenant] = time.monotonic()
+        if unused:
+            store.repository.close()
+
+    def _unpin(self, tenant: str):
+        self.active[tenant] -= 1
+        if not self.active[tenant]:
+            del self.active[tenant]
+
+    def _unhold(self, store: DataStore) -> bool:
+        """Drop one hold on `store`; True if it was retired and is now unused."""
+        self.holders[store] -= 1
+        if self.holders[store]:
+            return False
+        del self.holders[store]
+        if store in self.retired:
+            self.retired.remove(store)
+            return True
+        return False
+
+    def evictable(self, tenant: str) -> bool:
+        return (tenant != DEFAULT_TENANT and not self.active[tenant]
+                and not isinstance(self.stores[tenant].repository, MemoryRepository))
+
+    def memory(self) -> int:
+        with self.lock:
+            return sum(store.estimated_bytes() for store in self.stores.values())
+
+    def evict(self):
+        """Close idle stores, then least recently used ones while over the memory budget."""
+        now = time.monotonic()
+        evicted = []
+        with self.lock:
+            self.swept = now
+            sizes = {tenant: store.estimated_bytes() for tenant, store in self.stores.items()}
+            total = sum(sizes.values())
+            for tenant in [t for t in self.stores if self.evictable(t)]:
+                if total <= self.memory_budget and now - self.last_used[tenant] < self.idle_seconds:
+                    continue
+                evicted.append(self.stores.pop(tenant))
+                del self.last_used[tenant]
+                total -= sizes[tenant]
+                self.evictions += 1
+        for store in evicted:
+            store.repository.close()
+
+    def close(self):
+        with self.lock:
+            stores, self.stores = [*self.stores.values(), *self.retired], OrderedDict()
+            self.retired.clear()
+            self.last_used.clear()
+        for store in stores:
+            store.repository.close()
+
+
+def tenant_allowlist() -> Optional[set]:
+    """TENANTS: comma-separated tenant ids served besides "default", or "*" for any."""
+    names = os.getenv("TENANTS", "").strip()
+    if names == "*":
+        return None
+    return {name.strip() for name in names.split(",") if name.strip()}
+
+
+tenants = TenantRegistry(
+    lambda tenant: DataStore(create_repository(tenant)),
+    allowed=tenant_allowlist(),
+    memory_budget=int(float(os.getenv("TENANT_MEMORY_BUDGET_MB", "1024")) * 1024 * 1024),
+    idle_seconds=float(os.getenv("TENANT_IDLE_SECONDS", "900")),
+)
+# Set by TenantMiddleware for the duration of a request
+request_store: ContextVar[Optional[DataStore]] = ContextVar("request_store", default=None)
+
+
+def current_store() -> DataStore:
+    """The store of the request being served, or the default tenant's outside one."""
+    store = request_store.get()
+    return store if store is not None else tenants.get(DEFAULT_TENANT)
+
+
+class TenantStore:
+    """Stands in for the current tenant's DataStore, so handlers keep using `db`.
+
+    Every attribute is forwarded (__getattribute__ rather than __getattr__,
+    which would first fail a lookup on the proxy itself: handlers touch `db`
+    per row).
+    """
+
+    __slots__ = ()
+
+    def __getattribute__(self, name):
+        store = request_store.get()
+        if store is None:
+            store = tenants.get(DEFAULT_TENANT)
+        return getattr(store, name)
+
+
+# Global data store: the current request's tenant
+db = TenantStore()
+
+def snapshot_read(handler):
+    """Run a read-only handler through db.read() so it sees no torn writes.
+
+    Sync routes run on FastAPI's thread pool, concurrently with writers.
+    """
+    @wraps(handler)
+    def wrapper(*args, **kwargs):
+        return db.read(handler, *args, **kwargs)
+    return wrapper
+
+# ============== CONDITIONAL GETS ==============
+# Compared against the previous term in the KPI deltas
+KPI_COMPARISON_TERMS = {"spring-2026": "fall-2025"}
+
+# List endpoints whose output with ?term_id= depends only on that term's
+# data plus shared data; everything else is tagged with the global version
+TERM_SCOPED_PATHS = {
+    "/api/programs", "/api/students", "/api/service-logs",
+    "/api/verification-requests", "/api/kpis", "/api/audit-events",
+    "/api/students/at-risk", "/api/search", "/api/timeseries",
+}
+# GETs that write (exports append an audit event) or report non-data state
+# are never short-circuited
+UNCACHED_PATHS = {
+    "/api/health", "/api/export/verified-logs", "/api/export/audit-trail",
+    # Counters move without a data write
+    "/api/cache/stats", "/api/metrics",
+    # Never finishes; resumes by event id instead
+    "/api/changes",
+}
+
+def request_etag(path: str, term_id: Optional[str]) -> str:
+    if term_id and path in TERM_SCOPED_PATHS:
+        term_ids = {term_id}
+        if path == "/api/kpis" and term_id in KPI_COMPARISON_TERMS:
+            term_ids.add(KPI_COMPARISON_TERMS[term_id])
+        return db.etag(term_ids)
+    return db.etag()
+
+@app.middleware("http")
+async def conditional_get(request: Request, call_next):
+    """Answer 304 when If-None-Match still matches the current data version.
+
+    The tag is taken before the handler runs, so a write that lands while
+    the response is built can only make the tag older than the body, never
+    newer, and the next request refetches.
+    """
+    path = request.url.path
+    if request.method != "GET" or not path.startswith("/api/") or path in UNCACHED_PATHS:
+        return await call_next(request)
+    
+    etag = request_etag(path, request.query_params.get("term_id"))
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers["ETag"] = etag
+    return response
+
+# ============== TENANTS ==============
+class TenantMiddleware:
+    """Serves each request from its tenant's DataStore.
+
+    The tenant comes from a /t/{tenant}/ path prefix (stripped before
+    routing) or else the X-Tenant-ID header, and defaults to "default".
+    The store is loaded off the event loop the first time, pinned while
+    the response is sent and published through `request_store`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        tenant = DEFAULT_TENANT
+        path = scope["path"]
+        if path.startswith("/t/"):
+            tenant, _, rest = path[3:].partition("/")
+            if tenants.allows(tenant):
+                prefix = len(tenant) + 3
+                scope = dict(scope, path="/" + rest)
+                if scope.get("raw_path"):
+                    scope["raw_path"] = scope["raw_path"][prefix:] or b"/"
+        else:
+            for name, value in scope["headers"]:
+                if name == b"x-tenant-id":
+                    tenant = value.decode("latin-1")
+                    break
+        if not tenants.allows(tenant):
+            response = FastJSONResponse({"detail": f"Unknown tenant: {tenant}"}, status_code=404)
+            return await response(scope, receive, send)
+
+        if tenant in tenants.stores:
+            store = tenants.acquire(tenant)
+        else:
+            store = await run_in_threadpool(tenants.acquire, tenant)
+        try:
+            # Other worker processes' writes first, so no worker answers
+            # from older data than the last response a client saw
+            if store.stale():
+                store = await run_in_threadpool(tenants.sync, tenant, store)
+            if time.monotonic() - tenants.swept > tenants.sweep_interval:
+                await run_in_threadpool(tenants.evict)
+            token = request_store.set(store)
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                request_store.reset(token)
+        finally:
+            tenants.release(tenant, store)
+
+
+app.add_middleware(TenantMiddleware)
+
+# ============== METRICS ==============
+class Metrics:
+    """Per-route request counters, latency and response-size histograms and
+    export row counts, rendered in the Prometheus text format.
+
+    Histograms keep one count per bucket (made cumulative when rendered) so
+    an observation is a bisect and a few increments under one lock.
+    """
+
+    LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+    def __init__(self):
+        self.requests: Counter = Counter()  # (method, route, status) -> count
+        # (method, route) -> [per-bucket counts..., +Inf count, sum]
+        self.latency: dict[tuple, list] = {}
+        self.sizes: dict[tuple, list] = {}
+        self.export_rows: Counter = Counter()  # export name -> rows
+        self.import_rows: Counter = Counter()  # "imported" / "failed" -> rows
+        self.lock = threading.Lock()
+
+    def observe(self, method: str, route: str, status: int, seconds: float, size: int):
+        key = (method, route)
+        with self.lock:
+            self.requests[method, route, status] += 1
+            latency = self.latency.get(key)
+            if latency is None:
+                latency = self.latency[key] = [0] * (len(self.LATENCY_BUCKETS) + 2)
+                self.sizes[key] = [0] * (len(self.SIZE_BUCKETS) + 2)
+            sizes = self.sizes[key]
+            latency[bisect_left(self.LATENCY_BUCKETS, seconds)] += 1
+            latency[-1] += seconds
+            sizes[bisect_left(self.SIZE_BUCKETS, size)] += 1
+            sizes[-1] += size
+
+    def count_export(self, export: str, rows: int):
+        with self.lock:
+            self.export_rows[export] += rows
+
+    def count_import(self, imported: int, failed: int):
+        with self.lock:
+            self.import_rows["imported"] += imported
+            self.import_rows["failed"] += failed
+
+    def render(self, store: "DataStore") -> str:
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(f'{k}="{prom_label(v)}"' for k, v in labels)
+                lines.append(f"{name}{suffix}{{{label_text}}} {value}" if labels else f"{name}{suffix} {value}")
+
+        def histogram(buckets, series):
+            for (method, route), counts in sorted(series.items()):
+                labels = (("method", method), ("route", route))
+                total = 0
+                for bound, count in zip((*buckets, "+Inf"), counts):
+                    total += count
+                    yield "_bucket", (*labels, ("le", bound)), total
+                yield "_sum", labels, round(counts[-1], 6)
+                yield "_count", labels, total
+
+        with self.lock:
+            requests = dict(self.requests)
+            latency = {key: list(counts) for key, counts in self.latency.items()}
+            sizes = {key: list(counts) for key, counts in self.sizes.items()}
+            export_rows = dict(self.export_rows)
+            import_rows = dict(self.import_rows)
+        cache = store.response_cache.stats()
+
+        family("myimpact_http_requests_total", "counter", "HTTP requests by route and status.", [
+            ("", (("method", m), ("route", r), ("status", st)), n) for (m, r, st), n in sorted(requests.items())
+        ])
+        family("myimpact_http_request_duration_seconds", "histogram", "Time to serve a request.",
+               histogram(self.LATENCY_BUCKETS, latency))
+        family("myimpact_http_response_size_bytes", "histogram", "Response body size.",
+               histogram(self.SIZE_BUCKETS, sizes))
+        family("myimpact_datastore_lookups_total", "counter",
+               "Store queries answered from one index, an index plus a row filter, or a full scan.", [
+                   ("", (("entity", entity), ("path", path)), n) for (entity, path), n in sorted(store.lookups.items())
+               ])
+        family("myimpact_response_cache_lookups_total", "counter", "Response cache lookups.", [
+            ("", (("result", "hit"),), cache["hits"]), ("", (("result", "miss"),), cache["misses"]),
+        ])
+        family("myimpact_response_cache_hit_ratio", "gauge", "Response cache hits over lookups.",
+               [("", (), cache["hit_rate"])])
+        family("myimpact_response_cache_entries", "gauge", "Responses currently cached.", [("", (), cache["size"])])
+        family("myimpact_response_cache_evictions_total", "counter", "Entries evicted for space.",
+               [("", (), cache["evictions"])])
+        family("myimpact_response_cache_invalidations_total", "counter", "Entries dropped by writes.",
+               [("", (), cache["invalidations"])])
+        family("myimpact_read_retries_total", "counter", "Snapshot reads retried after overlapping a write.",
+               [("", (), store.read_retries)])
+        family("myimpact_read_lock_fallbacks_total", "counter", "Snapshot reads that fell back to the writer lock.",
+               [("", (), store.read_fallbacks)])
+        family("myimpact_audit_events", "gauge", "Length of the audit log.", [("", (), len(store.audit_events))])
+        family("myimpact_tenants_loaded", "gauge", "Tenant stores currently in memory.",
+               [("", (), len(tenants.stores))])
+        family("myimpact_tenant_memory_bytes", "gauge", "Estimated memory of the loaded tenant stores.",
+               [("", (), tenants.memory())])
+        family("myimpact_tenant_loads_total", "counter", "Tenant stores loaded.", [("", (), tenants.loads)])
+        family("myimpact_tenant_evictions_total", "counter", "Tenant stores evicted.", [("", (), tenants.evictions)])
+        family("myimpact_change_stream_subscribers", "gauge", "Open /api/changes streams.",
+               [("", (), len(store.changes.waiters))])
+        family("myimpact_change_events_total", "counter", "Delta events published to /api/changes.",
+               [("", (), store.changes.seq)])
+        family("myimpact_export_rows_total", "counter", "Rows written by CSV exports.", [
+            ("", (("export", name),), n) for name, n in sorted(export_rows.items())
+        ])
+        family("myimpact_import_rows_total", "counter", "Rows read by service log imports.", [
+            ("", (("result", result),), n) for result, n in sorted(import_rows.items())
+        ])
+        return "\n".join(lines) + "\n"
+
+
+def prom_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = Metrics()
+
+
+class MetricsMiddleware:
+    """Times every request and counts its response bytes, labelled by the
+    matched route template (so path parameters don't multiply series).
+
+    Plain ASGI rather than @app.middleware so streamed bodies (exports) are
+    measured to the last chunk without re-buffering them.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        start = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # FastAPI leaves the matched route in the scope
+            route = scope.get("route")
+            metrics.observe(scope["method"], route.path if route else "unmatched", status,
+                            time.perf_counter() - start, size)
+
+
+# Just inside CORS, so 304s and tenant 404s are counted too
+app.add_middleware(MetricsMiddleware)
+
+# Added last so it is outermost: every response, including the 304s from
+# conditional_get and TenantMiddleware's 404s, gets the CORS headers
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "ETag"],
+)
+
+# ============== CHANGE STREAM ==============
+class ChangeFeed:
+    """Bounded, sequence-numbered log of small delta events for /api/changes.
+
+    Writers publish from worker threads; each SSE subscriber registers an
+    asyncio.Event on its own loop and is woken with call_soon_threadsafe.
+    Event ids carry `epoch` so a cursor from a previous process (or one
+    older than the buffer) is answered with a reset instead of a silent gap.
+    """
+
+    def __init__(self, maxlen: int = 10000):
+        self.events: deque = deque(maxlen=maxlen)  # (seq, kind, term_id, data)
+        self.seq = 0
+        self.epoch = uuid.uuid4().hex[:8]
+        self.waiters: set = set()  # (loop, asyncio.Event)
+        self.lock = threading.Lock()
+
+    def publish(self, deltas):
+        """Append (kind, term_id, data) deltas and wake every subscriber once."""
+        with self.lock:
+            for kind, term_id, data in deltas:
+                self.seq += 1
+                self.events.append((self.seq, kind, term_id, data))
+            waiters = list(self.waiters)
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.epoch}-{seq}"
+
+    def parse_cursor(self, token: Optional[str]) -> Optional[int]:
+        """The seq an event id points at, or None if it isn't one of ours."""
+        epoch, _, seq = (token or "").rpartition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def since(self, seq: int, term_id: Optional[str] = None):
+        """(events after `seq` for the term, or None if some were already dropped, latest seq)."""
+        with self.lock:
+            first = self.events[0][0] if self.events else self.seq + 1
+            if seq > self.seq or seq + 1 < first:
+                return None, self.seq
+            events = list(islice(self.events, seq + 1 - first, None))
+            latest = self.seq
+        if term_id is not None:
+            # Term-less events (none yet) would go to every subscriber
+            events = [e for e in events if e[2] in (term_id, None)]
+        return events, latest
+
+    def subscribe(self) -> asyncio.Event:
+        event = asyncio.Event()
+        with self.lock:
+            self.waiters.add((asyncio.get_running_loop(), event))
+        return event
+
+    def unsubscribe(self, event: asyncio.Event):
+        with self.lock:
+            self.waiters = {w for w in self.waiters if w[1] is not event}
 
-# Global data store instance
-db = DataStore()
 
 # ============== AUTH SCAFFOLDING (TODO) ==============
 class UserRole(str, Enum):
@@ -293,10 +2774,12 @@ def health_check():
 
 # Terms
 @app.get("/api/terms")
+@snapshot_read
 def get_terms():
     return list(db.terms.values())
 
 @app.get("/api/terms/{term_id}")
+@snapshot_read
 def get_term(term_id: str):
     if term_id not in db.terms:
         raise HTTPException(status_code=404, detail="Term not found")
@@ -304,30 +2787,36 @@ def get_term(term_id: str):
 
 # Programs
 @app.get("/api/programs")
+@snapshot_read
 def get_programs(term_id: Optional[str] = None):
-    programs = list(db.programs.values())
     if term_id:
-        programs = [p for p in programs if p.term_id == term_id]
-    return programs
+        return list(db.programs_by_term.get(term_id, {}).values())
+    return list(db.programs.values())
 
 @app.get("/api/programs/{program_id}")
+@snapshot_read
 def get_program(program_id: str):
     if program_id not in db.programs:
         raise HTTPException(status_code=404, detail="Program not found")
     
+    cache_key = ("program", program_id)
+    cached = db.response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     program = db.programs[program_id]
     
     # Calculate stats from logs
-    program_logs = [l for l in db.service_logs.values() if l.program_id == program_id]
-    total_hours = sum(l.hours for l in program_logs)
-    verified_hours = sum(l.hours for l in program_logs if l.status == LogStatus.confirmed)
-    pending_requests = len([vr for vr in db.verification_requests.values() 
-                           if vr.program_id == program_id and vr.status == VerificationStatus.awaiting_confirmation])
+    totals = db.term_aggregate(program.term_id).program_totals.get(program_id, {})
+    total_hours = totals.get("total_hours", 0)
+    verified_hours = totals.get("verified_hours", 0)
+    pending_requests = len([vr for vr in db.requests_by_program.get(program_id, {}).values()
+                           if vr.status == VerificationStatus.awaiting_confirmation])
     
     # Get students in this program
-    students_in_program = [s for s in db.students.values() if program_id in s.program_ids]
+    students_in_program = list(db.students_by_program.get(program_id, {}).values())
     
-    return {
+    result = {
         **program.model_dump(),
         "total_hours": round(total_hours, 1),
         "verified_hours": round(verified_hours, 1),
@@ -336,58 +2825,246 @@ def get_program(program_id: str):
         "student_count": len(students_in_program),
         "students": [{"student_id": s.student_id, "name": s.name, "avatar": s.avatar} for s in students_in_program[:10]]
     }
+    db.cache_response(cache_key, result, [("program", program_id)])
+    return result
+
+# ============== PAGINATION / PROJECTION ==============
+class SortOrder(str, Enum):
+    asc = "asc"
+    desc = "desc"
+
+class LogSort(str, Enum):
+    date = "date"
+    hours = "hours"
+
+class StudentSort(str, Enum):
+    progress = "progress"
+    risk_score = "risk_score"
+
+MAX_PAGE_SIZE = 1000
+NUMBER = (int, float)  # cursor element type for numeric sort values
+
+def encode_cursor(key: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode()
+
+def decode_cursor(cursor: str, types: tuple) -> tuple:
+    """The key encode_cursor encoded, checked against `types` (a type or
+    tuple of types per element) so it compares cleanly with sort keys."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        key = None
+    if not (isinstance(key, list) and len(key) == len(types)
+            and all(isinstance(value, expected) for value, expected in zip(key, types))):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple(key)
+
+def parse_fields(fields: Optional[str], allowed) -> Optional[List[str]]:
+    """Comma-separated `fields=` list, validated against `allowed`; an
+    empty list (`fields=` or `fields=,`) means no projection."""
+    requested = [f.strip() for f in fields.split(",") if f.strip()] if fields else []
+    if not requested:
+        return None
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return requested
+
+def keyset_page(items, key, key_types: tuple, cursor: Optional[str], limit: Optional[int],
+                order: SortOrder, ordered=None):
+    """Sort `items` by `key` and return (page, next_cursor).
+
+    `key` must be unique per item (end it with a tie-breaker); `key_types`
+    gives the type of each of its elements. The first page is picked from
+    `items` with a bounded heap, O(n log limit). With a cursor, `ordered()`
+    returns the same items already sorted ascending by `key` (cached by the
+    caller), which is bisected to the cursor, so each further page costs
+    O(log n + limit) rather than another pass over every item.
+    """
+    descending = order == SortOrder.desc
+    if cursor:
+        after = decode_cursor(cursor, key_types)
+        items = ordered()
+        if descending:
+            end = bisect_left(items, after, key=key)
+            page = items[max(end - limit, 0) if limit else 0:end][::-1]
+        else:
+            start = bisect_right(items, after, key=key)
+            page = items[start:start + limit] if limit else items[start:]
+    elif limit is None:
+        return sorted(items, key=key, reverse=descending), None
+    else:
+        page = (heapq.nlargest if descending else heapq.nsmallest)(limit, items, key=key)
+    next_cursor = encode_cursor(key(page[-1])) if limit and len(page) == limit else None
+    return page, next_cursor
+
+def set_page_headers(response: Response, total: int, next_cursor: Optional[str]):
+    response.headers["X-Total-Count"] = str(total)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
 
 # Students
-@app.get("/api/students")
-def get_students(term_id: Optional[str] = None):
-    students = list(db.students.values())
+STUDENT_STAT_FIELDS = [
+    "total_hours", "verified_hours", "pending_hours", "percent_verified", "program_names",
+    "required_hours", "status", "risk_status", "risk_score", "progress",
+]
+STUDENT_FIELDS = [*Student.model_fields, *STUDENT_STAT_FIELDS]
+
+def student_row(student: Student, i: int, stats: dict, required_hours: float,
+                fields: Optional[List[str]] = None) -> dict:
+    """One participants-table row from the vectorized stats at student code `i`."""
+    # Sums over no logs stay int 0, matching sum() on an empty sequence
+    total_hours = round(float(stats["total_hours"][i]), 1) if stats["log_count"][i] else 0
+    verified_hours = round(float(stats["verified_hours"][i]), 1) if stats["verified_count"][i] else 0
+    pending_hours = round(float(stats["pending_hours"][i]), 1) if stats["pending_count"][i] else 0
+    percent_verified = round(float(stats["percent_verified"][i]), 1) if stats["total_hours"][i] > 0 else 0
+    risk_status = str(stats["risk_status"][i])
+
+    if fields is not None and "program_names" not in fields:
+        program_names = None
+    else:
+        program_names = [db.programs[pid].name for pid in student.program_ids if pid in db.programs]
+    stat_values = {
+        "total_hours": total_hours,
+        "verified_hours": verified_hours,
+        "pending_hours": pending_hours,
+        "percent_verified": percent_verified,
+        "program_names": program_names,
+        "required_hours": required_hours,
+        "status": risk_status,
+        "risk_status": risk_status,
+        "risk_score": int(stats["risk_score"][i]),
+        "progress": round(float(stats["progress"][i]), 1),
+    }
+    if fields is None:
+        return {**db.dump_row(db.student_dumps, student.student_id, student), **stat_values}
+    return {f: stat_values[f] if f in stat_values else getattr(student, f) for f in fields}
 
+@app.get("/api/students")
+@snapshot_read
+def get_students(
+    term_id: Optional[str] = None,
+    sort: Optional[StudentSort] = None,
+    order: SortOrder = SortOrder.asc,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
     term_program_ids = None
     required_hours = 20
     if term_id:
         if term_id not in db.terms:
             raise HTTPException(status_code=404, detail="Term not found")
-        term_program_ids = [p.program_id for p in db.programs.values() if p.term_id == term_id]
+        term_program_ids = db.term_program_ids(term_id)
         required_hours = db.terms[term_id].required_hours
+    projection = parse_fields(fields, STUDENT_FIELDS)
 
-    # Enrich with stats
-    enriched = []
-    for student in students:
-        # Filter by term if specified
-        if term_program_ids is not None:
-            student_logs = [
-                l for l in db.service_logs.values()
-                if l.student_id == student.student_id and l.program_id in term_program_ids
-            ]
+    # Aggregate hours and risk for all students at once
+    stats = db.log_columns.student_stats(term_program_ids, required_hours)
+    student_codes = db.log_columns.student_codes
+
+    if sort is None and limit is None and cursor is None:
+        response = fast_json([
+            student_row(student, student_codes[student.student_id], stats, required_hours, projection)
+            for student in db.students.values()
+        ])
+        set_page_headers(response, len(db.students), None)
+        return response
+
+    # Keyset over (sort value, student code), ordered with numpy
+    codes = np.fromiter((student_codes[sid] for sid in db.students), dtype=np.int64, count=len(db.students))
+    primary = stats[sort.value][codes] if sort else codes
+    descending = order == SortOrder.desc
+    if cursor:
+        after_value, after_code = decode_cursor(cursor, (NUMBER, int))
+        if descending:
+            keep = (primary < after_value) | ((primary == after_value) & (codes < after_code))
         else:
-            student_logs = [l for l in db.service_logs.values() if l.student_id == student.student_id]
+            keep = (primary > after_value) | ((primary == after_value) & (codes > after_code))
+        codes, primary = codes[keep], primary[keep]
+    ranked = np.lexsort((codes, primary))
+    if descending:
+        ranked = ranked[::-1]
+    if limit is not None:
+        ranked = ranked[:limit]
+
+    ids_by_code = db.log_columns.student_ids
+    page = [
+        student_row(db.students[ids_by_code[codes[j]]], int(codes[j]), stats, required_hours, projection)
+        for j in ranked
+    ]
+    next_cursor = None
+    if limit is not None and len(ranked) == limit:
+        last = ranked[-1]
+        next_cursor = encode_cursor((primary[last].item(), int(codes[last])))
+    response = fast_json(page)
+    set_page_headers(response, len(db.students), next_cursor)
+    return response
 
-        total_hours = sum(l.hours for l in student_logs)
-        verified_hours = sum(l.hours for l in student_logs if l.status == LogStatus.confirmed)
-        pending_hours = sum(l.hours for l in student_logs if l.status == LogStatus.pending)
+DEFAULT_AT_RISK_LIMIT = 10
 
-        # Get program names
-        program_names = [db.programs[pid].name for pid in student.program_ids if pid in db.programs]
+def term_student_row(student: Student, term_program_ids, required_hours: float) -> dict:
+    """A participants-table row for one student, summed over their own logs
+    in `term_program_ids` rather than the whole-store columns."""
+    total_hours = verified_hours = pending_hours = 0
+    for log in db.logs_by_student.get(student.student_id, {}).values():
+        if log.program_id in term_program_ids:
+            total_hours += log.hours
+            if log.status == LogStatus.confirmed:
+                verified_hours += log.hours
+            elif log.status == LogStatus.pending:
+                pending_hours += log.hours
+    risk = calculate_progress_risk(verified_hours=verified_hours, required_hours=required_hours)
+    return {
+        **db.dump_row(db.student_dumps, student.student_id, student),
+        "total_hours": round(total_hours, 1),
+        "verified_hours": round(verified_hours, 1),
+        "pending_hours": round(pending_hours, 1),
+        "percent_verified": round((verified_hours / total_hours * 100) if total_hours > 0 else 0, 1),
+        "program_names": [db.programs[pid].name for pid in student.program_ids if pid in db.programs],
+        "required_hours": required_hours,
+        "status": risk["risk_status"],
+        "risk_status": risk["risk_status"],
+        "risk_score": risk["risk_score"],
+        "progress": risk["progress"],
+    }
 
-        risk = calculate_progress_risk(verified_hours=verified_hours, required_hours=required_hours)
+@app.get("/api/students/at-risk")
+@snapshot_read
+def get_at_risk_students(
+    term_id: str,
+    limit: int = Query(DEFAULT_AT_RISK_LIMIT, ge=1, le=MAX_PAGE_SIZE),
+    program_id: Optional[str] = None,
+):
+    """The `limit` students of a term (or one of its programs) with the
+    lowest progress, highest risk first.
 
-        enriched.append({
-            **student.model_dump(),
-            "total_hours": round(total_hours, 1),
-            "verified_hours": round(verified_hours, 1),
-            "pending_hours": round(pending_hours, 1),
-            "percent_verified": round((verified_hours / total_hours * 100) if total_hours > 0 else 0, 1),
-            "program_names": program_names,
-            "required_hours": required_hours,
-            "status": risk["risk_status"],
-            "risk_status": risk["risk_status"],
-            "risk_score": risk["risk_score"],
-            "progress": risk["progress"],
-        })
+    Read straight off the term's RiskIndex, so only the returned students'
+    logs are summed; X-Total-Count is the number of students ranked.
+    """
+    if term_id not in db.terms:
+        raise HTTPException(status_code=404, detail="Term not found")
+    if program_id is not None and db.program_term(program_id) != term_id:
+        raise HTTPException(status_code=404, detail="Program not found in term")
 
-    return enriched
+    risk = db.term_aggregate(term_id).risk
+    total = risk.count(program_id)
+    cache_key = ("at-risk", term_id, program_id, limit)
+    cached = db.response_cache.get(cache_key)
+    if cached is None:
+        required_hours = db.terms[term_id].required_hours
+        term_program_ids = set(db.term_program_ids(term_id))
+        cached = [
+            term_student_row(db.students[student_id], term_program_ids, required_hours)
+            for _, student_id in risk.top(limit, program_id)
+        ]
+        db.cache_response(cache_key, cached, [("term", term_id)])
+    response = fast_json(cached)
+    set_page_headers(response, total, None)
+    return response
 
 @app.get("/api/students/{student_id}")
+@snapshot_read
 def get_student(student_id: str, term_id: Optional[str] = None):
     if student_id not in db.students:
         raise HTTPException(status_code=404, detail="Student not found")
@@ -400,11 +3077,16 @@ def get_student(student_id: str, term_id: Optional[str] = None):
         if term_id not in db.terms:
             raise HTTPException(status_code=404, detail="Term not found")
         required_hours = db.terms[term_id].required_hours
-        term_program_ids = [p.program_id for p in db.programs.values() if p.term_id == term_id]
+        term_program_ids = db.term_program_ids(term_id)
+    
+    cache_key = ("student", student_id, term_id or None)
+    cached = db.response_cache.get(cache_key)
+    if cached is not None:
+        return fast_json(cached)
 
     student_logs = [
-        l for l in db.service_logs.values()
-        if l.student_id == student_id and (term_program_ids is None or l.program_id in term_program_ids)
+        l for l in db.logs_by_student.get(student_id, {}).values()
+        if term_program_ids is None or l.program_id in term_program_ids
     ]
     
     # Enrich logs with program names
@@ -412,7 +3094,7 @@ def get_student(student_id: str, term_id: Optional[str] = None):
     for log in sorted(student_logs, key=lambda x: x.date, reverse=True):
         program = db.programs.get(log.program_id)
         enriched_logs.append({
-            **log.model_dump(),
+            **db.dump_row(db.log_dumps, log.log_id, log),
             "program_name": program.name if program else "Unknown"
         })
     
@@ -422,13 +3104,12 @@ def get_student(student_id: str, term_id: Optional[str] = None):
     program_names = [db.programs[pid].name for pid in student.program_ids if pid in db.programs]
     risk = calculate_progress_risk(verified_hours=verified_hours, required_hours=required_hours)
     
-    # Get audit events for this student's logs
-    log_ids = [l.log_id for l in student_logs]
-    vr_ids = [vr.request_id for vr in db.verification_requests.values() if vr.student_id == student_id]
-    relevant_audits = [e for e in db.audit_events if e.entity_id in vr_ids]
+    # Latest audit events for this student's verification requests
+    vr_ids = db.requests_by_student.get(student_id, {})
+    relevant_audits = db.audit_events.latest_for_entities(vr_ids, limit=10)
     
-    return {
-        **student.model_dump(),
+    result = {
+        **db.dump_row(db.student_dumps, student_id, student),
         "total_hours": round(total_hours, 1),
         "verified_hours": round(verified_hours, 1),
         "pending_hours": round(pending_hours, 1),
@@ -440,44 +3121,159 @@ def get_student(student_id: str, term_id: Optional[str] = None):
         "risk_score": risk["risk_score"],
         "progress": risk["progress"],
         "logs": enriched_logs,
-        "audit_history": relevant_audits[-10:]  # Last 10 events
+        "audit_history": [event.to_model() for event in relevant_audits]  # Last 10 events
+    }
+    db.cache_response(cache_key, result, [("student", student_id)])
+    return fast_json(result)
+
+# Search
+DEFAULT_SEARCH_LIMIT = 20
+
+def search_accepts(term_id: Optional[str]):
+    """accept(kind, entity_id) for SearchIndex.query: whether a hit belongs
+    to `term_id` (students by enrollment or a log in the term)."""
+    if term_id is None:
+        return lambda kind, entity_id: True
+    members = db.term_aggregate(term_id).risk.hours
+
+    def accept(kind: str, entity_id: str) -> bool:
+        if kind == "student":
+            return entity_id in members
+        if kind == "program":
+            return db.programs[entity_id].term_id == term_id
+        record = db.service_logs[entity_id] if kind == "log" else db.verification_requests[entity_id]
+        return db.program_term(record.program_id) == term_id
+    return accept
+
+def search_hit(kind: str, entity_id: str, match: str) -> dict:
+    if kind == "student":
+        student = db.students[entity_id]
+        return {"type": kind, "id": entity_id, "title": student.name, "subtitle": student.email,
+                "term_id": None, "match": match}
+    if kind == "program":
+        program = db.programs[entity_id]
+        return {"type": kind, "id": entity_id, "title": program.name, "subtitle": program.type.value,
+                "term_id": program.term_id, "match": match}
+    record = db.service_logs[entity_id] if kind == "log" else db.verification_requests[entity_id]
+    student = db.students.get(record.student_id)
+    return {
+        "type": kind,
+        "id": entity_id,
+        "title": record.description if kind == "log" else record.ngo_name,
+        "subtitle": student.name if student else record.student_id,
+        "term_id": db.program_term(record.program_id),
+        "match": match,
+        "student_id": record.student_id,
+        "program_id": record.program_id,
     }
 
+@app.get("/api/search")
+@snapshot_read
+def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    term_id: Optional[str] = None,
+    types: Optional[str] = None,
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+):
+    """Students (name, email), programs (name), verification requests (NGO)
+    and service logs (description) matching every word of `q`, the last
+    word also as a prefix.
+
+    Ranked by type in that order, then exact before prefix matches, then
+    newest first. `types=` is a comma-separated subset of the types; the
+    next page is behind X-Next-Cursor.
+    """
+    if term_id is not None and term_id not in db.terms:
+        raise HTTPException(status_code=404, detail="Term not found")
+    requested = {t.strip() for t in types.split(",") if t.strip()} if types else set(SearchIndex.TYPES)
+    unknown = requested - set(SearchIndex.TYPES)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown types: {', '.join(sorted(unknown))}")
+    kinds = [kind for kind in SearchIndex.TYPES if kind in requested]
+    after = None
+    if cursor:
+        after = decode_cursor(cursor, (str, str, int))
+        if after[0] not in SearchIndex.TYPES or after[1] not in SearchIndex.MATCHES or not isinstance(after[2], int):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    hits, next_key = db.search.query(q, kinds, search_accepts(term_id), limit, after)
+    response = fast_json([search_hit(*hit) for hit in hits])
+    if next_key:
+        response.headers["X-Next-Cursor"] = encode_cursor(next_key)
+    return response
+
 # Service Logs
-@app.get("/api/service-logs")
-def get_service_logs(term_id: Optional[str] = None, status: Optional[LogStatus] = None, student_id: Optional[str] = None):
-    logs = list(db.service_logs.values())
-    if term_id:
-        term_program_ids = [p.program_id for p in db.programs.values() if p.term_id == term_id]
-        logs = [l for l in logs if l.program_id in term_program_ids]
-    if status:
-        logs = [l for l in logs if l.status == status]
-    if student_id:
-        logs = [l for l in logs if l.student_id == student_id]
-    
-    # Enrich with student and program data
-    enriched = []
-    for log in logs:
+LOG_ENRICHMENT_FIELDS = ["student_name", "student_email", "program_name"]
+LOG_FIELDS = [*ServiceLog.model_fields, *LOG_ENRICHMENT_FIELDS]
+
+def log_row(log: LogRecord, fields: Optional[List[str]] = None) -> dict:
+    if fields is None:
         student = db.students.get(log.student_id)
         program = db.programs.get(log.program_id)
-        enriched.append({
-            **log.model_dump(),
+        return {
+            **db.dump_row(db.log_dumps, log.log_id, log),
             "student_name": student.name if student else "Unknown",
             "student_email": student.email if student else "",
             "program_name": program.name if program else "Unknown"
-        })
+        }
+    
+    # Only join the student/program when one of their columns is requested
+    row = {}
+    student = db.students.get(log.student_id) if "student_name" in fields or "student_email" in fields else None
+    for field in fields:
+        if field == "student_name":
+            row[field] = student.name if student else "Unknown"
+        elif field == "student_email":
+            row[field] = student.email if student else ""
+        elif field == "program_name":
+            program = db.programs.get(log.program_id)
+            row[field] = program.name if program else "Unknown"
+        else:
+            row[field] = getattr(log, field)
+    return row
+
+@app.get("/api/service-logs")
+@snapshot_read
+def get_service_logs(
+    term_id: Optional[str] = None,
+    status: Optional[LogStatus] = None,
+    student_id: Optional[str] = None,
+    sort: Optional[LogSort] = None,
+    order: SortOrder = SortOrder.asc,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    filters = {"term_id": term_id or None, "status": status or None, "student_id": student_id or None}
+    projection = parse_fields(fields, LOG_FIELDS)
+    total = db.count_logs(**filters)
+    
+    if sort is None and limit is None and cursor is None:
+        logs = db.find_logs(**filters)
+        next_cursor = None
+    else:
+        # Keys end with the creation ordinal so they are unique and stable
+        if sort == LogSort.date:
+            key, key_types = (lambda l: (l.date, db.log_order(l))), (str, int)
+        elif sort == LogSort.hours:
+            key, key_types = (lambda l: (l.hours, db.log_order(l))), (NUMBER, int)
+        else:
+            key, key_types = (lambda l: (db.log_order(l),)), (int,)
+        logs, next_cursor = keyset_page(
+            db.iter_logs(**filters), key, key_types, cursor, limit, order,
+            ordered=lambda: db.sorted_logs(sort.value if sort else "created", key, **filters),
+        )
     
-    return enriched
+    # Enrich with student and program data
+    response = fast_json([log_row(log, projection) for log in logs])
+    set_page_headers(response, total, next_cursor)
+    return response
 
 # Verification Requests
 @app.get("/api/verification-requests")
+@snapshot_read
 def get_verification_requests(term_id: Optional[str] = None, status: Optional[VerificationStatus] = None):
-    requests = list(db.verification_requests.values())
-    if term_id:
-        term_program_ids = [p.program_id for p in db.programs.values() if p.term_id == term_id]
-        requests = [r for r in requests if r.program_id in term_program_ids]
-    if status:
-        requests = [r for r in requests if r.status == status]
+    requests = db.find_requests(term_id=term_id or None, status=status or None)
     
     # Enrich with student and log data
     enriched = []
@@ -486,7 +3282,7 @@ def get_verification_requests(term_id: Optional[str] = None, status: Optional[Ve
         program = db.programs.get(req.program_id)
         log = db.service_logs.get(req.log_id)
         enriched.append({
-            **req.model_dump(),
+            **db.dump_row(db.request_dumps, req.request_id, req),
             "student_name": student.name if student else "Unknown",
             "student_email": student.email if student else "",
             "student_avatar": student.avatar if student else "?",
@@ -494,42 +3290,34 @@ def get_verification_requests(term_id: Optional[str] = None, status: Optional[Ve
             "hours": log.hours if log else 0,
             "log_date": log.date if log else "",
             "evidence_tier": log.evidence_tier.value if log else "self_reported",
-            "description": log.description if log else ""
+            "description": log.description if log else "",
+            "possible_duplicate_of": duplicate[0] if log and (duplicate := db.possible_duplicate(log)) else None,
         })
     
-    return enriched
+    return fast_json(enriched)
 
 # KPIs - Now fully derived from data
-@app.get("/api/kpis")
-def get_kpis(term_id: str = "spring-2026"):
-    # Get programs for this term
-    term_programs = [p for p in db.programs.values() if p.term_id == term_id]
-    term_program_ids = [p.program_id for p in term_programs]
-    
-    # Get all logs for this term
-    term_logs = [l for l in db.service_logs.values() if l.program_id in term_program_ids]
+def kpis_for(store: "DataStore", term_id: str) -> dict:
+    """The /api/kpis payload for one term of `store`, cached per term."""
+    cache_key = ("kpis", term_id)
+    cached = store.response_cache.get(cache_key)
+    if cached is not None:
+        return cached
     
-    # Calculate verified hours
-    confirmed_logs = [l for l in term_logs if l.status == LogStatus.confirmed]
-    verified_hours = sum(l.hours for l in confirmed_logs)
-    
-    # Get unique students with any logs in this term
-    all_student_ids = set(l.student_id for l in term_logs)
-    active_students = len(all_student_ids)
+    aggregate = store.term_aggregate(term_id)
+    verified_hours = aggregate.verified_hours
+    active_students = aggregate.active_students
     
     # Active programs count
-    active_programs = len(term_programs)
+    active_programs = len(store.programs_by_term.get(term_id, {}))
     
     # Calculate retention rate (students with verified hours / total students)
-    students_with_verified = set(l.student_id for l in confirmed_logs)
-    retention_rate = round((len(students_with_verified) / active_students * 100) if active_students > 0 else 0)
+    retention_rate = round((aggregate.students_with_verified / active_students * 100) if active_students > 0 else 0)
     
     # Calculate deltas (comparing to baseline or previous term)
-    if term_id == "spring-2026":
-        # Compare to fall-2025
-        fall_programs = [p.program_id for p in db.programs.values() if p.term_id == "fall-2025"]
-        fall_logs = [l for l in db.service_logs.values() if l.program_id in fall_programs and l.status == LogStatus.confirmed]
-        fall_hours = sum(l.hours for l in fall_logs)
+    if term_id in KPI_COMPARISON_TERMS:
+        # Compare to the previous term (fall-2025 for spring-2026)
+        fall_hours = store.term_aggregate(KPI_COMPARISON_TERMS[term_id]).verified_hours
         hours_delta = f"+{round((verified_hours - fall_hours) / fall_hours * 100) if fall_hours > 0 else 0}% vs last semester"
         students_delta = f"+{active_students} active this term"
         programs_delta = f"{active_programs} programs running"
@@ -540,140 +3328,346 @@ def get_kpis(term_id: str = "spring-2026"):
         programs_delta = f"{active_programs} programs"
         retention_delta = f"{retention_rate}% rate"
     
-    return {
+    result = {
         "verified_hours": {"value": round(verified_hours, 1), "delta": hours_delta},
         "active_students": {"value": active_students, "delta": students_delta},
         "active_programs": {"value": active_programs, "delta": programs_delta},
         "retention_rate": {"value": retention_rate, "delta": retention_delta}
     }
+    tags = [("term", term_id)]
+    if term_id in KPI_COMPARISON_TERMS:
+        tags.append(("term", KPI_COMPARISON_TERMS[term_id]))
+    store.cache_response(cache_key, result, tags)
+    return result
+
+@app.get("/api/kpis")
+@snapshot_read
+def get_kpis(term_id: str = "spring-2026"):
+    return kpis_for(db, term_id)
+
+@app.get("/api/cache/stats")
+def get_cache_stats():
+    """Response cache counters for monitoring."""
+    return db.response_cache.stats()
+
+@app.get("/api/metrics")
+def get_metrics():
+    """Request, store and export metrics in the Prometheus text format."""
+    return Response(metrics.render(db), media_type="text/plain; version=0.0.4")
+
+@app.get("/api/kpis/consistency")
+@snapshot_read
+def check_kpis_consistency(term_id: Optional[str] = None):
+    """Recompute KPI aggregates from scratch and report any drift."""
+    if term_id and term_id not in db.terms:
+        raise HTTPException(status_code=404, detail="Term not found")
+    mismatches = db.check_term_aggregates(term_id)
+    return {"consistent": not mismatches, "mismatches": mismatches}
+
+class TimeSeriesGroup(str, Enum):
+    program = "program"
+    evidence_tier = "evidence_tier"
+
+MAX_TIMESERIES_PERIODS = 1000
+# start/end must be exactly a date; day_ordinal alone reads any string's first 10 chars
+ISO_DAY = r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$"
+
+@app.get("/api/timeseries")
+@snapshot_read
+def get_timeseries(
+    term_id: str,
+    granularity: Granularity = Granularity.week,
+    start: Optional[str] = Query(None, pattern=ISO_DAY),
+    end: Optional[str] = Query(None, pattern=ISO_DAY),
+    program_id: Optional[str] = None,
+    evidence_tier: Optional[EvidenceTier] = None,
+    group_by: Optional[TimeSeriesGroup] = None,
+):
+    """Logged/verified/pending hours, log counts and confirmations of a
+    term per day or week (weeks start on Monday), between `start` and `end`
+    (YYYY-MM-DD, default: the term's dates).
+
+    Read off the term's TimeSeries rollup; every period in the range is
+    listed, empty ones as zeros. `group_by` splits the series per program
+    or evidence tier.
+    """
+    if term_id not in db.terms:
+        raise HTTPException(status_code=404, detail="Term not found")
+    if program_id is not None and db.program_term(program_id) != term_id:
+        raise HTTPException(status_code=404, detail="Program not found in term")
+    term = db.terms[term_id]
+    first, last = day_ordinal(start or term.start_date), day_ordinal(end or term.end_date)
+    if first is None or last is None:
+        raise HTTPException(status_code=422, detail="start and end must be YYYY-MM-DD dates")
+    first, last = period_start(first, granularity), period_start(last, granularity)
+    step = 7 if granularity == Granularity.week else 1
+    if last < first or (last - first) // step + 1 > MAX_TIMESERIES_PERIODS:
+        raise HTTPException(
+            status_code=400, detail=f"Range must cover 1 to {MAX_TIMESERIES_PERIODS} {granularity.value}s"
+        )
+
+    group = group_by.value if group_by else None
+    cache_key = ("timeseries", term_id, granularity, first, last, program_id, evidence_tier, group)
+    cached = db.response_cache.get(cache_key)
+    if cached is None:
+        groups = db.term_aggregate(term_id).timeseries.query(
+            granularity, first, last, program_id, evidence_tier, group
+        )
+        if group is None:
+            groups.setdefault(None, {})
+        zero = [0] * len(TimeSeries.FIELDS)
+        cached = {
+            "term_id": term_id,
+            "granularity": granularity.value,
+            "start": datetime.fromordinal(first).date().isoformat(),
+            "end": datetime.fromordinal(last).date().isoformat(),
+            "group_by": group,
+            "series": [
+                {
+                    "key": key,
+                    "points": [
+                        {
+                            "period": datetime.fromordinal(period).date().isoformat(),
+                            **{
+                                field: round(value, 6)
+                                for field, value in zip(TimeSeries.FIELDS, periods.get(period, zero))
+                            },
+                        }
+                        for period in range(first, last + 1, step)
+                    ],
+                }
+                for key, periods in sorted(groups.items(), key=lambda item: item[0] or "")
+            ],
+        }
+        db.cache_response(cache_key, cached, [("term", term_id)])
+    return fast_json(cached)
 
 # Verification Actions
-@app.post("/api/verification-requests/confirm")
-def confirm_verification(request: ConfirmRequest):
-    user = get_current_user()
-    
-    if request.request_id not in db.verification_requests:
+def lookup_verification(request_id: str):
+    """The request and its log, or an HTTPException if either is missing."""
+    if request_id not in db.verification_requests:
         raise HTTPException(status_code=404, detail="Verification request not found")
     
-    vr = db.verification_requests[request.request_id]
+    vr = db.verification_requests[request_id]
     log = db.service_logs.get(vr.log_id)
     
     if not log:
         raise HTTPException(status_code=404, detail="Associated service log not found")
+    return vr, log
+
+def apply_verification_action(vr: RequestRecord, log: LogRecord, action: VerificationAction,
+                              reason: Optional[str], user: dict, now: str) -> AuditEvent:
+    """Update the log and request for one action; returns the (unsaved) audit event.
+
+    Callers wrap this in db.transaction() together with saving the event.
+    """
+    student = db.students.get(vr.student_id)
+    student_name = student.name if student else 'Unknown'
     
-    now = datetime.now(timezone.utc).isoformat()
-    
-    # Update service log
-    log.status = LogStatus.confirmed
-    log.evidence_tier = EvidenceTier.org_confirmed
-    log.updated_at = now
-    db.service_logs[log.log_id] = log
-    
-    # Update verification request
-    vr.status = VerificationStatus.confirmed
-    db.verification_requests[vr.request_id] = vr
+    if action == VerificationAction.confirm:
+        db.set_log_status(log, LogStatus.confirmed, now, evidence_tier=EvidenceTier.org_confirmed)
+        db.set_request_status(vr, VerificationStatus.confirmed)
+        notes = f"Confirmed by {user['name']}. Student: {student_name}. Hours: {log.hours}"
+    elif action == VerificationAction.reject:
+        db.set_log_status(log, LogStatus.rejected, now)
+        db.set_request_status(vr, VerificationStatus.rejected)
+        notes = f"Rejected by {user['name']}. Reason: {reason}. Student: {student_name}"
+    else:
+        db.set_log_status(log, LogStatus.flagged, now)
+        # Keep request but mark as flagged (doesn't disappear, but status changes)
+        db.set_request_status(vr, VerificationStatus.rejected)  # Using rejected to remove from queue
+        notes = f"Flagged by {user['name']}. Reason: {reason}. Student: {student_name}"
     
-    # Create audit event
-    student = db.students.get(vr.student_id)
-    audit = AuditEvent(
+    return AuditEvent(
         event_id=str(uuid.uuid4()),
         actor_id=user["user_id"],
         actor_role=ActorRole.university_admin,
         entity_type=EntityType.verification_request,
         entity_id=vr.request_id,
-        action=AuditAction.confirm,
+        action=AuditAction(action.value),
         timestamp=now,
-        notes=f"Confirmed by {user['name']}. Student: {student.name if student else 'Unknown'}. Hours: {log.hours}"
+        notes=notes
     )
-    db.audit_events.append(audit)
+
+def publish_verification_changes(store: "DataStore", pairs):
+    """Push the new request/log statuses and the affected terms' KPIs to /api/changes.
+
+    Called at the end of the action's transaction, under the writer lock,
+    so events are numbered in commit order.
+    """
+    deltas = []
+    term_ids = {}
+    for vr, log in pairs:
+        term_id = store.program_term(vr.program_id)
+        deltas.append(("request_status", term_id, {
+            "request_id": vr.request_id, "log_id": vr.log_id, "student_id": vr.student_id,
+            "program_id": vr.program_id, "status": vr.status.value,
+        }))
+        deltas.append(("log_status", term_id, {
+            "log_id": log.log_id, "student_id": log.student_id, "program_id": log.program_id,
+            "status": log.status.value, "evidence_tier": log.evidence_tier.value,
+            "hours": log.hours, "updated_at": log.updated_at,
+        }))
+        if term_id:
+            term_ids[term_id] = None
+    # A term's KPI deltas are relative to its comparison term
+    term_ids.update({t: None for t, previous in KPI_COMPARISON_TERMS.items() if previous in term_ids})
+    for term_id in term_ids:
+        deltas.append(("kpis", term_id, {"term_id": term_id, **kpis_for(store, term_id)}))
+    if deltas:
+        store.publish(deltas)
+
+@app.post("/api/verification-requests/confirm")
+def confirm_verification(request: ConfirmRequest):
+    user = get_current_user()
+    now = datetime.now(timezone.utc).isoformat()
+    
+    with db.transaction():
+        vr, log = lookup_verification(request.request_id)
+        audit = db.add_audit_event(apply_verification_action(vr, log, VerificationAction.confirm, None, user, now))
+        publish_verification_changes(db, [(vr, log)])
     
     return {"success": True, "message": "Verification confirmed", "hours_added": log.hours, "audit_event_id": audit.event_id}
 
 @app.post("/api/verification-requests/reject")
 def reject_verification(request: RejectRequest):
     user = get_current_user()
-    
-    if request.request_id not in db.verification_requests:
-        raise HTTPException(status_code=404, detail="Verification request not found")
-    
-    vr = db.verification_requests[request.request_id]
-    log = db.service_logs.get(vr.log_id)
-    
-    if not log:
-        raise HTTPException(status_code=404, detail="Associated service log not found")
-    
     now = datetime.now(timezone.utc).isoformat()
     
-    # Update service log
-    log.status = LogStatus.rejected
-    log.updated_at = now
-    db.service_logs[log.log_id] = log
-    
-    # Update verification request
-    vr.status = VerificationStatus.rejected
-    db.verification_requests[vr.request_id] = vr
-    
-    # Create audit event
-    student = db.students.get(vr.student_id)
-    audit = AuditEvent(
-        event_id=str(uuid.uuid4()),
-        actor_id=user["user_id"],
-        actor_role=ActorRole.university_admin,
-        entity_type=EntityType.verification_request,
-        entity_id=vr.request_id,
-        action=AuditAction.reject,
-        timestamp=now,
-        notes=f"Rejected by {user['name']}. Reason: {request.reason.value}. Student: {student.name if student else 'Unknown'}"
-    )
-    db.audit_events.append(audit)
+    with db.transaction():
+        vr, log = lookup_verification(request.request_id)
+        db.add_audit_event(apply_verification_action(vr, log, VerificationAction.reject, request.reason.value, user, now))
+        publish_verification_changes(db, [(vr, log)])
     
     return {"success": True, "message": "Verification rejected", "reason": request.reason.value}
 
 @app.post("/api/verification-requests/flag")
 def flag_verification(request: FlagRequest):
     user = get_current_user()
+    now = datetime.now(timezone.utc).isoformat()
     
-    if request.request_id not in db.verification_requests:
-        raise HTTPException(status_code=404, detail="Verification request not found")
-    
-    vr = db.verification_requests[request.request_id]
-    log = db.service_logs.get(vr.log_id)
-    
-    if not log:
-        raise HTTPException(status_code=404, detail="Associated service log not found")
+    with db.transaction():
+        vr, log = lookup_verification(request.request_id)
+        db.add_audit_event(apply_verification_action(vr, log, VerificationAction.flag, request.reason, user, now))
+        publish_verification_changes(db, [(vr, log)])
     
+    return {"success": True, "message": "Verification flagged for review"}
+
+REJECTION_REASONS = {r.value for r in RejectionReason}
+
+@app.post("/api/verification-requests/bulk")
+def bulk_verification(request: BulkVerificationRequest):
+    """Apply many confirm/reject/flag actions in one transaction.
+
+    Items are validated and applied in order; a bad item is reported in
+    its result and skipped without affecting the others.
+    """
+    user = get_current_user()
     now = datetime.now(timezone.utc).isoformat()
+    results = []
+    events = []
+    applied = []
     
-    # Update service log
-    log.status = LogStatus.flagged
-    log.updated_at = now
-    db.service_logs[log.log_id] = log
-    
-    # Keep request but mark as flagged (doesn't disappear, but status changes)
-    vr.status = VerificationStatus.rejected  # Using rejected to remove from queue
-    db.verification_requests[vr.request_id] = vr
+    with db.transaction():
+        for item in request.items:
+            result = {"request_id": item.request_id, "action": item.action.value}
+            try:
+                vr, log = lookup_verification(item.request_id)
+            except HTTPException as e:
+                results.append({**result, "success": False, "error": e.detail})
+                continue
+            if item.action == VerificationAction.reject and item.reason not in REJECTION_REASONS:
+                results.append({**result, "success": False, "error": f"Invalid rejection reason: {item.reason}"})
+                continue
+            if item.action == VerificationAction.flag and not item.reason:
+                results.append({**result, "success": False, "error": "A reason is required to flag a request"})
+                continue
+            
+            audit = apply_verification_action(vr, log, item.action, item.reason, user, now)
+            events.append(audit)
+            applied.append((vr, log))
+            results.append({**result, "success": True, "audit_event_id": audit.event_id})
+        
+        db.add_audit_events(events)
+        publish_verification_changes(db, applied)
     
-    # Create audit event
-    student = db.students.get(vr.student_id)
-    audit = AuditEvent(
-        event_id=str(uuid.uuid4()),
-        actor_id=user["user_id"],
-        actor_role=ActorRole.university_admin,
-        entity_type=EntityType.verification_request,
-        entity_id=vr.request_id,
-        action=AuditAction.flag,
-        timestamp=now,
-        notes=f"Flagged by {user['name']}. Reason: {request.reason}. Student: {student.name if student else 'Unknown'}"
+    succeeded = sum(1 for r in results if r["success"])
+    return {"success": succeeded == len(results), "processed": succeeded, "failed": len(results) - succeeded, "results": results}
+
+# Change Stream
+CHANGE_KEEPALIVE_SECONDS = 15
+
+
+def sse_message(event_id: Optional[str], kind: str, data) -> str:
+    head = f"id: {event_id}\n" if event_id else ""
+    return f"{head}event: {kind}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
+@app.get("/api/changes")
+async def stream_changes(request: Request, term_id: Optional[str] = None, since: Optional[str] = None):
+    """Server-sent events for verification actions: request_status,
+    log_status and kpis (the full /api/kpis body for the affected term).
+
+    Resume with ?since=<event id> or the Last-Event-ID header browsers send
+    on reconnect. Without either the stream starts at the current position;
+    a `reset` event means events were missed and the client should refetch.
+    """
+    cursor_token = since or request.headers.get("last-event-id")
+    # The request's tenant; the stream keeps it loaded until it closes
+    changes = db.changes
+
+    async def events():
+        waiter = changes.subscribe()
+        try:
+            cursor = changes.parse_cursor(cursor_token) if cursor_token else changes.seq
+            if cursor is None:
+                cursor = changes.seq
+                yield sse_message(None, "reset", {"reason": "unknown cursor"})
+            while True:
+                waiter.clear()
+                batch, latest = changes.since(cursor, term_id)
+                if batch is None:
+                    yield sse_message(None, "reset", {"reason": "events expired"})
+                else:
+                    chunk = "".join(sse_message(changes.event_id(seq), kind, data) for seq, kind, _, data in batch)
+                    if chunk:
+                        yield chunk
+                cursor = latest
+                try:
+                    await asyncio.wait_for(waiter.wait(), CHANGE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            changes.unsubscribe(waiter)
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
-    db.audit_events.append(audit)
-    
-    return {"success": True, "message": "Verification flagged for review"}
 
 # Audit Events
 @app.get("/api/audit-events")
-def get_audit_events(term_id: Optional[str] = None, limit: int = 100):
-    events = db.audit_events[-limit:]
-    return list(reversed(events))
+@snapshot_read
+def get_audit_events(
+    term_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    after_seq: Optional[int] = None,
+    before_seq: Optional[int] = None,
+    entity_id: Optional[str] = None,
+    actor_id: Optional[str] = None,
+    action: Optional[AuditAction] = None,
+):
+    # Newest first by default; pass the last seq seen as after_seq to tail
+    # forward or as before_seq to page further back
+    return fast_json(db.audit_events.query(
+        entity_id=entity_id,
+        actor_id=actor_id,
+        action=action,
+        term_id=term_id or None,
+        after_seq=after_seq,
+        before_seq=before_seq,
+        limit=limit,
+    ))
 
 # Settings
 @app.get("/api/settings")
@@ -683,71 +3677,107 @@ def get_settings():
 @app.put("/api/settings")
 def update_settings(request: UpdateSettingsRequest):
     user = get_current_user()
-    db.settings.university_name = request.university_name
-    if request.dashboard_title is not None:
-        db.settings.dashboard_title = request.dashboard_title
-    
-    audit = AuditEvent(
-        event_id=str(uuid.uuid4()),
-        actor_id=user["user_id"],
-        actor_role=ActorRole.university_admin,
-        entity_type=EntityType.service_log,
-        entity_id="settings",
-        action=AuditAction.edit,
-        timestamp=datetime.now(timezone.utc).isoformat(),
-        notes=(
-            f"Settings updated. University name: {request.university_name}. "
-            f"Dashboard title: {db.settings.dashboard_title}"
+    with db.transaction():
+        db.update_settings(request.university_name, request.dashboard_title)
+        
+        audit = AuditEvent(
+            event_id=str(uuid.uuid4()),
+            actor_id=user["user_id"],
+            actor_role=ActorRole.university_admin,
+            entity_type=EntityType.service_log,
+            entity_id="settings",
+            action=AuditAction.edit,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            notes=(
+                f"Settings updated. University name: {request.university_name}. "
+                f"Dashboard title: {db.settings.dashboard_title}"
+            )
         )
-    )
-    db.audit_events.append(audit)
+        db.add_audit_event(audit)
     
     return db.settings
 
 # Export Endpoints
+EXPORT_CHUNK_ROWS = 500
+
+
+def stream_csv(header: List[str], rows, compress: bool = False):
+    """Yield CSV text (or gzip bytes) in chunks of EXPORT_CHUNK_ROWS rows.
+
+    Only one chunk is buffered at a time, so memory stays flat no matter
+    how many rows the export has.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    compressor = zlib.compressobj(wbits=31) if compress else None  # 31 = gzip container
+
+    def flush():
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return compressor.compress(chunk.encode("utf-8")) if compressor else chunk
+
+    writer.writerow(header)
+    pending = 1
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= EXPORT_CHUNK_ROWS:
+            pending = 0
+            chunk = flush()
+            if chunk:
+                yield chunk
+    chunk = flush()
+    if chunk:
+        yield chunk
+    if compressor:
+        yield compressor.flush()
+
+
+def csv_response(rows, header: List[str], filename: str, compress: bool = False):
+    if compress:
+        return StreamingResponse(
+            stream_csv(header, rows, compress=True),
+            media_type="application/gzip",
+            headers={"Content-Disposition": f"attachment; filename={filename}.gz"}
+        )
+    return StreamingResponse(
+        stream_csv(header, rows),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
 @app.get("/api/export/verified-logs")
-def export_verified_logs(term_id: str = "spring-2026"):
+def export_verified_logs(term_id: str = "spring-2026", gzip: bool = False):
     user = get_current_user()
     term = db.terms.get(term_id)
+    term_name = term.name if term else term_id
     
-    term_program_ids = [p.program_id for p in db.programs.values() if p.term_id == term_id]
-    logs = [l for l in db.service_logs.values() 
-            if l.program_id in term_program_ids and l.status == LogStatus.confirmed]
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Full audit-ready headers
-    writer.writerow([
-        "student_name", "student_email", "program_name", "term_name",
-        "log_date", "hours", "evidence_tier", "status", "description",
-        "verifier", "verification_timestamp", "rejection_reason"
-    ])
+    logs = db.read(db.find_logs, term_id=term_id, status=LogStatus.confirmed)
     
-    for log in logs:
-        student = db.students.get(log.student_id)
-        program = db.programs.get(log.program_id)
-        
-        # Find verification event for this log
-        vr = next((v for v in db.verification_requests.values() if v.log_id == log.log_id), None)
-        audit = None
-        if vr:
-            audit = next((e for e in db.audit_events if e.entity_id == vr.request_id and e.action == AuditAction.confirm), None)
-        
-        writer.writerow([
-            student.name if student else "Unknown",
-            student.email if student else "",
-            program.name if program else "Unknown",
-            term.name if term else term_id,
-            log.date,
-            log.hours,
-            log.evidence_tier.value,
-            log.status.value,
-            log.description,
-            audit.actor_id if audit else "system",
-            audit.timestamp if audit else log.updated_at,
-            ""  # No rejection reason for confirmed logs
-        ])
+    def rows():
+        for log in logs:
+            student = db.students.get(log.student_id)
+            program = db.programs.get(log.program_id)
+            
+            # Find verification event for this log
+            vr = db.request_by_log.get(log.log_id)
+            audit = db.audit_events.confirm_events.get(vr.request_id) if vr else None
+            
+            yield [
+                student.name if student else "Unknown",
+                student.email if student else "",
+                program.name if program else "Unknown",
+                term_name,
+                log.date,
+                log.hours,
+                log.evidence_tier.value,
+                log.status.value,
+                log.description,
+                audit.actor_id if audit else "system",
+                audit.timestamp if audit else log.updated_at,
+                ""  # No rejection reason for confirmed logs
+            ]
     
     # Create audit event for export
     audit = AuditEvent(
@@ -758,34 +3788,32 @@ def export_verified_logs(term_id: str = "spring-2026"):
         entity_id=f"verified-logs-{term_id}",
         action=AuditAction.export,
         timestamp=datetime.now(timezone.utc).isoformat(),
-        notes=f"Exported verified logs for {term.name if term else term_id}. {len(logs)} records."
+        term_id=term_id if term else None,
+        notes=f"Exported verified logs for {term_name}. {len(logs)} records."
     )
-    db.audit_events.append(audit)
+    db.add_audit_event(audit)
+    metrics.count_export("verified-logs", len(logs))
     
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename=verified_logs_{term_id}.csv"}
-    )
+    # Full audit-ready headers
+    header = [
+        "student_name", "student_email", "program_name", "term_name",
+        "log_date", "hours", "evidence_tier", "status", "description",
+        "verifier", "verification_timestamp", "rejection_reason"
+    ]
+    return csv_response(rows(), header, f"verified_logs_{term_id}.csv", compress=gzip)
 
 @app.get("/api/export/audit-trail")
-def export_audit_trail(term_id: str = "spring-2026"):
+def export_audit_trail(term_id: str = "spring-2026", gzip: bool = False):
     user = get_current_user()
     term = db.terms.get(term_id)
     
-    events = db.audit_events
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
+    # Bound the export at the current length so the export's own audit event
+    # (and anything appended while streaming) isn't included
+    event_count = len(db.audit_events)
+    events = islice(db.audit_events, event_count)
     
-    writer.writerow([
-        "event_id", "actor_id", "actor_role", "entity_type",
-        "entity_id", "action", "timestamp", "notes"
-    ])
-    
-    for event in events:
-        writer.writerow([
+    rows = (
+        [
             event.event_id,
             event.actor_id,
             event.actor_role.value,
@@ -794,7 +3822,9 @@ def export_audit_trail(term_id: str = "spring-2026"):
             event.action.value,
             event.timestamp,
             event.notes
-        ])
+        ]
+        for event in events
+    )
     
     audit = AuditEvent(
         event_id=str(uuid.uuid4()),
@@ -804,13 +3834,314 @@ def export_audit_trail(term_id: str = "spring-2026"):
         entity_id=f"audit-trail-{term_id}",
         action=AuditAction.export,
         timestamp=datetime.now(timezone.utc).isoformat(),
-        notes=f"Exported audit trail for {term.name if term else term_id}. {len(events)} events."
+        term_id=term_id if term else None,
+        notes=f"Exported audit trail for {term.name if term else term_id}. {event_count} events."
     )
-    db.audit_events.append(audit)
+    db.add_audit_event(audit)
+    metrics.count_export("audit-trail", event_count)
     
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename=audit_trail_{term_id}.csv"}
-    )
+    header = [
+        "event_id", "actor_id", "actor_role", "entity_type",
+        "entity_id", "action", "timestamp", "notes"
+    ]
+    return csv_response(rows, header, f"audit_trail_{term_id}.csv", compress=gzip)
+
+# Import Endpoints
+class ImportFormat(str, Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+IMPORT_REQUIRED_FIELDS = ["student_id", "program_id", "date", "hours", "description"]
+IMPORT_OPTIONAL_FIELDS = ["log_id", "term_id", "evidence_tier", "ngo_name"]
+IMPORT_BATCH_ROWS = 10000
+MAX_LOG_HOURS = 24
+# Per-row errors listed in a report; the rest are only counted
+MAX_REPORTED_ERRORS = 1000
+# Request bodies larger than this are spooled to disk while they arrive
+IMPORT_SPOOL_BYTES = 8 * 1024 * 1024
+
+
+def iter_import_rows(stream, fmt: ImportFormat):
+    """Yield (row number, dict or error message) from a binary CSV/NDJSON stream.
+
+    Rows are numbered from 1 (the CSV header is not a row, blank NDJSON
+    lines are). A CSV without the required columns raises ValueError
+    before any row is yielded.
+    """
+    if fmt == ImportFormat.ndjson:
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                row = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                yield number, f"Invalid JSON: {e}"
+                continue
+            yield number, row if isinstance(row, dict) else "Expected a JSON object"
+        return
+
+    reader = csv.reader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    header = [name.strip() for name in next(reader, [])]
+    missing = [name for name in IMPORT_REQUIRED_FIELDS if name not in header]
+    if missing:
+        raise ValueError(f"CSV is missing required columns: {', '.join(missing)}")
+    for number, values in enumerate(reader, 1):
+        if len(values) != len(header):
+            if not any(values):
+                continue
+            yield number, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield number, dict(zip(header, values))
+
+
+class LogImport:
+    """Turns parsed rows into pending service logs with verification requests.
+
+    Rows are validated against the store with dict lookups (student,
+    program, enrollment, the program's term and its date range) and
+    committed IMPORT_BATCH_ROWS at a time, each batch in one transaction
+    together with one audit event per affected term. Invalid rows are
+    reported by number and skipped; they never abort the import.
+    """
+
+    def __init__(self, store: "DataStore", source: str, actor_id: str, actor_role: ActorRole,
+                 batch_size: int = IMPORT_BATCH_ROWS):
+        self.store = store
+        self.source = source
+        self.actor_id = actor_id
+        self.actor_role = actor_role
+        self.batch_size = batch_size
+        self.import_id = f"imp-{uuid.uuid4().hex[:12]}"
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+        self.duplicates = 0
+        self.duplicate_rows: List[dict] = []
+        self.pending: List[tuple] = []
+        # Per-batch caches for validate()
+        self.targets: dict = {}
+        self.days: set = set()
+        self.started = time.perf_counter()
+
+    def run(self, rows) -> dict:
+        """Import every (row number, row) from iter_import_rows(); returns report()."""
+        rows = iter(rows)
+        while True:
+            # Parsing allocates as much as committing, so the GC is
+            # paused for both; it runs between batches
+            with gc_paused():
+                read = self.rows
+                for number, row in islice(rows, self.batch_size):
+                    self.rows += 1
+                    if type(row) is str:
+                        self.error(number, row)
+                    else:
+                        self.pending.append((number, row))
+                self.flush()
+            if self.rows == read:
+                return self.report()
+
+    def error(self, number: int, message: str):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": number, "error": message})
+
+    def duplicate(self, number: int, log: LogRecord, duplicate_of: str, match: str):
+        """Imported, but flagged as repeating an existing log."""
+        self.duplicates += 1
+        if len(self.duplicate_rows) < MAX_REPORTED_ERRORS:
+            self.duplicate_rows.append(
+                {"row": number, "log_id": log.log_id, "possible_duplicate_of": duplicate_of, "match": match}
+            )
+
+    def flush(self):
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        store = self.store
+        now = datetime.now(timezone.utc).isoformat()
+        # Validated under the writer lock, so references can't change
+        # between the checks and the commit
+        with store.transaction():
+            logs, requests, numbers, rows_by_term = [], [], [], defaultdict(list)
+            seen = set()
+            self.targets, self.days = {}, set()
+            for number, row in batch:
+                try:
+                    log, vr, term_id = self.validate(number, row, now, seen)
+                except ValueError as e:
+                    self.error(number, str(e))
+                    continue
+                logs.append(log)
+                requests.append(vr)
+                numbers.append(number)
+                rows_by_term[term_id].append(number)
+            if not logs:
+                return
+            for number, log in zip(numbers, store.add_log_rows(logs)):
+                duplicate = store.possible_duplicate(log)
+                if duplicate:
+                    self.duplicate(number, log, *duplicate)
+            store.add_request_rows(requests)
+            store.add_audit_rows([
+                {
+                    "event_id": str(uuid.uuid4()), "actor_id": self.actor_id,
+                    "actor_role": self.actor_role.value, "entity_type": EntityType.service_log.value,
+                    "entity_id": self.import_id, "action": AuditAction.create.value, "timestamp": now,
+                    "notes": f"Imported {len(numbers)} service logs from {self.source} "
+                             f"(rows {numbers[0]}-{numbers[-1]}).",
+                    "term_id": term_id,
+                }
+                for term_id, numbers in rows_by_term.items()
+            ])
+            self.imported += len(logs)
+            store.publish([
+                ("logs_imported", term_id, {"term_id": term_id, "import_id": self.import_id, "count": len(numbers)})
+                for term_id, numbers in rows_by_term.items()
+            ] + [("kpis", term_id, {"term_id": term_id, **kpis_for(store, term_id)}) for term_id in rows_by_term])
+
+    def validate(self, number: int, row: dict, now: str, seen: set) -> tuple:
+        """(log row, request row, term_id) for one input row, or ValueError."""
+        store = self.store
+        student_id, program_id = row.get("student_id"), row.get("program_id")
+        day, hours, description = row.get("date"), row.get("hours"), row.get("description")
+        if not (student_id and program_id and day and description) or hours is None or hours == "":
+            missing = [name for name in IMPORT_REQUIRED_FIELDS if row.get(name) in (None, "")]
+            raise ValueError(f"Missing {', '.join(missing)}")
+        if type(student_id) is not str or type(program_id) is not str:
+            raise ValueError("student_id and program_id must be strings")
+
+        # Files repeat the same few students/programs and days, so each is
+        # resolved once per batch
+        target = self.targets.get((student_id, program_id))
+        if target is None:
+            target = self.targets[student_id, program_id] = self.resolve(student_id, program_id)
+        if type(target) is str:
+            raise ValueError(target)
+        program, term = target
+        term_id = row.get("term_id")
+        if term_id and term_id != term.term_id:
+            raise ValueError(f"Program {program_id} belongs to {term.term_id}, not {term_id}")
+        if type(day) is not str:
+            raise ValueError(f"Invalid date {day!r}, expected YYYY-MM-DD")
+        if day not in self.days:
+            if len(day) != 10 or day[4] != "-":
+                raise ValueError(f"Invalid date {day!r}, expected YYYY-MM-DD")
+            try:
+                datetime.fromisoformat(day)
+            except ValueError:
+                raise ValueError(f"Invalid date {day!r}, expected YYYY-MM-DD")
+            self.days.add(day)
+        if not term.start_date <= day <= term.end_date:
+            raise ValueError(f"Date {day} is outside {term.name} ({term.start_date} to {term.end_date})")
+        if type(hours) is not float:
+            try:
+                if type(hours) is bool:
+                    raise TypeError
+                hours = float(hours)
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid hours {row['hours']!r}")
+        if not 0 < hours <= MAX_LOG_HOURS:
+            raise ValueError(f"Hours must be between 0 and {MAX_LOG_HOURS}, got {row['hours']}")
+        tier = row.get("evidence_tier") or "self_reported"
+        if type(tier) is not str or tier not in EvidenceTier._value2member_map_:
+            raise ValueError(f"Invalid evidence_tier {tier!r}")
+        if type(description) is not str:
+            description = str(description)
+
+        log_id = row.get("log_id")
+        log_id = str(log_id) if log_id else f"{self.import_id}-{number}"
+        request_id = "vr-" + log_id
+        if log_id in seen or log_id in store.service_logs or request_id in store.verification_requests:
+            raise ValueError(f"Duplicate log_id {log_id}")
+        seen.add(log_id)
+        log = {
+            "log_id": log_id, "student_id": student_id, "program_id": program_id, "date": day,
+            "hours": hours, "description": description, "evidence_tier": tier,
+            "status": "pending", "created_at": now, "updated_at": now,
+        }
+        vr = {
+            "request_id": request_id, "log_id": log_id, "student_id": student_id, "program_id": program_id,
+            "status": "awaiting_confirmation", "assignee_admin_id": None,
+            "ngo_name": row.get("ngo_name") or program.name,
+            "action_description": f"{hours} hours - {description[:40]}...",
+        }
+        return log, vr, term.term_id
+
+    def resolve(self, student_id: str, program_id: str):
+        """(program, term) a student may log hours against, or an error message."""
+        store = self.store
+        if student_id not in store.students:
+            return f"Unknown student {student_id}"
+        program = store.programs.get(program_id)
+        if program is None:
+            return f"Unknown program {program_id}"
+        if student_id not in store.students_by_program.get(program_id, ()):
+            return f"Student {student_id} is not enrolled in {program_id}"
+        term = store.terms.get(program.term_id)
+        if term is None:
+            return f"Program {program_id} has no term"
+        return program, term
+
+    def report(self) -> dict:
+        seconds = time.perf_counter() - self.started
+        metrics.count_import(self.imported, self.failed)
+        return {
+            "import_id": self.import_id,
+            "source": self.source,
+            "rows": self.rows,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+            "possible_duplicates": self.duplicates,
+            "duplicates": self.duplicate_rows,
+            "seconds": round(seconds, 3),
+            "rows_per_second": round(self.rows / seconds) if seconds else 0,
+        }
+
+
+def import_service_logs_file(stream, fmt: ImportFormat, source: str, actor_id: str = "system",
+                             actor_role: ActorRole = ActorRole.system,
+                             batch_size: int = IMPORT_BATCH_ROWS, store: Optional["DataStore"] = None) -> dict:
+    """Import a binary CSV/NDJSON stream into `store` (default: db); see LogImport."""
+    job = LogImport(store or db, source, actor_id, actor_role, batch_size)
+    return job.run(iter_import_rows(stream, fmt))
+
+
+IMPORT_CONTENT_TYPES = {
+    "text/csv": ImportFormat.csv,
+    "application/x-ndjson": ImportFormat.ndjson,
+    "application/ndjson": ImportFormat.ndjson,
+    "application/jsonl": ImportFormat.ndjson,
+}
+
+@app.post("/api/import/service-logs")
+async def import_service_logs(request: Request, format: Optional[ImportFormat] = None,
+                              source: Optional[str] = None):
+    """Bulk-create pending service logs from a CSV or NDJSON request body.
+
+    The format comes from ?format= or the Content-Type. Columns: student_id,
+    program_id, date, hours, description, and optionally log_id, term_id,
+    evidence_tier, ngo_name. Each row also gets a verification request;
+    bad rows are listed in the report and skipped.
+    """
+    user = get_current_user()
+    fmt = format or IMPORT_CONTENT_TYPES.get(request.headers.get("content-type", "").split(";")[0].strip())
+    if fmt is None:
+        raise HTTPException(status_code=400, detail="Pass ?format=csv|ndjson or a text/csv or application/x-ndjson body")
+
+    # Received without holding the whole body in memory, then parsed and
+    # committed batch by batch off the event loop
+    with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES) as body:
+        async for chunk in request.stream():
+            body.write(chunk)
+        body.seek(0)
+        try:
+            return await run_in_threadpool(
+                import_service_logs_file, body, fmt, source or f"upload ({fmt.value})",
+                user["user_id"], ActorRole.university_admin,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
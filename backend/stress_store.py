@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Hammer the DataStore with concurrent readers and writers.
+
+Writer threads add log + request pairs and confirm/reject requests through
+the same handlers the API uses; reader threads call the read handlers and
+check invariants that only hold if no write is observed half-applied:
+
+  * logs and requests are added in pairs, so their counts move together
+  * a confirmed/rejected request always has a matching log status
+  * maintained KPI aggregates equal a from-scratch recompute
+
+Exits non-zero on any error or violated invariant.
+
+    cd backend && python stress_store.py --seconds 10 --readers 8 --writers 2
+
+--no-isolation calls the handlers without snapshot_read, for comparison.
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+import uuid
+
+import server
+from bench_store import populate
+from repository import MemoryRepository
+
+REQUEST_LOG_STATUS = {
+    server.VerificationStatus.confirmed: server.LogStatus.confirmed,
+    server.VerificationStatus.rejected: (server.LogStatus.rejected, server.LogStatus.flagged),
+}
+
+
+def add_pair(store: server.DataStore, rng: random.Random):
+    student_id = rng.choice(list(store.students))
+    program_id = (store.students[student_id].program_ids or [rng.choice(list(store.programs))])[0]
+    now = "2026-02-01T12:00:00+00:00"
+    log = server.ServiceLog(
+        log_id=f"stress-log-{uuid.uuid4().hex}", student_id=student_id, program_id=program_id,
+        date="2026-02-01", hours=rng.choice([1.0, 1.5, 2.0]), description="Stress shift",
+        evidence_tier=server.EvidenceTier.self_reported, status=server.LogStatus.pending,
+        created_at=now, updated_at=now,
+    )
+    with store.transaction():
+        store.add_log(log)
+        store.add_verification_request(server.VerificationRequest(
+            request_id=f"stress-vr-{uuid.uuid4().hex}", log_id=log.log_id, student_id=student_id,
+            program_id=program_id, status=server.VerificationStatus.awaiting_confirmation,
+        ))
+
+
+def act(store: server.DataStore, rng: random.Random):
+    pending = store.requests_by_status.get(server.VerificationStatus.awaiting_confirmation)
+    request_id = next(iter(pending), None) if pending else None
+    if request_id is None:
+        return
+    try:
+        if rng.random() < 0.5:
+            server.confirm_verification(server.ConfirmRequest(request_id=request_id))
+        else:
+            server.reject_verification(server.RejectRequest(
+                request_id=request_id, reason=server.RejectionReason.insufficient_evidence
+            ))
+    except server.HTTPException:
+        pass  # another writer got there first
+
+
+def check_invariants(store: server.DataStore, pair_offset: int, rng: random.Random) -> list:
+    problems = []
+    if len(store.service_logs) - len(store.verification_requests) != pair_offset:
+        problems.append(
+            f"{len(store.service_logs)} logs vs {len(store.verification_requests)} requests"
+        )
+    requests = store.verification_requests
+    for request_id in rng.sample(list(requests), min(50, len(requests))):
+        vr = requests[request_id]
+        expected = REQUEST_LOG_STATUS.get(vr.status)
+        log = store.service_logs.get(vr.log_id)
+        if expected and log and log.status not in (expected if isinstance(expected, tuple) else (expected,)):
+            problems.append(f"{vr.request_id} is {vr.status.value} but its log is {log.status.value}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=6)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--students", type=int, default=500)
+    parser.add_argument("--logs", type=int, default=5000)
+    parser.add_argument("--no-isolation", action="store_true")
+    args = parser.parse_args()
+
+    store = server.DataStore(MemoryRepository())
+    populate(store, args.students, args.logs)
+    server.db = store
+    pair_offset = len(store.service_logs) - len(store.verification_requests)
+
+    def call(handler, *handler_args):
+        if args.no_isolation:
+            return handler.__wrapped__(*handler_args)
+        return handler(*handler_args)
+
+    def check(rng):
+        if args.no_isolation:
+            return check_invariants(store, pair_offset, rng)
+        return store.read(check_invariants, store, pair_offset, rng)
+
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0}
+    errors = []
+
+    def writer(seed):
+        rng = random.Random(seed)
+        while not stop.is_set():
+            try:
+                if rng.random() < 0.5:
+                    add_pair(store, rng)
+                else:
+                    act(store, rng)
+                counts["writes"] += 1
+            except Exception as e:
+                errors.append(f"writer: {e!r}")
+
+    def reader(seed):
+        rng = random.Random(seed)
+        student_ids = list(store.students)
+        while not stop.is_set():
+            try:
+                choice = rng.randrange(5)
+                if choice == 0:
+                    call(server.get_kpis, "spring-2026")
+                elif choice == 1:
+                    call(server.get_students, "spring-2026", server.StudentSort.risk_score,
+                         server.SortOrder.desc, 50, None, None)
+                elif choice == 2:
+                    call(server.get_student, rng.choice(student_ids), "spring-2026")
+                elif choice == 3:
+                    result = call(server.check_kpis_consistency, "spring-2026")
+                    if not result["consistent"]:
+                        errors.append(f"aggregate drift: {result['mismatches']}")
+                else:
+                    errors.extend(check(rng))
+                counts["reads"] += 1
+            except Exception as e:
+                errors.append(f"reader: {e!r}")
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+    threads += [threading.Thread(target=reader, args=(100 + i,)) for i in range(args.readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    final = store.check_term_aggregates()
+    if final:
+        errors.append(f"final aggregate drift: {final}")
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.seconds}s"
+          f"{' (no isolation)' if args.no_isolation else ''}")
+    print(f"  reads/s {counts['reads'] / args.seconds:,.0f}  writes/s {counts['writes'] / args.seconds:,.0f}")
+    print(f"  read retries {store.read_retries}  lock fallbacks {store.read_fallbacks}")
+    print(f"  errors {len(errors)}")
+    for error in errors[:10]:
+        print(f"    {error}")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic data for the DataStore.
+
+generate() adds terms, programs, students (with their enrollments), service
+logs, verification requests and the audit history of decided requests. The
+same seed and sizes always produce the same rows. Students and logs are
+written in batches of `batch_size`, one transaction each (logs go through
+the DataStore's bulk row methods), and nothing but the current batch is
+held by the generator.
+
+Populate the configured backend (see create_repository in server.py), then
+start the API on it:
+
+    cd backend
+    DATASTORE_BACKEND=journal python synthetic.py --students 100000 --logs 5000000
+    DATASTORE_BACKEND=journal uvicorn server:app --port 8001
+
+`--tenant acme` populates that tenant's store instead (under TENANT_DIR).
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from server import (
+    ActorRole, AuditAction, DataStore, EntityType, EvidenceTier, LogStatus, Program, ProgramType,
+    RejectionReason, Student, Term, VerificationStatus,
+)
+
+# Outcome mix of submitted logs and, per outcome, the share with
+# organization-confirmed evidence (confirming always upgrades the tier)
+LOG_STATUS_WEIGHTS = {
+    LogStatus.confirmed: 58,
+    LogStatus.pending: 27,
+    LogStatus.rejected: 8,
+    LogStatus.flagged: 7,
+}
+ORG_CONFIRMED_SHARE = {
+    LogStatus.confirmed: 1.0,
+    LogStatus.pending: 0.1,
+    LogStatus.rejected: 0.05,
+    LogStatus.flagged: 0.05,
+}
+REQUEST_STATUS = {
+    LogStatus.confirmed: VerificationStatus.confirmed,
+    LogStatus.pending: VerificationStatus.awaiting_confirmation,
+    LogStatus.rejected: VerificationStatus.rejected,
+    LogStatus.flagged: VerificationStatus.rejected,  # as flag_verification does
+}
+AUDIT_ACTION = {
+    LogStatus.confirmed: AuditAction.confirm,
+    LogStatus.rejected: AuditAction.reject,
+    LogStatus.flagged: AuditAction.flag,
+}
+HOURS_WEIGHTS = {1.0: 8, 1.5: 6, 2.0: 14, 2.5: 10, 3.0: 14, 3.5: 8, 4.0: 10, 5.0: 5, 6.0: 4, 8.0: 1}
+# Share of students enrolled in 1, 2 or 3 programs of a term
+ENROLLMENT_WEIGHTS = {1: 60, 2: 30, 3: 10}
+RETURNING_STUDENT_SHARE = 0.25
+# Log ownership is skewed: student index = students * random() ** ACTIVITY_SKEW
+ACTIVITY_SKEW = 1.6
+
+PROGRAMS = [
+    ("Service Corps", ProgramType.campus, "heart"),
+    ("Green Initiative", ProgramType.campus, "leaf"),
+    ("Community Outreach", ProgramType.ngo_partner, "users"),
+    ("Literacy Partners", ProgramType.ngo_partner, "book"),
+    ("Food Bank Network", ProgramType.ngo_partner, "heart"),
+    ("Peer Tutoring", ProgramType.campus, "users"),
+    ("Senior Companions", ProgramType.ngo_partner, "users"),
+    ("Neighborhood Cleanup", ProgramType.campus, "leaf"),
+    ("Youth Mentoring", ProgramType.ngo_partner, "users"),
+    ("Health Access", ProgramType.ngo_partner, "heart"),
+]
+ACTIVITIES = [
+    "Food bank volunteering", "Elderly care visit", "Tree planting", "Homeless shelter meal service",
+    "River cleanup", "After-school tutoring", "Soup kitchen service", "Beach cleanup",
+    "Clothing drive sorting", "ESL class assistance", "Recycling education workshop",
+    "Youth mentoring session", "Community garden maintenance", "Job skills workshop facilitation",
+]
+FIRST_NAMES = [
+    "Emma", "Liam", "Olivia", "Noah", "Ava", "Ethan", "Sophia", "Mason", "Isabella", "William",
+    "Mia", "James", "Amara", "Diego", "Priya", "Kenji", "Fatima", "Mateo", "Zoe", "Yusuf",
+]
+LAST_NAMES = [
+    "Johnson", "Chen", "Williams", "Garcia", "Brown", "Martinez", "Davis", "Rodriguez", "Wilson",
+    "Anderson", "Thomas", "Taylor", "Okafor", "Nguyen", "Patel", "Kim", "Haddad", "Silva",
+]
+ADMINS = [("admin-001", "Dr. Sarah Mitchell"), ("admin-002", "Prof. David Okoye"), ("admin-003", "Maria Alvarez")]
+
+
+def make_terms(count: int, prefix: str) -> list:
+    """`count` consecutive Fall/Spring semesters ending with Spring 2026."""
+    semesters = []
+    season, year = "spring", 2026
+    for _ in range(count):
+        semesters.append((season, year))
+        season, year = ("fall", year - 1) if season == "spring" else ("spring", year)
+    terms = []
+    for season, year in reversed(semesters):
+        start, end = ((f"{year}-01-15", f"{year}-05-15") if season == "spring"
+                      else (f"{year}-09-01", f"{year}-12-15"))
+        terms.append(Term(
+            term_id=f"{prefix}-{season}-{year}", name=f"{season.title()} {year}",
+            start_date=start, end_date=end, required_hours=20,
+        ))
+    return terms
+
+
+def make_programs(terms: list, per_term: int, prefix: str) -> list:
+    programs = []
+    for term in terms:
+        for i in range(per_term):
+            name, program_type, icon = PROGRAMS[i % len(PROGRAMS)]
+            if i >= len(PROGRAMS):
+                name = f"{name} {i // len(PROGRAMS) + 1}"
+            programs.append(Program(
+                program_id=f"{term.term_id}-p{i:02d}", name=name, type=program_type,
+                term_id=term.term_id, active_students_count=0, icon=icon,
+            ))
+    return programs
+
+
+def make_student(rng: random.Random, index: int, program_ids_by_term: list, prefix: str) -> Student:
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    term_programs = rng.choice(program_ids_by_term)
+    count = min(len(term_programs), rng.choices(list(ENROLLMENT_WEIGHTS), list(ENROLLMENT_WEIGHTS.values()))[0])
+    program_ids = rng.sample(term_programs, count)
+    if len(program_ids_by_term) > 1 and rng.random() < RETURNING_STUDENT_SHARE:
+        other = rng.choice([p for p in program_ids_by_term if p is not term_programs])
+        program_ids.append(rng.choice(other))
+    return Student(
+        student_id=f"{prefix}-std-{index:07d}", name=f"{first} {last}",
+        email=f"{first.lower()}.{last.lower()}{index}@example.edu", program_ids=program_ids,
+        avatar=first[0] + last[0],
+    )
+
+
+def generate(store: DataStore, *, seed: int = 20260203, terms: int = 3, programs_per_term: int = 8,
+             students: int = 1000, logs: int = 20000, batch_size: int = 10000, prefix: str = "syn",
+             on_batch=None) -> dict:
+    """Add a synthetic dataset to `store`; returns the number of rows of each kind.
+
+    `on_batch(kind, done)` is called after every committed batch.
+    """
+    rng = random.Random(seed)
+    term_list = make_terms(terms, prefix)
+    programs = make_programs(term_list, programs_per_term, prefix)
+    with store.transaction():
+        for term in term_list:
+            store.add_term(term)
+        for program in programs:
+            store.add_program(program)
+    program_ids_by_term = [[p.program_id for p in programs if p.term_id == t.term_id] for t in term_list]
+    # Day range of each program's term, for log dates
+    term_days = {
+        t.term_id: (date.fromisoformat(t.start_date).toordinal(), date.fromisoformat(t.end_date).toordinal())
+        for t in term_list
+    }
+    program_days = {p.program_id: term_days[p.term_id] for p in programs}
+    program_names = {p.program_id: p.name for p in programs}
+
+    for start in range(0, students, batch_size):
+        end = min(students, start + batch_size)
+        with store.transaction():
+            for index in range(start, end):
+                store.add_student(make_student(rng, index, program_ids_by_term, prefix))
+        if on_batch:
+            on_batch("students", end)
+
+    statuses, status_weights = list(LOG_STATUS_WEIGHTS), list(LOG_STATUS_WEIGHTS.values())
+    hour_values, hour_weights = list(HOURS_WEIGHTS), list(HOURS_WEIGHTS.values())
+    reasons = [r.value for r in RejectionReason]
+    events_written = 0
+    for start in range(0, logs, batch_size):
+        end = min(logs, start + batch_size)
+        batch_statuses = rng.choices(statuses, status_weights, k=end - start)
+        batch_hours = rng.choices(hour_values, hour_weights, k=end - start)
+        logs_batch, requests_batch, events = [], [], []
+        for index, status, hours in zip(range(start, end), batch_statuses, batch_hours):
+            student = store.students[f"{prefix}-std-{int(students * rng.random() ** ACTIVITY_SKEW):07d}"]
+            program_id = rng.choice(student.program_ids)
+            first_day, last_day = program_days[program_id]
+            day = date.fromordinal(rng.randint(first_day, last_day))
+            created_at = f"{day.isoformat()}T{rng.randint(8, 20):02d}:00:00+00:00"
+            updated_at = created_at
+            if status != LogStatus.pending:
+                decided = day + timedelta(days=rng.randint(1, 3))
+                updated_at = f"{decided.isoformat()}T{rng.randint(8, 18):02d}:00:00+00:00"
+            tier = EvidenceTier.org_confirmed if rng.random() < ORG_CONFIRMED_SHARE[status] else EvidenceTier.self_reported
+            activity = rng.choice(ACTIVITIES)
+            log_id, request_id = f"{prefix}-log-{index:08d}", f"{prefix}-vr-{index:08d}"
+
+            # Rows are valid by construction, so they skip model validation
+            logs_batch.append({
+                "log_id": log_id, "student_id": student.student_id, "program_id": program_id,
+                "date": day.isoformat(), "hours": hours, "description": activity,
+                "evidence_tier": tier.value, "status": status.value,
+                "created_at": created_at, "updated_at": updated_at,
+            })
+            requests_batch.append({
+                "request_id": request_id, "log_id": log_id, "student_id": student.student_id,
+                "program_id": program_id, "status": REQUEST_STATUS[status].value, "assignee_admin_id": None,
+                "ngo_name": program_names[program_id], "action_description": f"{hours} hours - {activity[:40]}...",
+            })
+            if status == LogStatus.pending:
+                continue
+            admin_id, admin_name = rng.choice(ADMINS)
+            if status == LogStatus.confirmed:
+                notes = f"Confirmed by {admin_name}. Student: {student.name}. Hours: {hours}"
+            elif status == LogStatus.rejected:
+                notes = f"Rejected by {admin_name}. Reason: {rng.choice(reasons)}. Student: {student.name}"
+            else:
+                notes = f"Flagged by {admin_name}. Reason: Needs review. Student: {student.name}"
+            events.append({
+                "event_id": f"{prefix}-evt-{index:08d}", "actor_id": admin_id,
+                "actor_role": ActorRole.university_admin.value,
+                "entity_type": EntityType.verification_request.value, "entity_id": request_id,
+                "action": AUDIT_ACTION[status].value, "timestamp": updated_at, "notes": notes,
+            })
+        with store.transaction():
+            store.add_log_rows(logs_batch)
+            store.add_request_rows(requests_batch)
+            store.add_audit_rows(events)
+        events_written += len(events)
+        if on_batch:
+            on_batch("logs", end)
+
+    return {
+        "terms": len(term_list),
+        "programs": len(programs),
+        "students": students,
+        "service_logs": logs,
+        "verification_requests": logs,
+        "audit_events": events_written,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=20260203)
+    parser.add_argument("--terms", type=int, default=3)
+    parser.add_argument("--programs-per-term", type=int, default=8)
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--logs", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--prefix", default="syn", help="id prefix, so several datasets can coexist")
+    parser.add_argument("--tenant", default="default", help="tenant whose store to write (see TENANT_DIR)")
+    args = parser.parse_args()
+
+    # The tenant's store, on the backend from the environment
+    from server import TENANT_ID, tenants
+    if not TENANT_ID.fullmatch(args.tenant):
+        parser.error(f"invalid tenant id: {args.tenant}")
+    try:
+        with tenants.holding(args.tenant) as db:
+            if f"{args.prefix}-std-{0:07d}" in db.students:
+                parser.error(f"the store already holds a '{args.prefix}' dataset; pick another --prefix")
+
+            started = time.perf_counter()
+
+            def progress(kind, done):
+                elapsed = time.perf_counter() - started
+                print(f"  {kind}: {done:,} ({elapsed:.1f}s)", flush=True)
+
+            counts = generate(
+                db, seed=args.seed, terms=args.terms, programs_per_term=args.programs_per_term,
+                students=args.students, logs=args.logs, batch_size=args.batch_size, prefix=args.prefix,
+                on_batch=progress,
+            )
+            elapsed = time.perf_counter() - started
+            print(", ".join(f"{count:,} {kind}" for kind, count in counts.items()))
+            print(f"{elapsed:.1f}s, {args.logs / elapsed:,.0f} logs/s")
+    finally:
+        # Flushes the journal, also when --prefix is rejected
+        tenants.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ Tests all backend endpoints for the admin dashboard functionality.
 import requests
 import sys
 import json
+import base64
 from datetime import datetime
 
 class MyImpactAPITester:
@@ -119,6 +120,130 @@ class MyImpactAPITester:
             print(f"   Retention Rate: {response.get('retention_rate', {}).get('value', 'N/A')}%")
         return success, response
 
+    def test_get_at_risk_students(self):
+        """Test the top at-risk students for Spring 2026 come lowest progress first"""
+        success, response = self.run_test(
+            "Get At-Risk Students (Spring 2026)",
+            "GET",
+            "api/students/at-risk",
+            200,
+            params={"term_id": "spring-2026", "limit": 5}
+        )
+        if success:
+            progress = [s.get('progress', 0) for s in response]
+            if len(response) > 5 or progress != sorted(progress):
+                print(f"❌ Failed - Expected at most 5 students by ascending progress, got {progress}")
+                self.tests_passed -= 1
+                self.failed_tests.append({'name': 'Get At-Risk Students (Spring 2026)', 'error': 'Unordered results'})
+                return False, response
+            print(f"   Top at-risk: {[(s.get('student_id'), s.get('risk_status')) for s in response]}")
+        return success, response
+
+    def test_search(self):
+        """Test prefix search finds the seeded student by name"""
+        success, response = self.run_test(
+            "Search (Spring 2026)",
+            "GET",
+            "api/search",
+            200,
+            params={"q": "emm", "term_id": "spring-2026"}
+        )
+        if success:
+            if not any(hit.get('type') == 'student' and hit.get('id') == 'std-001' for hit in response):
+                print(f"❌ Failed - Expected std-001 among the hits, got {response}")
+                self.tests_passed -= 1
+                self.failed_tests.append({'name': 'Search (Spring 2026)', 'error': 'std-001 not found'})
+                return False, response
+            print(f"   Hits: {[(hit.get('type'), hit.get('id')) for hit in response]}")
+        return success, response
+
+    def test_kpis_not_modified(self):
+        """Test that a matching If-None-Match gets 304 from /api/kpis"""
+        url = f"{self.base_url}/api/kpis"
+        params = {"term_id": "spring-2026"}
+        self.tests_run += 1
+        print(f"\n🔍 Testing KPIs ETag / 304...")
+        print(f"   URL: GET {url}")
+        
+        try:
+            first = requests.get(url, params=params)
+            etag = first.headers.get("ETag")
+            second = requests.get(url, params=params, headers={"If-None-Match": etag or ""})
+            if not etag or second.status_code != 304:
+                raise ValueError(f"ETag {etag!r}, conditional request got {second.status_code}")
+            self.tests_passed += 1
+            print(f"✅ Passed - ETag {etag} answered with 304")
+            return True
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            self.failed_tests.append({
+                'name': 'KPIs ETag / 304',
+                'error': str(e)
+            })
+            return False
+
+    def test_not_modified_cors(self):
+        """Test that a 304 to a cross-origin request still carries the CORS headers"""
+        url = f"{self.base_url}/api/kpis"
+        params = {"term_id": "spring-2026"}
+        origin = {"Origin": "http://localhost:3000"}
+        self.tests_run += 1
+        print(f"\n🔍 Testing CORS headers on 304...")
+        print(f"   URL: GET {url}")
+        
+        try:
+            first = requests.get(url, params=params, headers=origin)
+            etag = first.headers.get("ETag")
+            second = requests.get(url, params=params, headers={**origin, "If-None-Match": etag or ""})
+            if second.status_code != 304:
+                raise ValueError(f"Expected 304, got {second.status_code}")
+            allowed = second.headers.get("Access-Control-Allow-Origin")
+            exposed = second.headers.get("Access-Control-Expose-Headers", "")
+            if allowed not in ("*", origin["Origin"]) or "ETag" not in exposed:
+                raise ValueError(f"304 without CORS headers: allow-origin {allowed!r}, expose {exposed!r}")
+            self.tests_passed += 1
+            print(f"✅ Passed - 304 allows origin {allowed}")
+            return True
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            self.failed_tests.append({
+                'name': 'CORS headers on 304',
+                'error': str(e)
+            })
+            return False
+
+    def test_cache_stats(self):
+        """Test response cache counters after a repeated KPI read"""
+        self.run_test("Get KPIs (warm cache)", "GET", "api/kpis", 200, params={"term_id": "spring-2026"})
+        success, response = self.run_test("Response Cache Stats", "GET", "api/cache/stats", 200)
+        if success:
+            print(f"   Cache: {response.get('size')} entries, hit rate {response.get('hit_rate')}")
+        return success, response
+
+    def test_get_timeseries(self):
+        """Test weekly hours for Spring 2026 add up to the term's logged hours"""
+        self.run_test("Get Time Series (trailing characters after start)", "GET", "api/timeseries", 422,
+                      params={"term_id": "spring-2026", "start": "2026-02-01zzz"})
+        success, response = self.run_test(
+            "Get Time Series (Spring 2026, weekly)",
+            "GET",
+            "api/timeseries",
+            200,
+            params={"term_id": "spring-2026", "granularity": "week", "start": "2025-01-01", "end": "2027-01-01"}
+        )
+        if success:
+            points = response.get('series', [{}])[0].get('points', [])
+            logs = requests.get(f"{self.base_url}/api/service-logs", params={"term_id": "spring-2026"}).json()
+            logged = round(sum(p.get('logged_hours', 0) for p in points), 1)
+            expected = round(sum(log.get('hours', 0) for log in logs), 1)
+            if logged != expected:
+                print(f"❌ Failed - Weekly logged hours sum to {logged}, logs total {expected}")
+                self.tests_passed -= 1
+                self.failed_tests.append({'name': 'Get Time Series (Spring 2026, weekly)', 'expected': expected, 'actual': logged})
+                return False, response
+            print(f"   {len(points)} weeks, {logged} logged hours")
+        return success, response
+
     def test_get_kpis_fall(self):
         """Test getting KPIs for Fall 2025"""
         success, response = self.run_test(
@@ -130,6 +255,66 @@ class MyImpactAPITester:
         )
         return success, response
 
+    def test_kpis_consistency(self):
+        """Test that maintained KPI aggregates match a full recompute"""
+        success, response = self.run_test("KPI Consistency Check", "GET", "api/kpis/consistency", 200)
+        if success and not response.get("consistent"):
+            print(f"   ❌ Aggregates drifted: {response.get('mismatches')}")
+            self.tests_passed -= 1
+            self.failed_tests.append({'name': 'KPI Consistency Check', 'error': str(response.get('mismatches'))})
+            return False, response
+        return success, response
+
+    def test_get_service_logs_paginated(self):
+        """Test keyset pagination, sorting and field projection on service logs"""
+        url = f"{self.base_url}/api/service-logs"
+        params = {"term_id": "spring-2026", "limit": 5, "sort": "date", "fields": "log_id,date,student_name"}
+        self.tests_run += 1
+        print(f"\n🔍 Testing Service Logs Pagination...")
+        print(f"   URL: GET {url}")
+        
+        try:
+            rows = []
+            while True:
+                response = requests.get(url, params=params)
+                if response.status_code != 200:
+                    raise ValueError(f"Expected 200, got {response.status_code}: {response.text[:200]}")
+                rows.extend(response.json())
+                cursor = response.headers.get("X-Next-Cursor")
+                if not cursor:
+                    break
+                params["cursor"] = cursor
+            total = int(response.headers.get("X-Total-Count", -1))
+            if len(rows) != total or [r["date"] for r in rows] != sorted(r["date"] for r in rows):
+                raise ValueError(f"Got {len(rows)} rows for total {total}, or rows out of order")
+            self.tests_passed += 1
+            print(f"✅ Passed - {len(rows)} rows across pages")
+            return True
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            self.failed_tests.append({
+                'name': 'Service Logs Pagination',
+                'error': str(e)
+            })
+            return False
+
+    def test_invalid_cursors(self):
+        """Test that cursors of the wrong shape are rejected with 400"""
+        def cursor(key):
+            return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+        results = [
+            self.run_test("Service Logs Cursor (not a list)", "GET", "api/service-logs", 400,
+                          params={"limit": 5, "cursor": cursor(5)}),
+            self.run_test("Service Logs Cursor (wrong types)", "GET", "api/service-logs", 400,
+                          params={"limit": 5, "sort": "date", "cursor": cursor([1, "x"])}),
+            self.run_test("Students Cursor (wrong types)", "GET", "api/students", 400,
+                          params={"limit": 5, "cursor": cursor(["a", "b"])}),
+            self.run_test("Search Cursor (not a list)", "GET", "api/search", 400,
+                          params={"q": "emm", "cursor": cursor({"a": 1})}),
+        ]
+        return all(success for success, _ in results)
+
     def test_get_verification_requests(self):
         """Test getting verification requests"""
         success, response = self.run_test(
@@ -175,6 +360,28 @@ class MyImpactAPITester:
             data={"request_id": request_id, "reason": "Needs additional review for compliance"}
         )
 
+    def test_bulk_verification(self, request_ids):
+        """Test applying several verification actions in one request"""
+        items = [{"request_id": rid, "action": "flag", "reason": "Bulk review"} for rid in request_ids]
+        self.run_test(
+            "Bulk Verification (duplicate request_id)",
+            "POST",
+            "api/verification-requests/bulk",
+            422,
+            data={"items": items + items[:1]}
+        )
+        items.append({"request_id": "does-not-exist", "action": "confirm"})
+        success, response = self.run_test(
+            "Bulk Verification Actions",
+            "POST",
+            "api/verification-requests/bulk",
+            200,
+            data={"items": items}
+        )
+        if success and response:
+            print(f"   Processed: {response.get('processed')}, failed: {response.get('failed')}")
+        return success, response
+
     def test_get_settings(self):
         """Test getting settings"""
         return self.run_test("Get Settings", "GET", "api/settings", 200)
@@ -189,6 +396,44 @@ class MyImpactAPITester:
             data={"university_name": "Test University"}
         )
 
+    def test_tenant_routing(self):
+        """Test the tenant path prefix and header select the same store, and unknown tenants 404"""
+        url = f"{self.base_url}/api/settings"
+
+        self.tests_run += 1
+        print(f"\n🔍 Testing Tenant Routing...")
+        print(f"   URL: GET {url}")
+
+        try:
+            plain = requests.get(url)
+            prefixed = requests.get(f"{self.base_url}/t/default/api/settings")
+            header = requests.get(url, headers={'X-Tenant-ID': 'default'})
+            unknown = requests.get(url, headers={'X-Tenant-ID': 'Not A Tenant'})
+            success = (
+                plain.status_code == prefixed.status_code == header.status_code == 200
+                and plain.json() == prefixed.json() == header.json()
+                and unknown.status_code == 404
+            )
+            if success:
+                self.tests_passed += 1
+                print(f"✅ Passed - /t/default/ and X-Tenant-ID serve the default tenant, unknown tenant 404")
+            else:
+                print(f"❌ Failed - Got {plain.status_code}/{prefixed.status_code}/{header.status_code}, "
+                      f"unknown tenant {unknown.status_code}")
+                self.failed_tests.append({
+                    'name': 'Tenant Routing',
+                    'expected': [200, 200, 200, 404],
+                    'actual': [plain.status_code, prefixed.status_code, header.status_code, unknown.status_code],
+                })
+            return success
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            self.failed_tests.append({
+                'name': 'Tenant Routing',
+                'error': str(e)
+            })
+            return False
+
     def test_export_verified_logs(self):
         """Test exporting verified logs"""
         url = f"{self.base_url}/api/export/verified-logs"
@@ -255,10 +500,247 @@ class MyImpactAPITester:
             })
             return False
 
+    def test_change_stream(self):
+        """Test that a stale change-stream cursor is answered with a reset"""
+        url = f"{self.base_url}/api/changes"
+        
+        self.tests_run += 1
+        print(f"\n🔍 Testing Change Stream...")
+        print(f"   URL: GET {url}")
+        
+        try:
+            with requests.get(url, params={"since": "stale-1"}, stream=True, timeout=10) as response:
+                lines = []
+                if response.status_code == 200:
+                    for line in response.iter_lines(decode_unicode=True):
+                        if not line:
+                            break
+                        lines.append(line)
+            success = response.status_code == 200 and "event: reset" in lines
+            if success:
+                self.tests_passed += 1
+                print(f"✅ Passed - Status: {response.status_code}")
+                print(f"   First event: {lines}")
+            else:
+                print(f"❌ Failed - Expected a reset event, got {response.status_code} {lines}")
+                self.failed_tests.append({
+                    'name': 'Change Stream',
+                    'expected': 200,
+                    'actual': response.status_code,
+                })
+            return success
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            self.failed_tests.append({
+                'name': 'Change Stream',
+                'error': str(e)
+            })
+            return False
+
+    def test_import_service_logs(self):
+        """Test bulk CSV import of service logs, including a rejected row"""
+        url = f"{self.base_url}/api/import/service-logs"
+        body = (
+            "student_id,program_id,date,hours,description\n"
+            "std-001,csc-001,2026-01-21,2.5,Imported tutoring session\n"
+            "std-001,csc-001,2026-01-22,30,Too many hours for one day\n"
+        )
+
+        self.tests_run += 1
+        print(f"\n🔍 Testing Import Service Logs...")
+        print(f"   URL: POST {url}")
+
+        try:
+            response = requests.post(
+                url,
+                data=body.encode(),
+                params={"format": "csv", "source": "backend_test"},
+                headers={'Content-Type': 'text/csv'},
+            )
+            report = response.json() if response.status_code == 200 else {}
+            success = (
+                response.status_code == 200
+                and report.get("imported") == 1
+                and report.get("failed") == 1
+            )
+            if success:
+                self.tests_passed += 1
+                print(f"✅ Passed - Status: {response.status_code}")
+                print(f"   Report: {report.get('import_id')} imported={report.get('imported')} failed={report.get('failed')}")
+            else:
+                print(f"❌ Failed - Expected 1 imported and 1 failed row, got {response.status_code} {response.text[:200]}")
+                self.failed_tests.append({
+                    'name': 'Import Service Logs',
+                    'expected': 200,
+                    'actual': response.status_code,
+                })
+            return success
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            self.failed_tests.append({
+                'name': 'Import Service Logs',
+                'error': str(e)
+            })
+            return False
+
+    def test_import_kpis_tenant(self):
+        """Test that an import outside a request publishes its own store's KPIs
+
+        Runs in-process against a private store (as import_logs.py does for
+        --tenant), so the default tenant must be neither loaded nor used.
+        """
+        self.tests_run += 1
+        print(f"\n🔍 Testing Import KPIs For A Non-Default Tenant...")
+
+        try:
+            import io
+            import os
+            sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+            import server
+            from repository import MemoryRepository
+
+            store = server.DataStore(MemoryRepository())
+            # Give the store different numbers from the default tenant's
+            token = server.request_store.set(store)
+            try:
+                server.confirm_verification(server.ConfirmRequest(request_id="vr-001"))
+            finally:
+                server.request_store.reset(token)
+
+            body = b"student_id,program_id,date,hours,description\nstd-001,csc-001,2026-02-10,2,Tutoring\n"
+            server.import_service_logs_file(io.BytesIO(body), server.ImportFormat.csv, "backend_test", store=store)
+            published = [data for _, kind, _, data in store.changes.events if kind == "kpis"][-1]
+            expected = server.kpis_for(store, published["term_id"])
+            success = (
+                published["verified_hours"] == expected["verified_hours"]
+                and published["active_students"] == expected["active_students"]
+                and server.DEFAULT_TENANT not in server.tenants.stores
+            )
+            if success:
+                self.tests_passed += 1
+                print(f"✅ Passed - Published verified_hours {published['verified_hours']['value']} from the import's store")
+            else:
+                print(f"❌ Failed - Published {published['verified_hours']}, store has {expected['verified_hours']}, "
+                      f"default tenant loaded: {server.DEFAULT_TENANT in server.tenants.stores}")
+                self.failed_tests.append({
+                    'name': 'Import KPIs For A Non-Default Tenant',
+                    'expected': expected['verified_hours'],
+                    'actual': published['verified_hours'],
+                })
+            return success
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            self.failed_tests.append({
+                'name': 'Import KPIs For A Non-Default Tenant',
+                'error': str(e)
+            })
+            return False
+
+    def test_duplicate_detection(self):
+        """Test re-importing a log is flagged and annotated in the verification queue"""
+        url = f"{self.base_url}/api/import/service-logs"
+        body = (
+            "student_id,program_id,date,hours,description\n"
+            "std-001,csc-001,2026-01-21,2.5,Imported tutoring session\n"
+        )
+
+        self.tests_run += 1
+        print(f"\n🔍 Testing Duplicate Detection...")
+        print(f"   URL: POST {url}")
+
+        try:
+            response = requests.post(
+                url,
+                data=body.encode(),
+                params={"format": "csv", "source": "backend_test"},
+                headers={'Content-Type': 'text/csv'},
+            )
+            report = response.json() if response.status_code == 200 else {}
+            duplicates = report.get("duplicates", [])
+            queue = requests.get(f"{self.base_url}/api/verification-requests", params={"term_id": "spring-2026"}).json()
+            flagged = {r.get("log_id"): r.get("possible_duplicate_of") for r in queue if r.get("possible_duplicate_of")}
+            success = (
+                report.get("possible_duplicates") == 1
+                and bool(duplicates)
+                and flagged.get(duplicates[0].get("log_id")) == duplicates[0].get("possible_duplicate_of")
+            )
+            if success:
+                self.tests_passed += 1
+                print(f"✅ Passed - {duplicates[0]['log_id']} flagged as a duplicate of {duplicates[0]['possible_duplicate_of']}")
+            else:
+                print(f"❌ Failed - Expected one flagged duplicate, got {response.status_code} {report}")
+                self.failed_tests.append({
+                    'name': 'Duplicate Detection',
+                    'expected': 1,
+                    'actual': report.get("possible_duplicates"),
+                })
+            return success
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            self.failed_tests.append({
+                'name': 'Duplicate Detection',
+                'error': str(e)
+            })
+            return False
+
+    def test_metrics(self):
+        """Test Prometheus metrics after the exports"""
+        url = f"{self.base_url}/api/metrics"
+        
+        self.tests_run += 1
+        print(f"\n🔍 Testing Metrics...")
+        print(f"   URL: GET {url}")
+        
+        try:
+            response = requests.get(url)
+            success = response.status_code == 200 and 'myimpact_export_rows_total{export="audit-trail"}' in response.text
+            if success:
+                self.tests_passed += 1
+                print(f"✅ Passed - Status: {response.status_code}")
+                print(f"   {len(response.text.splitlines())} metric lines")
+            else:
+                print(f"❌ Failed - Expected 200 with export counters, got {response.status_code}")
+                self.failed_tests.append({
+                    'name': 'Metrics',
+                    'expected': 200,
+                    'actual': response.status_code,
+                    'response': response.text[:200]
+                })
+            return success
+        except Exception as e:
+            print(f"❌ Failed - Error: {str(e)}")
+            self.failed_tests.append({
+                'name': 'Metrics',
+                'error': str(e)
+            })
+            return False
+
     def test_get_audit_events(self):
         """Test getting audit events"""
+        self.run_test("Get Audit Events (limit over page size)", "GET", "api/audit-events", 422,
+                      params={"limit": 100000})
         return self.run_test("Get Audit Events", "GET", "api/audit-events", 200)
 
+    def test_get_audit_events_paginated(self):
+        """Test term-filtered audit events with a seq cursor"""
+        success, first_page = self.run_test(
+            "Get Audit Events (Spring 2026, page 1)",
+            "GET",
+            "api/audit-events",
+            200,
+            params={"term_id": "spring-2026", "limit": 2}
+        )
+        if success and first_page:
+            print(f"   Page 1 seqs: {[e.get('seq') for e in first_page]}")
+            return self.run_test(
+                "Get Audit Events (Spring 2026, page 2)",
+                "GET",
+                "api/audit-events",
+                200,
+                params={"term_id": "spring-2026", "limit": 2, "before_seq": first_page[-1].get('seq')}
+            )
+        return success, first_page
+
 def main():
     print("🚀 Starting MyImpact University Admin Dashboard Backend Tests")
     print("=" * 60)
@@ -276,7 +758,15 @@ def main():
     success, programs_fall = tester.test_get_programs_fall()
     success, kpis_spring = tester.test_get_kpis()
     success, kpis_fall = tester.test_get_kpis_fall()
+    tester.test_get_at_risk_students()
+    tester.test_get_timeseries()
+    tester.test_search()
+    tester.test_kpis_not_modified()
+    tester.test_not_modified_cors()
+    tester.test_cache_stats()
     success, vr_requests = tester.test_get_verification_requests()
+    tester.test_get_service_logs_paginated()
+    tester.test_invalid_cursors()
     
     # Test verification workflows if we have requests
     print("\n🔍 VERIFICATION WORKFLOWS")
@@ -304,22 +794,38 @@ def main():
                 third_request_id = third_request.get('request_id')
                 if third_request_id:
                     tester.test_flag_verification(third_request_id)
+        
+        # Bulk-apply to whatever is left in the queue
+        if len(vr_requests) > 3:
+            tester.test_bulk_verification([r.get('request_id') for r in vr_requests[3:]])
     else:
         print("⚠️  No verification requests found to test workflows")
     
+    tester.test_kpis_consistency()
+    tester.test_change_stream()
+    
     # Test settings
     print("\n⚙️  SETTINGS")
     tester.test_get_settings()
     tester.test_update_settings()
+    tester.test_tenant_routing()
     
     # Test exports
     print("\n📤 EXPORTS")
     tester.test_export_verified_logs()
     tester.test_export_audit_trail()
+    tester.test_metrics()
+
+    # Import
+    print("\n📥 IMPORT")
+    tester.test_import_service_logs()
+    tester.test_duplicate_detection()
+    tester.test_import_kpis_tenant()
     
     # Test audit events
     print("\n📋 AUDIT")
     tester.test_get_audit_events()
+    tester.test_get_audit_events_paginated()
     
     # Print results
     print("\n" + "=" * 60)
@@ -159,6 +159,21 @@ export async function getStudents(termId) {
   return clone(db.studentsByTerm[termId] || []);
 }
 
+export async function getAtRiskStudents(termId, limit = 10, programId) {
+  if (!STATIC_MODE) {
+    const query = programId ? `&program_id=${programId}` : '';
+    return fetchJson(`/api/students/at-risk?term_id=${termId}&limit=${limit}${query}`);
+  }
+  await delay();
+  updateStudentProgressForTerm(termId);
+  return clone(
+    (db.studentsByTerm[termId] || [])
+      .filter((student) => !programId || (student.program_ids || []).includes(programId))
+      .sort((a, b) => a.progress - b.progress || a.student_id.localeCompare(b.student_id))
+      .slice(0, limit)
+  );
+}
+
 export async function getStudent(studentId, termId) {
   if (!STATIC_MODE) return fetchJson(`/api/students/${studentId}?term_id=${termId}`);
   await delay();
@@ -166,6 +181,63 @@ export async function getStudent(studentId, termId) {
   return clone(buildStudentDetail(studentId, termId));
 }
 
+export async function searchRecords(query, termId, types) {
+  if (!STATIC_MODE) {
+    const params = new URLSearchParams({ q: query, term_id: termId });
+    if (types) params.set('types', types.join(','));
+    return fetchJson(`/api/search?${params}`);
+  }
+  await delay();
+  const needle = query.trim().toLowerCase();
+  const wanted = (type) => !types || types.includes(type);
+  return [
+    ...(wanted('student') ? db.studentsByTerm[termId] || [] : [])
+      .filter((student) => `${student.name} ${student.email}`.toLowerCase().includes(needle))
+      .map((student) => ({ type: 'student', id: student.student_id, title: student.name, subtitle: student.email })),
+    ...(wanted('log') ? db.serviceLogsByTerm[termId] || [] : [])
+      .filter((log) => (log.description || '').toLowerCase().includes(needle))
+      .map((log) => ({ type: 'log', id: log.log_id, title: log.description, subtitle: log.student_name })),
+  ].slice(0, 20);
+}
+
+export async function getTimeSeries(termId, { granularity = 'week', start, end, programId, groupBy } = {}) {
+  if (!STATIC_MODE) {
+    const params = new URLSearchParams({ term_id: termId, granularity });
+    if (start) params.set('start', start);
+    if (end) params.set('end', end);
+    if (programId) params.set('program_id', programId);
+    if (groupBy) params.set('group_by', groupBy);
+    return fetchJson(`/api/timeseries?${params}`);
+  }
+  await delay();
+  // Logs bucketed by day or Monday-based week; confirmations by log date
+  const periodOf = (value) => {
+    const day = new Date(`${String(value).slice(0, 10)}T00:00:00Z`);
+    if (granularity === 'week') day.setUTCDate(day.getUTCDate() - ((day.getUTCDay() + 6) % 7));
+    return day.toISOString().slice(0, 10);
+  };
+  const points = {};
+  (db.serviceLogsByTerm[termId] || [])
+    .filter((log) => !programId || log.program_id === programId)
+    .forEach((log) => {
+      const period = periodOf(log.date);
+      const point = points[period] || (points[period] = {
+        period, logged_hours: 0, verified_hours: 0, pending_hours: 0, logs: 0, confirmations: 0,
+      });
+      const hours = Number(log.hours || 0);
+      point.logged_hours += hours;
+      point.logs += 1;
+      if (log.status === 'confirmed') {
+        point.verified_hours += hours;
+        point.confirmations += 1;
+      } else if (log.status === 'pending') {
+        point.pending_hours += hours;
+      }
+    });
+  const sorted = Object.values(points).sort((a, b) => a.period.localeCompare(b.period));
+  return { term_id: termId, granularity, group_by: null, series: [{ key: null, points: sorted }] };
+}
+
 export async function confirmVerification(requestId) {
   if (!STATIC_MODE) {
     return fetchJson('/api/verification-requests/confirm', {
@@ -260,6 +332,20 @@ export function getExportUrl(type, termId) {
     : `${API_URL}/api/export/audit-trail?term_id=${termId}`;
 }
 
+// Live request_status / log_status / kpis deltas for a term (see /api/changes).
+// EventSource reconnects on its own and resumes via Last-Event-ID; `reset`
+// means events were missed and the caller should refetch. Returns an
+// unsubscribe function.
+export function subscribeChanges(termId, handlers) {
+  if (STATIC_MODE || typeof EventSource === 'undefined') return () => {};
+
+  const source = new EventSource(`${API_URL}/api/changes?term_id=${encodeURIComponent(termId)}`);
+  Object.entries(handlers).forEach(([kind, handler]) => {
+    source.addEventListener(kind, (event) => handler(event.data ? JSON.parse(event.data) : {}));
+  });
+  return () => source.close();
+}
+
 export function isStaticMode() {
   return STATIC_MODE;
 }